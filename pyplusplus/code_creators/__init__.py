@@ -23,6 +23,7 @@ from .algorithm import (make_flatten, make_flatten_list, make_flatten_generator)
 from .algorithm import creator_finder
 from .algorithm import create_identifier
 from .algorithm import creators_affect_on_me
+from .algorithm import namespace_aliases_affect_on_me
 
 from .custom import custom_t
 from .custom import custom_text_t
@@ -87,6 +88,8 @@ from .calldef_transformed import mem_fun_transformed_t
 from .calldef_transformed import mem_fun_transformed_wrapper_t
 from .calldef_transformed import free_fun_transformed_t
 from .calldef_transformed import free_fun_transformed_wrapper_t
+from .calldef_transformed import batch_fun_t
+from .calldef_transformed import batch_fun_wrapper_t
 from .calldef_transformed import mem_fun_v_transformed_t
 from .calldef_transformed import mem_fun_v_transformed_wrapper_t
 #TODO: FT for constructor
@@ -137,6 +140,7 @@ from .smart_pointers import smart_pointer_registrator_t
 from .target_configuration import target_configuration_t
 
 from .array_1_registrator import array_1_registrator_t
+from .buffer_converter_registrator import buffer_converter_registrator_t
 
 from .indexing_suites import indexing_suite1_t
 from .indexing_suites import indexing_suite2_t
@@ -159,3 +163,6 @@ from .name_mappings import name_mappings_t
 
 from .typedef_as_pyvar import typedef_as_pyvar_t
 from .embedded_code_repository import embedded_code_repository_t
+
+from .code_cache import code_cache_t
+from .render_statistics import render_statistics_t
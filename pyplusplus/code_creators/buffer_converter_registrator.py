@@ -0,0 +1,34 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+
+from . import algorithm
+from . import registration_based
+from pyplusplus import code_repository
+
+class buffer_converter_registrator_t( registration_based.registration_based_t ):
+    """
+    This class creates code that registers rvalue converter from objects, which
+    export the buffer protocol, to `std::vector` or fixed size array of
+    fundamental type
+    """
+    def __init__( self, container_type ):
+        registration_based.registration_based_t.__init__( self )
+        self._container_type = container_type
+        self.works_on_instance = False
+
+    def _get_container_type( self ):
+        return self._container_type
+    def _set_container_type( self, new_container_type ):
+        self._container_type = new_container_type
+    container_type = property( _get_container_type, _set_container_type )
+
+    def _create_impl(self):
+        fn_name = '::'.join( [ code_repository.buffer_converters.namespace, 'register_from_buffer' ] )
+        container = algorithm.create_identifier( self, self.container_type.decl_string )
+        return '%s< %s >();' % ( fn_name, container )
+
+    def _get_system_files_impl( self ):
+        return [code_repository.buffer_converters.file_name]
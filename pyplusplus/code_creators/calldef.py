@@ -11,6 +11,7 @@ from . import declaration_based
 from . import registration_based
 from pygccxml import declarations
 from pyplusplus import decl_wrappers
+from pyplusplus import code_repository
 
 #TODO:
 #Add to docs:
@@ -164,6 +165,48 @@ class calldef_wrapper_t( code_creator.code_creator_t
     def unoverriden_function_body( self ):
         return 'throw std::logic_error("%s");' % self.declaration.non_overridable_reason
 
+    def uses_override_cache( self ):
+        """returns True, if the wrapper remembers whether the virtual function is overridden"""
+        return False
+
+    def create_cached_virtual_body( self ):
+        """creates the body of the virtual function, which has the default
+        implementation. The override lookup is skipped, if the function is not
+        overridden in the Python class of the object"""
+        template = []
+        precall_code = self.declaration.override_precall_code
+        if precall_code:
+            template.append( os.linesep.join( precall_code ) )
+        template.append( 'static %(override_cache)s override_cache;' )
+        template.append( 'if( %(is_overridden)s< %(wrapped_class)s >( *this, "%(alias)s", override_cache ) ){' )
+        template.append( self.indent( 'if( %(override)s func_%(alias)s = this->get_override( "%(alias)s" ) ){' ) )
+        if declarations.is_void( self.declaration.return_type ):
+            template.append( self.indent( 'func_%(alias)s( %(args)s );', 2 ) )
+            template.append( self.indent( 'return;', 2 ) )
+        else:
+            template.append( self.indent( 'return func_%(alias)s( %(args)s );', 2 ) )
+        template.append( self.indent( '}' ) )
+        template.append( '}' )
+        native_precall_code = self.declaration.override_native_precall_code
+        if native_precall_code:
+            template.append( os.linesep.join( native_precall_code ) )
+        if declarations.is_void( self.declaration.return_type ):
+            template.append( 'this->%(wrapped_class)s::%(name)s( %(args)s );' )
+        else:
+            template.append( 'return this->%(wrapped_class)s::%(name)s( %(args)s );' )
+        template = os.linesep.join( template )
+
+        overrides_ns = code_repository.override_cache.namespace
+        return template % {
+            'override' : self.override_identifier()
+            , 'override_cache' : algorithm.create_identifier( self, '::%s::override_cache_t' % overrides_ns )
+            , 'is_overridden' : algorithm.create_identifier( self, '::%s::is_overridden' % overrides_ns )
+            , 'name' : self.declaration.partial_name
+            , 'alias' : self.declaration.alias
+            , 'args' : self.function_call_args()
+            , 'wrapped_class' : self.wrapped_class_identifier()
+        }
+
     def throw_specifier_code( self ):
         if self.declaration.does_throw:
             if not self.declaration.exceptions:
@@ -176,11 +219,13 @@ class calldef_wrapper_t( code_creator.code_creator_t
 
     def _get_system_files_impl( self ):
         files = []
-        if self.declaration.transformations:
-            ft = self.declaration.transformations[0]
+        if self.declaration.exported_transformations:
+            ft = self.declaration.exported_transformations[0]
             files.extend( ft.required_headers() )
         if self.declaration.call_policies:
             files.append( self.declaration.call_policies.header_file )
+        if self.uses_override_cache():
+            files.append( code_repository.override_cache.file_name )
         return files
 
 class free_function_t( calldef_t ):
@@ -444,6 +489,9 @@ class mem_fun_v_wrapper_t( calldef_wrapper_t ):
     def __init__( self, function ):
         calldef_wrapper_t.__init__( self, function=function )
 
+    def uses_override_cache( self ):
+        return self.declaration.cache_override
+
     def default_full_name(self):
         return self.parent.full_name + '::default_' + self.declaration.alias
 
@@ -475,6 +523,8 @@ class mem_fun_v_wrapper_t( calldef_wrapper_t ):
         }
 
     def create_virtual_body(self):
+        if self.declaration.cache_override:
+            return self.create_cached_virtual_body()
         template = []
         precall_code = self.declaration.override_precall_code
         if precall_code:
@@ -690,6 +740,9 @@ class mem_fun_protected_v_wrapper_t( calldef_wrapper_t ):
     def __init__( self, function):
         calldef_wrapper_t.__init__( self, function=function )
 
+    def uses_override_cache( self ):
+        return self.declaration.cache_override
+
     def full_name(self):
         return self.parent.full_name + '::' + self.declaration.name
 
@@ -719,6 +772,8 @@ class mem_fun_protected_v_wrapper_t( calldef_wrapper_t ):
         }
 
     def create_virtual_body(self):
+        if self.declaration.cache_override:
+            return self.create_cached_virtual_body()
         template = []
 
         precall_code = self.declaration.override_precall_code
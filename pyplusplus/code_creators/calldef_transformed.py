@@ -20,6 +20,26 @@ def remove_duplicate_linesep( code ):
     lines = code.split( os.linesep )
     lines = [line for line in lines if line.strip()]
     return os.linesep.join( lines )
+
+GIL_RELEASE_VAR = 'pypp_gil_release'
+GIL_GUARD_VAR = 'pypp_gil_guard'
+
+def add_release_gil_code( creator, pre_call, post_call ):
+    """releases the GIL after the arguments conversion and acquires it before the result conversion"""
+    if not creator.declaration.release_gil:
+        return pre_call, post_call
+    gil_release = algorithm.create_identifier( creator, 'pyplusplus::threading::gil_release_t' )
+    pre_call = pre_call + [ '%s %s;' % ( gil_release, GIL_RELEASE_VAR ) ]
+    post_call = [ '%s.restore();' % GIL_RELEASE_VAR ] + post_call
+    return pre_call, post_call
+
+def create_acquire_gil_code( creator ):
+    """acquires the GIL in the virtual function override, if the function could be
+    called from a thread, which doesn't hold it"""
+    if not ( creator.declaration.release_gil or creator.ft.thread_safe ):
+        return '', ''
+    gil_guard = algorithm.create_identifier( creator, 'pyplusplus::threading::gil_guard_t' )
+    return '%s %s( true );' % ( gil_guard, GIL_GUARD_VAR ), '%s.release();' % GIL_GUARD_VAR
     
 class sealed_fun_transformed_t( calldef_t ):
     def __init__( self, function, wrapper=None ):
@@ -27,7 +47,7 @@ class sealed_fun_transformed_t( calldef_t ):
 
     @property
     def ft( self ): #function transformation
-        return self.declaration.transformations[0]
+        return self.declaration.exported_transformations[0]
 
     @property 
     def controller( self ):
@@ -61,7 +81,7 @@ class sealed_fun_transformed_wrapper_t( calldef_wrapper_t ):
 
     @property
     def ft( self ): #function transformation
-        return self.declaration.transformations[0]
+        return self.declaration.exported_transformations[0]
 
     @property 
     def controller( self ):
@@ -84,8 +104,9 @@ class sealed_fun_transformed_wrapper_t( calldef_wrapper_t ):
         
         tmpl_values['declare_variables'] \
             = os.linesep + os.linesep.join( [self.indent( var.declare_var_string() ) for var in cntrl.variables] )
-                
-        tmpl_values['pre_call'] = os.linesep + self.indent( os.linesep.join( cntrl.pre_call ) )
+
+        pre_call, post_call = add_release_gil_code( self, cntrl.pre_call, cntrl.post_call )
+        tmpl_values['pre_call'] = os.linesep + self.indent( os.linesep.join( pre_call ) )
 
         tmpl_values['save_result'] = ''
         if not declarations.is_void( self.declaration.return_type ):
@@ -104,7 +125,7 @@ class sealed_fun_transformed_wrapper_t( calldef_wrapper_t ):
                                     , self.controller.result_variable
                                     , self.controller.return_variables )
 
-        tmpl_values['post_call'] = os.linesep + self.indent( os.linesep.join( cntrl.post_call ) )
+        tmpl_values['post_call'] = os.linesep + self.indent( os.linesep.join( post_call ) )
         if return_stmt_creator.pre_return_code:
             tmpl_values['post_call'] \
                 = os.linesep.join([ tmpl_values['post_call']
@@ -175,6 +196,87 @@ class free_fun_transformed_wrapper_t( sealed_fun_transformed_wrapper_t ):
         return declarations.full_name( self.declaration )
 
 
+class batch_fun_t( sealed_fun_transformed_t ):
+    """Creates code, which registers the batch entry point of free or static member function.
+    """
+
+    def __init__( self, function, wrapper=None ):
+        sealed_fun_transformed_t.__init__( self, function=function, wrapper=wrapper )
+        self.works_on_instance = False
+
+    @property
+    def ft( self ): #function transformation
+        return self.declaration.batch_transformation
+
+    def create_def_code( self ):
+        if isinstance( self.declaration.parent, declarations.class_t ):
+            return sealed_fun_transformed_t.create_def_code( self )
+        else:
+            return self.def_identifier()
+
+    def create_keywords_args(self):
+        arg_utils = calldef_utils.argument_utils_t( self.declaration
+                                                   , algorithm.make_id_creator( self )
+                                                   , self.controller.wrapper_args )
+        return arg_utils.keywords_args()
+
+    def _get_system_files_impl( self ):
+        return self.ft.required_headers()
+
+
+class batch_fun_wrapper_t( free_fun_transformed_wrapper_t ):
+    """Creates C++ code of the function wrapper, which calls the function for
+    every item of the arguments buffers.
+    """
+    def __init__( self, function ):
+        free_fun_transformed_wrapper_t.__init__( self, function=function )
+
+    @property
+    def ft( self ): #function transformation
+        return self.declaration.batch_transformation
+
+    def wrapper_name( self ):
+        return self.ft.unique_name + '_batch'
+
+    def full_name(self):
+        return self.wrapper_name()
+
+    def create_fun_definition(self):
+        cntrl = self.controller
+
+        tmpl_values = dict()
+
+        tmpl_values['unique_function_name'] = self.wrapper_name()
+        tmpl_values['return_type'] = cntrl.wrapper_return_type.decl_string
+        tmpl_values['arg_declarations'] = self.args_declaration()
+
+        tmpl_values['declare_variables'] \
+            = os.linesep + os.linesep.join( [self.indent( var.declare_var_string() ) for var in cntrl.variables] )
+
+        pre_call, post_call = add_release_gil_code( self, cntrl.pre_call, cntrl.post_call )
+        tmpl_values['pre_call'] = os.linesep + self.indent( os.linesep.join( pre_call ) )
+
+        tmpl_values['index'] = cntrl.index_variable
+        tmpl_values['size'] = cntrl.size_variable
+        tmpl_values['save_result'] = ''
+        if cntrl.output_variable:
+            tmpl_values['save_result'] = '%s[ %s ] = ' % ( cntrl.output_variable, cntrl.index_variable )
+
+        tmpl_values['function_name'] = self.resolve_function_ref()
+        tmpl_values['arg_expressions'] = self.PARAM_SEPARATOR.join( cntrl.arg_expressions )
+
+        tmpl_values['post_call'] = os.linesep + self.indent( os.linesep.join( post_call ) )
+        tmpl_values['return'] = ''
+        if cntrl.output_variable:
+            tmpl_values['return'] = os.linesep + self.indent( 'return %s;' % cntrl.result_variable.name )
+
+        f_def = cntrl.template.substitute(tmpl_values)
+        return remove_duplicate_linesep( f_def )
+
+    def _get_system_files_impl( self ):
+        return self.ft.required_headers()
+
+
 class mem_fun_transformed_t( sealed_fun_transformed_t ):
     """Creates code for public non-virtual member functions.
     """
@@ -249,7 +351,7 @@ class mem_fun_v_transformed_t( calldef_t ):
 
     @property
     def ft( self ): #function transformation
-        return self.declaration.transformations[0]
+        return self.declaration.exported_transformations[0]
 
     @property 
     def controller( self ):
@@ -292,7 +394,7 @@ class mem_fun_v_transformed_wrapper_t( calldef_wrapper_t ):
 
     @property
     def ft( self ): #function transformation
-        return self.declaration.transformations[0]
+        return self.declaration.exported_transformations[0]
 
     @property 
     def controller( self ):
@@ -347,8 +449,9 @@ class mem_fun_v_transformed_wrapper_t( calldef_wrapper_t ):
             decl_vars.append( cntrl.result_variable )
         tmpl_values['declare_variables'] \
             = os.linesep + os.linesep.join( [self.indent( var.declare_var_string() ) for var in decl_vars] )
-                
-        tmpl_values['pre_call'] = os.linesep + self.indent( os.linesep.join( cntrl.pre_call ) )
+
+        pre_call, post_call = add_release_gil_code( self, cntrl.pre_call, cntrl.post_call )
+        tmpl_values['pre_call'] = os.linesep + self.indent( os.linesep.join( pre_call ) )
 
         tmpl_values['save_result'] = ''
         if not declarations.is_void( self.declaration.return_type ):
@@ -364,7 +467,7 @@ class mem_fun_v_transformed_wrapper_t( calldef_wrapper_t ):
                                     , cntrl.result_variable
                                     , cntrl.return_variables )
 
-        tmpl_values['post_call'] = os.linesep + self.indent( os.linesep.join( cntrl.post_call ) )
+        tmpl_values['post_call'] = os.linesep + self.indent( os.linesep.join( post_call ) )
         if return_stmt_creator.pre_return_code:
             tmpl_values['post_call'] \
                 = os.linesep.join([ tmpl_values['post_call']
@@ -389,6 +492,9 @@ class mem_fun_v_transformed_wrapper_t( calldef_wrapper_t ):
             tmpl_values['constness'] = ' const '
         tmpl_values['throw'] = self.throw_specifier_code()        
         tmpl_values['py_function_var'] = cntrl.py_function_var
+        acquire_gil, release_gil = create_acquire_gil_code( self )
+        tmpl_values['acquire_gil'] = acquire_gil
+        tmpl_values['release_gil'] = release_gil
         tmpl_values['function_alias'] = self.declaration.alias
         tmpl_values['declare_py_variables'] \
             = os.linesep + os.linesep.join( [self.indent( var.declare_var_string(), 2 ) for var in cntrl.py_variables] )
@@ -435,7 +541,7 @@ class constructor_transformed_t( calldef_t ):
 
     @property
     def ft( self ): #function transformation
-        return self.declaration.transformations[0]
+        return self.declaration.exported_transformations[0]
 
     @property 
     def controller( self ):
@@ -0,0 +1,268 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which keeps the code, generated by declaration based code
+creators, between `Py++` runs"""
+
+import os
+import types
+import pickle
+import hashlib
+import pyplusplus
+from . import enum
+from . import calldef
+from . import algorithm
+from . import code_creator
+from . import member_variable
+from . import global_variable
+from pygccxml import declarations
+from pyplusplus import decl_wrappers
+from pyplusplus import function_transformers
+
+class code_cache_t( object ):
+    """
+    persistent cache of the code, generated by "leaf" declaration based code creators
+
+    This is a render cache: the code creators tree is still built for all
+    declarations and every code creator computes its fingerprint, but the
+    fingerprint is cheaper than the rendering of the code.
+    `unittests/codegen_throughput_benchmark.py --code-cache` compares the both.
+
+    Every entry is keyed by the code creator fingerprint, which consists from
+    the code creator class, the declaration signature, the declaration
+    configuration( alias, call policies, function transformations, exclusion... )
+    and the configuration of all its parents. If the fingerprint was not changed
+    since the previous run, :meth:`code_creator_t.create` returns the cached code,
+    without rendering it.
+
+    Compound code creators( classes, namespaces, module ) are always rendered,
+    because their code consists from the code of their children.
+
+    Only entries, which were used during the current run, are saved. The cache
+    is invalidated, when `Py++` version is changed.
+    """
+
+    FORMAT_VERSION = 1
+
+    #code creators, which code depends on the declaration and its configuration only
+    CACHEABLE_CREATORS = ( calldef.calldef_t
+                           , calldef.calldef_wrapper_t
+                           , member_variable.member_variable_base_t
+                           , member_variable.member_variable_wrapper_t
+                           , member_variable.bit_field_wrapper_t
+                           , member_variable.array_mv_wrapper_t
+                           , member_variable.mem_var_ref_wrapper_t
+                           , global_variable.global_variable_base_t
+                           , global_variable.array_gv_wrapper_t
+                           , enum.enum_t )
+
+    #declaration properties, which values are calculated lazily or are not kept
+    #in instance variables
+    DECL_PROPERTIES = ( 'alias', 'ignore', 'already_exposed', 'call_policies'
+                        , 'use_keywords', 'use_default_arguments', 'create_with_signature'
+                        , 'overridable', 'wrapper_alias', 'export_values', 'value_aliases'
+                        , 'held_type', 'noncopyable', 'expose_this', 'expose_sizeof', 'no_init'
+                        , 'getter_call_policies', 'setter_call_policies', 'use_make_functions'
+                        , 'expose_address', 'expose_value', 'is_read_only' )
+
+    #declaration instance variables, which are calculated lazily, from the
+    #declaration tree, so they don't add any information. The class properties
+    #are used only by compound and indexing suites code creators, which are not
+    #cached, and their calculation is expensive.
+    LAZY_DECL_VARS = ( '_declarations', '_derived_values', '_exportable', '_exportable_reason'
+                       , '_always_expose_using_scope', '_equality_comparable', '_less_than_comparable'
+                       , '_release_gil_transformation', '_non_overridable_reason'
+                       , '_cache', '_partial_name', '_optimized'
+                       , '_all_decls', '_all_decls_not_recursive'
+                       , '_type2decls', '_type2decls_nr', '_type2name2decls', '_type2name2decls_nr' )
+
+    #the values of the properties are used instead of the instance variables,
+    #which are set lazily
+    SKIPPED_DECL_VARS = frozenset( LAZY_DECL_VARS ) \
+                        | frozenset( '_' + name for name in DECL_PROPERTIES )
+
+    SIMPLE_TYPES = ( str, int, float, bool, type( None ) )
+
+    #code creator instance variables, which are part of the key anyway
+    SKIPPED_CREATOR_VARS = frozenset( [ '_parent', '_decl', '_target_configuration' ] )
+
+    def __init__( self, file_name ):
+        """
+        :param file_name: the cache file name. If the file exists, the cache is loaded from it.
+        :type file_name: str
+        """
+        object.__init__( self )
+        self.__file_name = file_name
+        self.__entries = {}
+        self.__used_entries = {}
+        self.__decl_fingerprints = {}
+        self.__configuration_texts = {}
+        self.__class_properties = {}
+        self.__text_handlers = {}
+        self.hits = 0
+        self.misses = 0
+        self.__load()
+
+    def __format_version( self ):
+        #pyplusplus package is not initialized yet, when this module is imported
+        return '%s/%d' % ( pyplusplus.__version__, self.FORMAT_VERSION )
+
+    @property
+    def file_name( self ):
+        """the cache file name"""
+        return self.__file_name
+
+    @property
+    def used_entries( self ):
+        """dictionary( key: code ) of the entries, used during the current run"""
+        return self.__used_entries
+
+    def __load( self ):
+        if not os.path.exists( self.__file_name ):
+            return
+        try:
+            f = open( self.__file_name, 'rb' )
+            try:
+                version, entries = pickle.load( f )
+            finally:
+                f.close()
+        except Exception:
+            return #the cache is damaged or was written by another version - start from scratch
+        if version == self.__format_version():
+            self.__entries = entries
+
+    def save( self ):
+        """writes entries, used during the current run, to the cache file"""
+        f = open( self.__file_name, 'wb' )
+        try:
+            pickle.dump( ( self.__format_version(), self.__used_entries ), f, pickle.HIGHEST_PROTOCOL )
+        finally:
+            f.close()
+        #the declarations could be reconfigured before the next write
+        self.__decl_fingerprints = {}
+        self.__configuration_texts = {}
+
+    def is_cacheable( self, creator ):
+        """returns True, if the code, generated by the code creator, could be cached"""
+        return isinstance( creator, self.CACHEABLE_CREATORS )
+
+    def get_code( self, key ):
+        """returns cached code or None"""
+        code = self.__entries.get( key )
+        if code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.__used_entries[ key ] = code
+        return code
+
+    def update( self, key, code ):
+        """adds new entry to the cache"""
+        self.__entries[ key ] = code
+        self.__used_entries[ key ] = code
+
+    def merge( self, entries ):
+        """merges entries, used by another process, into the cache"""
+        self.__entries.update( entries )
+        self.__used_entries.update( entries )
+
+    def __value_text( self, value, visited=frozenset() ):
+        cls = value.__class__
+        if cls not in self.__text_handlers:
+            self.__text_handlers[ cls ] = self.__find_text_handler( value )
+        return self.__text_handlers[ cls ]( value, visited )
+
+    def __find_text_handler( self, value ):
+        """returns function, which converts the value of the given class to text"""
+        if isinstance( value, self.SIMPLE_TYPES ):
+            return lambda value, visited: repr( value )
+        elif isinstance( value, ( list, tuple ) ):
+            return lambda value, visited: '[%s]' % ','.join( self.__value_text( item, visited ) for item in value )
+        elif isinstance( value, ( set, frozenset ) ):
+            return lambda value, visited: '{%s}' % ','.join( sorted( self.__value_text( item, visited ) for item in value ) )
+        elif isinstance( value, dict ):
+            return lambda value, visited: '{%s}' % ','.join( sorted( '%s:%s' % ( self.__value_text( key, visited )
+                                                                                 , self.__value_text( item, visited ) )
+                                                                     for key, item in value.items() ) )
+        elif isinstance( value, decl_wrappers.call_policy_t ):
+            return lambda value, visited: str( value )
+        elif isinstance( value, function_transformers.function_transformation_t ):
+            return lambda value, visited: '%s(%s,%s)' % ( value.alias
+                                                          , value.thread_safe
+                                                          , ','.join( str( t ) for t in value.transformers ) )
+        elif isinstance( value, decl_wrappers.user_text_t ):
+            return lambda value, visited: value.text
+        elif isinstance( value, declarations.declaration_t ):
+            return lambda value, visited: declarations.full_name( value )
+        elif isinstance( value, declarations.type_t ):
+            return lambda value, visited: value.decl_string
+        elif isinstance( value, code_creator.code_creator_t ):
+            return lambda value, visited: value.__class__.__name__
+        elif isinstance( value, type ) or isinstance( value, ( types.FunctionType, types.MethodType ) ):
+            return lambda value, visited: '%s.%s' % ( value.__module__, value.__qualname__ )
+        elif hasattr( value, '__dict__' ):
+            #unknown object: location, indexing suite, property definition...
+            return self.__object_text
+        else:
+            #the text could contain the object address, so the cache entry
+            #will not be reused, but the code will not be stale
+            return lambda value, visited: repr( value )
+
+    def __object_text( self, value, visited ):
+        if id( value ) in visited:
+            return value.__class__.__name__
+        return '%s(%s)' % ( value.__class__.__name__
+                            , self.__vars_text( value, visited=visited | set( [ id( value ) ] ) ) )
+
+    def __vars_text( self, obj, skip=(), visited=frozenset() ):
+        lines = []
+        simple_types = self.SIMPLE_TYPES
+        for name, value in sorted( vars( obj ).items() ):
+            if name in skip:
+                continue
+            if value.__class__ in simple_types:
+                lines.append( '%s=%r' % ( name, value ) )
+            else:
+                lines.append( '%s=%s' % ( name, self.__value_text( value, visited ) ) )
+        return os.linesep.join( lines )
+
+    def __properties( self, decl ):
+        """returns names of :attr:`DECL_PROPERTIES`, defined by the declaration class"""
+        cls = decl.__class__
+        if cls not in self.__class_properties:
+            self.__class_properties[ cls ] \
+                = [ name for name in self.DECL_PROPERTIES if hasattr( cls, name ) ]
+        return self.__class_properties[ cls ]
+
+    def __decl_fingerprint( self, decl ):
+        """returns hash of the declaration, its configuration and its parents"""
+        if id( decl ) in self.__decl_fingerprints:
+            return self.__decl_fingerprints[ id( decl ) ]
+        lines = [ decl.__class__.__name__, declarations.full_name( decl ) ]
+        if isinstance( decl, declarations.calldef_t ):
+            for arg in decl.arguments:
+                lines.append( '%s %s=%s' % ( arg.type.decl_string, arg.name, arg.default_value ) )
+        lines.append( self.__vars_text( decl, skip=self.SKIPPED_DECL_VARS ) )
+        for name in self.__properties( decl ):
+            lines.append( '%s=%s' % ( name, self.__value_text( getattr( decl, name ) ) ) )
+        if decl.parent:
+            lines.append( self.__decl_fingerprint( decl.parent ) )
+        fingerprint = hashlib.md5( os.linesep.join( lines ).encode( 'utf-8' ) ).hexdigest()
+        self.__decl_fingerprints[ id( decl ) ] = fingerprint
+        return fingerprint
+
+    def create_key( self, creator ):
+        """returns fingerprint of the code creator"""
+        lines = [ creator.__class__.__module__ + '.' + creator.__class__.__name__ ]
+        lines.append( self.__vars_text( creator, skip=self.SKIPPED_CREATOR_VARS ) )
+        configuration = creator.target_configuration
+        if configuration:
+            if id( configuration ) not in self.__configuration_texts:
+                self.__configuration_texts[ id( configuration ) ] = self.__vars_text( configuration )
+            lines.append( self.__configuration_texts[ id( configuration ) ] )
+        for alias in algorithm.namespace_aliases_affect_on_me( creator ):
+            lines.append( '%s=%s' % ( alias.alias, alias.full_namespace_name ) )
+        lines.append( self.__decl_fingerprint( creator.declaration ) )
+        return hashlib.md5( os.linesep.join( lines ).encode( 'utf-8' ) ).hexdigest()
@@ -26,6 +26,9 @@ class code_creator_t(object):
     LINE_LENGTH = 80
     PARAM_SEPARATOR = ', '
     CODE_GENERATOR_TYPES = decl_wrappers.CODE_GENERATOR_TYPES
+    #( code cache, render statistics ) of the tree, which code is created now.
+    #It is resolved by the outermost :meth:`code_creator_t.create` call only.
+    _render_context = None
 
     def __init__(self):
         """Constructor.
@@ -98,16 +101,93 @@ class code_creator_t(object):
         """
         raise NotImplementedError()
 
+    @property
+    def code_cache( self ):
+        """reference to :class:`code_creators.code_cache_t` instance, used by the top parent, or None"""
+        return getattr( self.top_parent, '_code_cache', None )
+
     def create(self):
         """
         generates source code
 
+        If the top parent has code cache and the code of this creator was not
+        changed since the previous run, the cached code is returned.
+
+        If the top parent has render statistics, the rendering cost of the
+        code creator is recorded in it.
+
         :rtype: str
         """
+        context = code_creator_t._render_context
+        if None is not context:
+            return self.__create_in_context( *context )
+        top_parent = self.top_parent
+        context = ( getattr( top_parent, '_code_cache', None )
+                    , getattr( top_parent, '_render_statistics', None ) )
+        code_creator_t._render_context = context
+        try:
+            return self.__create_in_context( *context )
+        finally:
+            code_creator_t._render_context = None
+
+    def __create_in_context(self, code_cache, statistics):
+        if None is statistics:
+            return self.__create( code_cache )
+        code = None
+        start_time = statistics.start()
+        try:
+            code = self.__create( code_cache )
+        finally:
+            statistics.stop( self, start_time, code )
+        return code
+
+    def __create(self, code_cache):
+        if code_cache and code_cache.is_cacheable( self ):
+            key = code_cache.create_key( self )
+            code = code_cache.get_code( key )
+            if code is None:
+                code = self.beautify( self._create_impl() )
+                code_cache.update( key, code )
+            return code
         code = self._create_impl()
         assert isinstance( code, str )
         return self.beautify( code )
 
+    def _create_chunks_impl(self):
+        """
+        function that code creators, which generate huge amount of code, may
+        implement. It returns generator of the code chunks, which concatenated
+        together give the return value of :meth:`code_creator_t._create_impl`.
+
+        The default implementation returns None: the code is generated by
+        :meth:`code_creator_t.create`.
+        """
+        return None
+
+    def create_chunks(self):
+        """
+        generates source code, chunk by chunk
+
+        ``''.join( creator.create_chunks() ) == creator.create()``, but the
+        code creators, which implement :meth:`code_creator_t._create_chunks_impl`,
+        never hold the whole code in memory.
+
+        If the top parent has render statistics, the rendering cost of the
+        streaming code creator is recorded in it too.
+
+        :rtype: generator of str
+        """
+        chunks = self._create_chunks_impl()
+        if None is chunks:
+            yield self.create()
+            return
+        chunks = self.beautify_chunks( chunks )
+        statistics = getattr( self.top_parent, '_render_statistics', None )
+        if statistics:
+            chunks = statistics.record_chunks( self, chunks )
+        for chunk in chunks:
+            yield chunk
+
     @staticmethod
     def unique_headers( headers ):
         used = set()
@@ -156,6 +236,31 @@ class code_creator_t(object):
         assert isinstance( code, str )
         return code.strip()
 
+    @staticmethod
+    def beautify_chunks( chunks ):
+        """
+        the streaming version of :meth:`code_creator_t.beautify`: it removes
+        leading and trailing white spaces from the code, represented by the chunks
+
+        :param chunks: iterable of code chunks
+        :rtype: generator of str
+        """
+        started = False
+        pending = '' #trailing white spaces of the previous chunks
+        for chunk in chunks:
+            assert isinstance( chunk, str )
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            code = chunk.rstrip()
+            if code:
+                yield pending + code
+                pending = chunk[ len( code ): ]
+            else:
+                pending += chunk
+
     @staticmethod
     def indent( code, size=1 ):
         """
@@ -6,6 +6,63 @@
 import os
 from . import code_creator
 
+class creators_list_t( list ):
+    """list of the children creators, which applies its modifications to the compound creator
+
+    The children are kept in a linked list, so :attr:`compound_t.creators` returns
+    a list view of them. The code, which modifies the list directly, still
+    works: the children of the compound creator are updated to match the list.
+    """
+    def __init__( self, compound, creators ):
+        list.__init__( self, creators )
+        self.__compound = compound
+
+    def __modify( self, method, *args ):
+        compound = self.__compound
+        if self is not compound._creators_view:
+            #the children were changed since the view was taken
+            list.__setitem__( self, slice( None ), compound.creators )
+        result = method( self, *args )
+        compound._replace_creators( self )
+        return result
+
+    def append( self, creator ):
+        self.__modify( list.append, creator )
+
+    def extend( self, creators ):
+        self.__modify( list.extend, creators )
+
+    def insert( self, index, creator ):
+        self.__modify( list.insert, index, creator )
+
+    def remove( self, creator ):
+        self.__modify( list.remove, creator )
+
+    def pop( self, *args ):
+        return self.__modify( list.pop, *args )
+
+    def clear( self ):
+        self.__modify( list.clear )
+
+    def sort( self, **keywd ):
+        self.__modify( lambda self: list.sort( self, **keywd ) )
+
+    def reverse( self ):
+        self.__modify( list.reverse )
+
+    def __setitem__( self, index, creator ):
+        self.__modify( list.__setitem__, index, creator )
+
+    def __delitem__( self, index ):
+        self.__modify( list.__delitem__, index )
+
+    def __iadd__( self, creators ):
+        self.extend( creators )
+        return self
+
+    def __reduce__( self ):
+        return ( list, ( list( self ), ) )
+
 class compound_t(code_creator.code_creator_t):
     def __init__(self ):
         """Constructor.
@@ -14,14 +71,130 @@ class compound_t(code_creator.code_creator_t):
         :type parent: :class:`code_creators.code_creator_t`
         """
         code_creator.code_creator_t.__init__( self )
-        self._creators = []
+        #The children are kept in circular doubly linked list: [ previous, next, creator ].
+        #The list allows to remove and to move the child, without shifting
+        #all other children.
+        self._init_children( [] )
+
+    def _init_children( self, creators ):
+        self._root = root = []
+        root[:] = [ root, root, None ]
+        self._nodes = {} #id( creator ) : node
+        self._creators_view = None
+        #namespace_alias_t children, in the order they appear in self.creators
+        self._namespace_aliases = ()
+        #id( child ) : namespace_alias_t children, defined before the child.
+        #The children share the tuples. None, if the index should be rebuilt.
+        self._aliases_before = {}
+        for creator in creators:
+            self.__link( creator, root )
+        if creators:
+            self._aliases_before = None
+
+    def __getstate__( self ):
+        #pickle the children as a list, so the linked list doesn't exhaust
+        #the recursion limit
+        state = self.__dict__.copy()
+        for name in ( '_root', '_nodes', '_creators_view', '_namespace_aliases', '_aliases_before' ):
+            del state[ name ]
+        state[ '_creators' ] = list( self.creators )
+        return state
+
+    def __setstate__( self, state ):
+        state = state.copy()
+        creators = state.pop( '_creators' )
+        self.__dict__.update( state )
+        self._init_children( creators )
+
+    def __link( self, creator, next_node ):
+        #inserts the creator before the node
+        previous_node = next_node[0]
+        node = [ previous_node, next_node, creator ]
+        previous_node[1] = node
+        next_node[0] = node
+        self._nodes[ id( creator ) ] = node
+
+    def __unlink( self, creator ):
+        previous_node, next_node, creator = self._nodes.pop( id( creator ) )
+        previous_node[1] = next_node
+        next_node[0] = previous_node
+
+    def __node_at( self, index ):
+        #returns the node, the creator with the index should be inserted before
+        size = len( self._nodes )
+        if index < 0:
+            index = max( 0, size + index )
+        if index >= size:
+            return self._root
+        if index <= size // 2:
+            node = self._root[1]
+            for i in range( index ):
+                node = node[1]
+        else:
+            node = self._root
+            for i in range( size - index ):
+                node = node[0]
+        return node
+
+    def __node_of( self, creator ):
+        if None is creator:
+            return self._root
+        return self._nodes[ id( creator ) ]
+
+    def __linked_creators( self ):
+        node = self._root[1]
+        while node is not self._root:
+            yield node[2]
+            node = node[1]
 
     def _get_creators(self):
-        return self._creators
+        if None is self._creators_view:
+            self._creators_view = creators_list_t( self, self.__linked_creators() )
+        return self._creators_view
     creators = property(_get_creators,
                         doc="""A list of children nodes.
+
+                        The modifications of the list are applied to the children,
+                        but :meth:`adopt_creator`, :meth:`remove_creator` and
+                        :meth:`move_creators` are faster.
                         @type: list of :class:`code_creators.code_creator_t`""")
 
+    def _replace_creators( self, view ):
+        """updates the children to match the modified list, returned by :attr:`creators`"""
+        creators = list( view )
+        self._creators_view = None #the view already contains the adopted creators
+        wanted = set( map( id, creators ) )
+        for creator in list( self.__linked_creators() ):
+            if id( creator ) not in wanted:
+                self.remove_creator( creator )
+        kept = [ creator for creator in creators if id( creator ) in self._nodes ]
+        if list( map( id, kept ) ) != list( map( id, self.__linked_creators() ) ):
+            self.move_creators( kept )
+        for index, creator in enumerate( creators ):
+            if id( creator ) not in self._nodes:
+                self.adopt_creator( creator, index )
+        self._creators_view = view
+
+    def __adopt( self, creator, next_node ):
+        from . import namespace #prevent cyclic import
+        creator.parent = self
+        self.__link( creator, next_node )
+        if next_node is self._root and None is not self._creators_view:
+            list.append( self._creators_view, creator )
+        else:
+            self._creators_view = None
+        if None is not self._aliases_before:
+            if next_node is self._root:
+                self._aliases_before[ id( creator ) ] = self._namespace_aliases
+                if isinstance( creator, namespace.namespace_alias_t ):
+                    self._namespace_aliases = self._namespace_aliases + ( creator, )
+            elif isinstance( creator, namespace.namespace_alias_t ):
+                #the aliases of all following children are changed
+                self._aliases_before = None
+            else:
+                self._aliases_before[ id( creator ) ] = self._aliases_before[ id( next_node[2] ) ]
+        self._on_creator_adopted( creator )
+
     def adopt_creator( self, creator, index=None):
         """Add a creator to the list of children creators.
 
@@ -30,11 +203,10 @@ class compound_t(code_creator.code_creator_t):
         :param index: Desired position of the creator or None to append it to the end of the list
         :type index: int
         """
-        creator.parent = self
         if index or index == 0:
-            self._creators.insert( index, creator )
+            self.__adopt( creator, self.__node_at( index ) )
         else:
-            self._creators.append( creator )
+            self.__adopt( creator, self._root )
 
     def adopt_creators( self, creators, index=None):
         """Add a creators to the list of children creators.
@@ -44,11 +216,21 @@ class compound_t(code_creator.code_creator_t):
         :param index: Desired position of the creator or None to append it to the end of the list
         :type index: int
         """
-        for pos, creator in enumerate( creators ):
-            if index or index == 0:
-                self.adopt_creator( creator, index + pos )
-            else:
-                self.adopt_creator( creator )
+        next_node = self._root
+        if index or index == 0:
+            next_node = self.__node_at( index )
+        for creator in creators:
+            self.__adopt( creator, next_node )
+
+    def adopt_creators_before( self, creators, child ):
+        """Add a creators to the list of children creators, before the child
+
+        :param creators: list of creators object
+        :param child: the children creator, the creators should be inserted before
+        """
+        next_node = self.__node_of( child )
+        for creator in creators:
+            self.__adopt( creator, next_node )
 
     def remove_creator( self, creator ):
         """Remove a children code creator object.
@@ -58,7 +240,76 @@ class compound_t(code_creator.code_creator_t):
         :type creator: :class:`code_creators.code_creator_t`
         """
         creator.parent = None
-        del self._creators[ self._creators.index( creator ) ]
+        self.__unlink( creator )
+        self._creators_view = None
+        if None is not self._aliases_before:
+            if creator in self._namespace_aliases:
+                self._aliases_before = None
+            else:
+                del self._aliases_before[ id( creator ) ]
+        self._on_creator_removed( creator )
+
+    def move_creators( self, creators, before=None ):
+        """moves the children creators, keeping their order
+
+        :param creators: list of the children creators
+        :param before: the children creator, the creators should be moved before.
+                       If it is None, the creators are moved to the end of the list.
+        """
+        if not creators:
+            return
+        for creator in creators:
+            self.__unlink( creator )
+        next_node = self.__node_of( before )
+        for creator in creators:
+            self.__link( creator, next_node )
+        self._creators_view = None
+        self._aliases_before = None
+        self._on_creators_reordered()
+
+    def _on_creator_adopted( self, creator ):
+        """notifies the tree root, that the creator was adopted somewhere in the tree"""
+        if self.parent:
+            self.parent._on_creator_adopted( creator )
+
+    def _on_creator_removed( self, creator ):
+        """notifies the tree root, that the creator was removed from the tree"""
+        if self.parent:
+            self.parent._on_creator_removed( creator )
+
+    def _on_creators_reordered( self ):
+        """notifies the tree root, that the children of some creator were reordered"""
+        if self.parent:
+            self.parent._on_creators_reordered()
+
+    def __index_aliases( self ):
+        from . import namespace #prevent cyclic import
+        aliases = ()
+        aliases_before = {}
+        for creator in self.__linked_creators():
+            aliases_before[ id( creator ) ] = aliases
+            if isinstance( creator, namespace.namespace_alias_t ):
+                aliases = aliases + ( creator, )
+        self._namespace_aliases = aliases
+        self._aliases_before = aliases_before
+
+    @property
+    def namespace_aliases( self ):
+        """list of namespace_alias_t children, in the order they are defined"""
+        if None is self._aliases_before:
+            self.__index_aliases()
+        return list( self._namespace_aliases )
+
+    def namespace_aliases_before( self, child ):
+        """returns tuple of namespace_alias_t children, defined before the child
+
+        The tuple is taken from the index, which is updated, when the child is
+        adopted. The index is rebuilt only after an alias is inserted before
+        other children, removed or the children are moved.
+        """
+        if None is self._aliases_before:
+            self.__index_aliases()
+        return self._aliases_before[ id( child ) ]
 
     @staticmethod
     def create_internal_code( creators, indent_code=True ):
@@ -77,10 +328,41 @@ class compound_t(code_creator.code_creator_t):
             internals[index] = internals[index] + os.linesep
         return os.linesep.join( internals )
 
+    @staticmethod
+    def create_internal_code_chunks( creators, indent_code=True ):
+        """
+        the streaming version of :meth:`compound_t.create_internal_code`
+
+        The code of every creator is taken from :meth:`code_creator_t.create_chunks`,
+        so the code of creators, which implement the streaming, is never held
+        in memory as a single string.
+
+        :param creators: A list with code creators
+        :type creators: list of :class:`code_creators.code_creator_t`
+        :rtype: generator of str
+        """
+        indentation = code_creator.code_creator_t.indent( '' )
+        first = True
+        for expr in creators:
+            started = False
+            for chunk in expr.create_chunks():
+                if not chunk:
+                    continue
+                if indent_code:
+                    chunk = chunk.replace( os.linesep, os.linesep + indentation )
+                if not started:
+                    started = True
+                    if not first:
+                        yield os.linesep * 2
+                    first = False
+                    if indent_code:
+                        chunk = indentation + chunk
+                yield chunk
+
     def get_system_files( self, recursive=False, unique=False, language='any' ):
         files = super( compound_t, self ).get_system_files(recursive, unique=False, language=language)
         if recursive:
-            for creator in self._creators:
+            for creator in self.creators:
                 files.extend( creator.get_system_files(recursive, unique=False, language=language) )
         files = [_f for _f in files if _f]
         if unique:
@@ -29,6 +29,76 @@ class module_t(compound.compound_t):
         compound.compound_t.__init__(self)
         self.__global_ns = global_ns
         self._code_generator = code_generator_type
+        self._code_cache = None
+        self._render_statistics = None
+        self.__creators_by_decl = {} #id( declaration ) : { id( creator ) : creator }
+        self.__creators_by_class = {} #creator class : { id( creator ) : creator }
+        self.__tree_positions = None #id( creator ) : position in flatten tree
+
+    def _on_creator_adopted( self, creator ):
+        self.__tree_positions = None
+        for cc in algorithm.make_flatten_generator( creator ):
+            self.__creators_by_class.setdefault( cc.__class__, {} )[ id( cc ) ] = cc
+            if isinstance( cc, declaration_based.declaration_based_t ):
+                self.__creators_by_decl.setdefault( id( cc.declaration ), {} )[ id( cc ) ] = cc
+
+    def _on_creator_removed( self, creator ):
+        self.__tree_positions = None
+        for cc in algorithm.make_flatten_generator( creator ):
+            self.__creators_by_class[ cc.__class__ ].pop( id( cc ), None )
+            if isinstance( cc, declaration_based.declaration_based_t ):
+                self.__creators_by_decl[ id( cc.declaration ) ].pop( id( cc ), None )
+
+    def _on_creators_reordered( self ):
+        self.__tree_positions = None
+
+    def find_by_declaration( self, declaration ):
+        """returns list of code creators, within the tree, based on the declaration
+
+        Unlike :meth:`creator_finder.find_by_declaration`, this method uses the
+        index, maintained by :meth:`adopt_creator` and :meth:`remove_creator`,
+        so it doesn't walk over the tree.
+        """
+        return list( self.__creators_by_decl.get( id( declaration ), {} ).values() )
+
+    def find_by_class_instance( self, what ):
+        """returns list of code creators, within the tree, which are instances of
+        the class( or tuple of classes ), in the tree order
+
+        Unlike :meth:`creator_finder.find_by_class_instance`, this method uses the
+        index, maintained by :meth:`adopt_creator` and :meth:`remove_creator`.
+        """
+        found = []
+        for class_, creators in self.__creators_by_class.items():
+            if issubclass( class_, what ):
+                found.extend( creators.values() )
+        if 1 < len( found ):
+            if None is self.__tree_positions:
+                self.__tree_positions = dict( ( id( cc ), index ) for index, cc
+                                              in enumerate( algorithm.make_flatten_generator( self ) ) )
+            found.sort( key=lambda cc: self.__tree_positions[ id( cc ) ] )
+        return found
+
+    def _get_code_cache( self ):
+        return self._code_cache
+    def _set_code_cache( self, code_cache ):
+        self._code_cache = code_cache
+    code_cache = property( _get_code_cache, _set_code_cache
+                           , doc="""reference to :class:`code_creators.code_cache_t` instance or None
+
+                           The cache is used by declaration based code creators, to skip
+                           rendering of the code, which was not changed since the previous run.
+                           """)
+
+    def _get_render_statistics( self ):
+        return self._render_statistics
+    def _set_render_statistics( self, statistics ):
+        self._render_statistics = statistics
+    render_statistics = property( _get_render_statistics, _set_render_statistics
+                                  , doc="""reference to :class:`code_creators.render_statistics_t` instance or None
+
+                                  If it is set, every code creator records its rendering cost in it.
+                                  """)
 
     @property
     def global_ns(self):
@@ -190,6 +260,9 @@ class bpmodule_t(module_t):
             include_creator.include_dirs_optimization = include_dirs
 
     def _create_impl(self):
+        return ''.join( self._create_chunks_impl() )
+
+    def _create_chunks_impl(self):
         self.do_include_dirs_optimization()
         index = 0
         code = []
@@ -200,9 +273,10 @@ class bpmodule_t(module_t):
                 code.append( self.creators[index].create() )
         if code:
             code.append( 2* os.linesep )
-        code.append( self.create_internal_code( self.creators[index:], indent_code=False ))
-        code.append( os.linesep )
-        return os.linesep.join( code )
+            yield os.linesep.join( code ) + os.linesep
+        for chunk in self.create_internal_code_chunks( self.creators[index:], indent_code=False ):
+            yield chunk
+        yield os.linesep * 2
 
     def add_include( self, header, user_defined=True, system=False ):
         creator = include.include_t( header=header, user_defined=user_defined, system=system )
@@ -219,7 +293,7 @@ class bpmodule_t(module_t):
                             , self.last_include_index() + 1 )
 
     def adopt_declaration_creator( self, creator ):
-        self.adopt_creator( creator, self.creators.index( self.body ) )
+        self.adopt_creators_before( [ creator ], self.body )
 
     def add_declaration_code( self, code, position ):
         self.adopt_declaration_creator( custom.custom_text_t( code ) )
@@ -16,11 +16,13 @@ class module_body_t(compound.compound_t):
     name = property( _get_name )
         
     def _create_impl(self):
-        result = []
-        result.append( "BOOST_PYTHON_MODULE(%s){" % self.name )
-        result.append( compound.compound_t.create_internal_code( self.creators ) )
-        result.append( "}" )
-        return os.linesep.join( result )
+        return ''.join( self._create_chunks_impl() )
+
+    def _create_chunks_impl(self):
+        yield "BOOST_PYTHON_MODULE(%s){" % self.name + os.linesep
+        for chunk in compound.compound_t.create_internal_code_chunks( self.creators ):
+            yield chunk
+        yield os.linesep + "}"
     
     def _get_system_files_impl( self ):
         return []
@@ -0,0 +1,155 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which collects the rendering cost of every code creator class"""
+
+import time
+import json
+import heapq
+import itertools
+from pygccxml import declarations
+
+class render_statistics_t( object ):
+    """
+    collects the rendering cost of the code creators, per concrete code creator class
+
+    For every code creator class the number of :meth:`code_creator_t.create`
+    calls, the total time, the "self" time - the total time minus the time, spent
+    by the children code creators - and the size of the generated code, in
+    characters, are collected. The code creators, which stream their code
+    through :meth:`code_creator_t.create_chunks`, are recorded too.
+
+    The statistics also keep the individual code creators, which rendering took
+    the most time. They help to find "pathological" declarations, for example
+    a class with hundreds of overloaded functions.
+
+    The statistics are collected, only when the instance is set as the
+    :attr:`module_t.render_statistics` of the code creators tree.
+    """
+
+    def __init__( self, top_n=20 ):
+        """
+        :param top_n: the number of the slowest code creators to keep
+        :type top_n: int
+        """
+        object.__init__( self )
+        self.top_n = top_n
+        self.__classes = {} #class name : statistics
+        self.__slowest = [] #heap of ( self time, counter, class name, declaration )
+        self.__counter = itertools.count()
+        self.__stack = [] #the time, spent by the children of the creators being rendered
+
+    def clear( self ):
+        """removes all collected statistics"""
+        self.__classes = {}
+        self.__slowest = []
+
+    def start( self ):
+        """called by :meth:`code_creator_t.create`, before the code is rendered"""
+        self.__stack.append( 0.0 )
+        return time.perf_counter()
+
+    def stop( self, creator, start_time, code ):
+        """called by :meth:`code_creator_t.create`, after the code was rendered"""
+        total_time = time.perf_counter() - start_time
+        self_time = total_time - self.__stack.pop()
+        if self.__stack:
+            self.__stack[-1] += total_time
+        self.__record( creator, total_time, self_time, len( code or '' ) )
+
+    def record_chunks( self, creator, chunks ):
+        """called by :meth:`code_creator_t.create_chunks`, wraps the code chunks generator
+
+        Only the time, spent to generate the chunks, is recorded. The time, spent
+        by the consumer of the chunks( writing them to the file ), is excluded.
+        """
+        total_time = 0.0
+        children_time = 0.0
+        output_chars = 0
+        while True:
+            self.__stack.append( children_time )
+            start_time = time.perf_counter()
+            try:
+                chunk = next( chunks, None )
+            finally:
+                elapsed = time.perf_counter() - start_time
+                children_time = self.__stack.pop()
+                if self.__stack:
+                    self.__stack[-1] += elapsed
+            total_time += elapsed
+            if None is chunk:
+                break
+            output_chars += len( chunk )
+            yield chunk
+        self.__record( creator, total_time, total_time - children_time, output_chars )
+
+    def __record( self, creator, total_time, self_time, output_chars ):
+        name = creator.__class__.__name__
+        self.__update( name, 1, total_time, self_time, output_chars )
+        if self.top_n <= len( self.__slowest ) and self_time <= self.__slowest[0][0]:
+            return
+        self.__add_slowest( self_time, name, self.__declaration_name( creator ) )
+
+    def __update( self, name, calls, total_time, self_time, output_chars ):
+        if name not in self.__classes:
+            self.__classes[ name ] = { 'name' : name
+                                       , 'calls' : 0
+                                       , 'total_time' : 0.0
+                                       , 'self_time' : 0.0
+                                       , 'output_chars' : 0 }
+        statistics = self.__classes[ name ]
+        statistics[ 'calls' ] += calls
+        statistics[ 'total_time' ] += total_time
+        statistics[ 'self_time' ] += self_time
+        statistics[ 'output_chars' ] += output_chars
+
+    def __add_slowest( self, self_time, name, declaration ):
+        item = ( self_time, next( self.__counter ), name, declaration )
+        if len( self.__slowest ) < self.top_n:
+            heapq.heappush( self.__slowest, item )
+        elif self.__slowest and self.__slowest[0][0] < self_time:
+            heapq.heapreplace( self.__slowest, item )
+
+    def __declaration_name( self, creator ):
+        declaration = getattr( creator, 'declaration', None )
+        if not isinstance( declaration, declarations.declaration_t ):
+            return None
+        if isinstance( declaration, declarations.calldef_t ):
+            return str( declaration ) #overloads should be distinguished
+        return declarations.full_name( declaration )
+
+    @property
+    def classes( self ):
+        """list of the code creator classes statistics, the most "expensive" first"""
+        return sorted( self.__classes.values(), key=lambda s: s[ 'self_time' ], reverse=True )
+
+    def slowest( self, n=None ):
+        """returns list of the slowest code creators, the slowest first
+
+        Every item is a dictionary with the code creator class name, the
+        declaration and the time, spent by the creator itself.
+        """
+        items = heapq.nlargest( n or self.top_n, self.__slowest )
+        return [ { 'name' : name, 'declaration' : declaration, 'self_time' : self_time }
+                 for self_time, _, name, declaration in items ]
+
+    def report( self ):
+        """returns the report, which could be serialized to JSON"""
+        return { 'classes' : self.classes, 'slowest' : self.slowest() }
+
+    def merge( self, report ):
+        """merges the report, created by another process, into the statistics"""
+        for s in report[ 'classes' ]:
+            self.__update( s['name'], s['calls'], s['total_time'], s['self_time'], s['output_chars'] )
+        for s in report[ 'slowest' ]:
+            self.__add_slowest( s['self_time'], s['name'], s['declaration'] )
+
+    def save( self, file_name ):
+        """writes the report to the file, in JSON format"""
+        f = open( file_name, 'w+' )
+        try:
+            json.dump( self.report(), f, indent=1 )
+        finally:
+            f.close()
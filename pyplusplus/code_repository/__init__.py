@@ -15,6 +15,9 @@ from . import convenience
 from . import return_range
 from . import ctypes_utils
 from . import call_policies
+from . import override_cache
+from . import buffer_protocol
+from . import buffer_converters
 from . import indexing_suite
 from . import ctypes_integration
 
@@ -22,6 +25,9 @@ all = [ array_1
         , gil_guard
         , convenience
         , call_policies
+        , override_cache
+        , buffer_protocol
+        , buffer_converters
         , named_tuple
         , return_range
         , ctypes_utils
@@ -36,8 +42,10 @@ def i_depend_on_them( fname ):
     if fname in indexing_suite.headers:
         result = indexing_suite.all[:]
         del result[ indexing_suite.headers.index( fname ) ]
-        return result
+        return result + [ buffer_protocol ]
     elif fname == return_range.file_name:
-        return indexing_suite.all[:]
+        return indexing_suite.all[:] + [ buffer_protocol ]
+    elif fname in ( array_1.file_name, buffer_converters.file_name ):
+        return [ buffer_protocol ]
     else:
         return []
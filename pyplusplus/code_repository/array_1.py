@@ -5,6 +5,9 @@
 
 """
 This file contains C++ code needed to export one dimensional static arrays.
+
+Arrays of fundamental types also export their memory using the buffer protocol,
+so `numpy.asarray` and `memoryview` give a direct access to it.
 """
 
 
@@ -23,9 +26,13 @@ code = \
 
 #include "boost/python.hpp"
 #include "boost/mpl/if.hpp"
+#include "boost/mpl/bool.hpp"
 #include "boost/type_traits/is_same.hpp"
 #include "boost/type_traits/is_fundamental.hpp"
+#include "boost/type_traits/is_arithmetic.hpp"
+#include "boost/type_traits/is_const.hpp"
 #include "boost/python/converter/registry.hpp"
+#include "__buffer_protocol.pypp.hpp"
 
 #include <iostream>
 
@@ -67,6 +74,75 @@ void register_alias( const char* name ){
     boost::python::scope().attr( name ) = bpl::object( class_obj );
 }
 
+//exports the memory of the array wrapper, using the buffer protocol. The
+//array is read-only, if TItemType is const
+template< class TArray, class TItemType, long unsigned int size >
+struct array_buffer{
+
+    static int get_buffer( PyObject* self, Py_buffer* view, int flags ){
+        namespace bpl = boost::python;
+        static Py_ssize_t shape[1] = { size };
+        static Py_ssize_t strides[1] = { sizeof( TItemType ) };
+        const bool readonly = boost::is_const< TItemType >::value;
+
+        view->obj = 0;
+        void* array = bpl::converter::get_lvalue_from_python(
+                        self, bpl::converter::registered< TArray >::converters );
+        if( !array ){
+            PyErr_SetString( PyExc_BufferError, "The object doesn't wrap an array." );
+            return -1;
+        }
+        if( ( flags & PyBUF_WRITABLE ) == PyBUF_WRITABLE && readonly ){
+            PyErr_SetString( PyExc_BufferError, "The array is read-only." );
+            return -1;
+        }
+        view->obj = self;
+        Py_INCREF( self );
+        view->buf = const_cast< void* >( static_cast< const void* >( static_cast< TArray* >( array )->data() ) );
+        view->len = size * sizeof( TItemType );
+        view->readonly = readonly ? 1 : 0;
+        view->itemsize = sizeof( TItemType );
+        view->format = ( flags & PyBUF_FORMAT ) == PyBUF_FORMAT
+                       ? const_cast< char* >( buffer_protocol::item_format< TItemType >::value() )
+                       : 0;
+        view->ndim = 1;
+        view->shape = ( flags & PyBUF_ND ) == PyBUF_ND ? shape : 0;
+        view->strides = ( flags & PyBUF_STRIDES ) == PyBUF_STRIDES ? strides : 0;
+        view->suboffsets = 0;
+        view->internal = 0;
+        return 0;
+    }
+
+    static void enable( boost::python::object const& class_obj ){
+        //Boost.Python classes are heap types, so the buffer slots could be set
+        PyTypeObject* type = reinterpret_cast< PyTypeObject* >( class_obj.ptr() );
+        if( !( type->tp_flags & Py_TPFLAGS_HEAPTYPE ) ){
+            return;
+        }
+        PyHeapTypeObject* heap_type = reinterpret_cast< PyHeapTypeObject* >( type );
+        heap_type->as_buffer.bf_getbuffer = &get_buffer;
+        heap_type->as_buffer.bf_releasebuffer = 0;
+        type->tp_as_buffer = &heap_type->as_buffer;
+        PyType_Modified( type );
+    }
+};
+
+//only arrays of fundamental types export the buffer protocol
+template< class TArray, class TItemType, long unsigned int size >
+void enable_buffer_protocol( boost::python::object const& class_obj, boost::mpl::true_ ){
+    array_buffer< TArray, TItemType, size >::enable( class_obj );
+}
+
+template< class TArray, class TItemType, long unsigned int size >
+void enable_buffer_protocol( boost::python::object const&, boost::mpl::false_ ){
+}
+
+template< class TArray, class TItemType, long unsigned int size >
+void enable_buffer_protocol( boost::python::object const& class_obj ){
+    typedef boost::mpl::bool_< boost::is_arithmetic< TItemType >::value > is_fundamental_item;
+    enable_buffer_protocol< TArray, TItemType, size >( class_obj, is_fundamental_item() );
+}
+
 }//details
 
 template< class TItemType, long unsigned int size >
@@ -96,6 +172,10 @@ struct const_array_1_t{
         return m_data[index];
     }
 
+    TItemType const * data() const{
+        return m_data;
+    }
+
 private:
 
     TItemType const * m_data;
@@ -135,6 +215,10 @@ struct array_1_t{
         m_data[index] = new_value;
     }
 
+    TItemType* data() const{
+        return m_data;
+    }
+
 private:
 
     TItemType* m_data;
@@ -153,12 +237,14 @@ struct register_const_array_1{
             details::register_alias< wrapper_t >( name );
         }
         else{
-            bpl::class_< wrapper_t >( name, bpl::no_init )
+            bpl::class_< wrapper_t > array_class( name, bpl::no_init );
+            array_class
                 .def( "__getitem__"
                       , &wrapper_t::item_ref
                       , ( bpl::arg("index") )
                       , CallPolicies() )
                 .def( "__len__", &wrapper_t::len );
+            details::enable_buffer_protocol< wrapper_t, const TItemType, size >( array_class );
         }
     }
 };
@@ -174,7 +260,8 @@ struct register_array_1{
             details::register_alias< wrapper_t >( name );
         }
         else{
-            bpl::class_< wrapper_t >( name, bpl::no_init )
+            bpl::class_< wrapper_t > array_class( name, bpl::no_init );
+            array_class
                 .def( "__getitem__"
                       , &wrapper_t::item_ref
                       , ( bpl::arg("index") )
@@ -184,6 +271,7 @@ struct register_array_1{
                       , ( bpl::arg("index"), bpl::arg("value") )
                       , CallPolicies()  )
                 .def( "__len__", &wrapper_t::len );
+            details::enable_buffer_protocol< wrapper_t, TItemType, size >( array_class );
         }
     }
 };
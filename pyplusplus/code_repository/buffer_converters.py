@@ -0,0 +1,137 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This file contains C++ code, which registers Boost.Python rvalue converters
+from the objects, which export the buffer protocol, to `std::vector` and
+fixed size arrays( `boost::array`, `std::array` ) of fundamental types.
+"""
+
+namespace = "pyplusplus::buffer_converters"
+
+file_name = "__buffer_converters.pypp.hpp"
+
+code = \
+"""// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __buffer_converters_pyplusplus_hpp__
+#define __buffer_converters_pyplusplus_hpp__
+
+#include "boost/python.hpp"
+#include "boost/array.hpp"
+#include "__buffer_protocol.pypp.hpp"
+#include <vector>
+#include <cstring>
+#if __cplusplus >= 201103L
+    #include <array>
+#endif
+
+namespace pyplusplus{ namespace buffer_converters{
+
+typedef pyplusplus::buffer_protocol::index_type index_type;
+
+//describes how to construct the container from the native array
+template< class TContainer >
+struct container_traits;
+
+template< class T, class TAllocator >
+struct container_traits< std::vector< T, TAllocator > >{
+
+    typedef T item_type;
+
+    static bool is_valid_size( index_type ){
+        return true;
+    }
+
+    static void construct( void* storage, const T* data, index_type size ){
+        new (storage) std::vector< T, TAllocator >( data, data + size );
+    }
+};
+
+template< class TArray, class T, std::size_t N >
+struct fixed_array_traits{
+
+    typedef T item_type;
+
+    static bool is_valid_size( index_type size ){
+        return static_cast< index_type >( N ) == size;
+    }
+
+    static void construct( void* storage, const T* data, index_type ){
+        TArray* array = new (storage) TArray();
+        std::memcpy( &( *array )[0], data, N * sizeof( T ) );
+    }
+};
+
+template< class T, std::size_t N >
+struct container_traits< boost::array< T, N > >
+    : fixed_array_traits< boost::array< T, N >, T, N >
+{};
+
+#if __cplusplus >= 201103L
+template< class T, std::size_t N >
+struct container_traits< std::array< T, N > >
+    : fixed_array_traits< std::array< T, N >, T, N >
+{};
+#endif
+
+//rvalue converter from the object, which exports C contiguous buffer of
+//compatible items, to the container
+template< class TContainer >
+struct from_buffer{
+
+    typedef container_traits< TContainer > traits;
+    typedef typename traits::item_type item_type;
+
+    static void* convertible( PyObject* obj ){
+        if( !PyObject_CheckBuffer( obj ) ){
+            return 0;
+        }
+        Py_buffer view;
+        if( 0 != PyObject_GetBuffer( obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT ) ){
+            PyErr_Clear();
+            return 0;
+        }
+        bool compatible = pyplusplus::buffer_protocol::item_traits< item_type >::is_compatible( view )
+                          && traits::is_valid_size( view.len / view.itemsize );
+        PyBuffer_Release( &view );
+        return compatible ? obj : 0;
+    }
+
+    static void construct( PyObject* obj, boost::python::converter::rvalue_from_python_stage1_data* data ){
+        namespace bpl = boost::python;
+        typedef bpl::converter::rvalue_from_python_storage< TContainer > storage_t;
+        void* storage = reinterpret_cast< storage_t* >( data )->storage.bytes;
+
+        bpl::object py_obj( bpl::handle<>( bpl::borrowed( obj ) ) );
+        pyplusplus::buffer_protocol::buffer_view_t< item_type > view( py_obj, false );
+        traits::construct( storage, view.data(), view.size() );
+        data->convertible = storage;
+    }
+};
+
+//registers the converter. The function could be called few times, the
+//converter is registered once.
+template< class TContainer >
+void register_from_buffer(){
+    static bool registered = false;
+    if( registered ){
+        return;
+    }
+    boost::python::converter::registry::push_back(
+          &from_buffer< TContainer >::convertible
+        , &from_buffer< TContainer >::construct
+        , boost::python::type_id< TContainer >() );
+    registered = true;
+}
+
+} /*buffer_converters*/ } /*pyplusplus*/
+
+#endif//__buffer_converters_pyplusplus_hpp__
+
+"""
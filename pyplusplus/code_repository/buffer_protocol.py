@@ -0,0 +1,392 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This file contains C++ code, which gives an access to the memory of Python
+objects, which export the buffer protocol, without copying it, and exposes
+native arrays to Python as `memoryview` objects.
+"""
+
+namespace = "pyplusplus::buffer_protocol"
+
+file_name = "__buffer_protocol.pypp.hpp"
+
+code = \
+"""// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __buffer_protocol_pyplusplus_hpp__
+#define __buffer_protocol_pyplusplus_hpp__
+
+#include "boost/python.hpp"
+#include "boost/noncopyable.hpp"
+#include "boost/type_traits/is_same.hpp"
+#include "boost/type_traits/is_signed.hpp"
+#include "boost/type_traits/is_unsigned.hpp"
+#include "boost/type_traits/is_arithmetic.hpp"
+#include "boost/type_traits/is_floating_point.hpp"
+#include "boost/type_traits/is_const.hpp"
+#include "boost/type_traits/remove_const.hpp"
+#include <string>
+#include <sstream>
+
+namespace pyplusplus{ namespace buffer_protocol{
+
+typedef Py_ssize_t index_type;
+
+inline void
+raise_error( PyObject *exception, const char *message ){
+   PyErr_SetString(exception, message);
+   boost::python::throw_error_already_set();
+}
+
+//raises ValueError, if the buffers of the batch don't have the same number of items
+inline void
+check_batch_size( index_type size, index_type expected_size ){
+    if( size != expected_size ){
+        std::stringstream err;
+        err << "Buffers of the same size are expected. "
+            << "Expected size is " << expected_size << ", actual size is " << size << ".";
+        raise_error( PyExc_ValueError, err.str().c_str() );
+    }
+}
+
+namespace detail{
+
+inline bool is_little_endian(){
+    const int one = 1;
+    return 1 == *reinterpret_cast< const char* >( &one );
+}
+
+//returns the kind of the buffer item: 'c' - character, 'i' - signed integral,
+//'u' - unsigned integral, 'f' - floating point, 'b' - bool, 0 - unknown
+inline char format_kind( const char* format ){
+    if( !format ){
+        return 'u'; //NULL format means unsigned bytes
+    }
+    switch( *format ){
+        case '@':
+        case '=':
+            ++format;
+            break;
+        case '<':
+            if( !is_little_endian() ){
+                return 0;
+            }
+            ++format;
+            break;
+        case '>':
+        case '!':
+            if( is_little_endian() ){
+                return 0;
+            }
+            ++format;
+            break;
+    }
+    if( !format[0] || format[1] ){
+        return 0; //the buffer items are not "simple" values
+    }
+    switch( *format ){
+        case 'c':
+            return 'c';
+        case 'b': case 'h': case 'i': case 'l': case 'q': case 'n':
+            return 'i';
+        case 'B': case 'H': case 'I': case 'L': case 'Q': case 'N':
+            return 'u';
+        case 'e': case 'f': case 'd':
+            return 'f';
+        case '?':
+            return 'b';
+        default:
+            return 0;
+    }
+}
+
+} /*detail*/
+
+//describes the items of the native array
+template< class T >
+struct item_traits{
+
+    static index_type size(){
+        return sizeof( T );
+    }
+
+    static std::string name(){
+        return boost::python::type_id< T >().name();
+    }
+
+    static char kind(){
+        if( boost::is_same< T, bool >::value ){
+            return 'b';
+        }
+        else if( boost::is_floating_point< T >::value ){
+            return 'f';
+        }
+        else if( boost::is_signed< T >::value ){
+            return 'i';
+        }
+        else if( boost::is_unsigned< T >::value ){
+            return 'u';
+        }
+        else{
+            return 0;
+        }
+    }
+
+    static bool is_compatible( const Py_buffer& view ){
+        if( view.itemsize != size() ){
+            return false;
+        }
+        if( !boost::is_arithmetic< T >::value ){
+            return true; //the buffer of structures, only the size could be checked
+        }
+        char buffer_kind = detail::format_kind( view.format );
+        if( 1 == sizeof( T ) && 'b' != kind() ){
+            return 'c' == buffer_kind || 'i' == buffer_kind || 'u' == buffer_kind;
+        }
+        return kind() == buffer_kind;
+    }
+};
+
+//raw memory: every buffer is compatible, the size is in bytes
+template<>
+struct item_traits< void >{
+
+    static index_type size(){
+        return 1;
+    }
+
+    static std::string name(){
+        return "void";
+    }
+
+    static bool is_compatible( const Py_buffer& ){
+        return true;
+    }
+};
+
+//gives an access to the memory of the object, which exports the buffer protocol
+template< class T >
+class buffer_view_t : boost::noncopyable{
+public:
+
+    buffer_view_t( boost::python::object const& obj, bool writable ){
+        int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+        if( writable ){
+            flags |= PyBUF_WRITABLE;
+        }
+        if( 0 != PyObject_GetBuffer( obj.ptr(), &m_view, flags ) ){
+            boost::python::throw_error_already_set();
+        }
+        if( !item_traits< T >::is_compatible( m_view ) ){
+            std::stringstream err;
+            err << "Buffer of \\"" << item_traits< T >::name() << "\\" items is expected. "
+                << "Actual buffer format is \\"" << ( m_view.format ? m_view.format : "B" ) << "\\", "
+                << "item size is " << m_view.itemsize << ".";
+            PyBuffer_Release( &m_view );
+            raise_error( PyExc_TypeError, err.str().c_str() );
+        }
+    }
+
+    ~buffer_view_t(){
+        PyBuffer_Release( &m_view );
+    }
+
+    T* data() const{
+        return static_cast< T* >( m_view.buf );
+    }
+
+    //the number of items in the buffer
+    index_type size() const{
+        return m_view.len / item_traits< T >::size();
+    }
+
+private:
+    Py_buffer m_view;
+};
+
+//struct module format of the native array items
+template< class T >
+struct item_format{
+    static const char* value(){
+        static std::string format;
+        if( format.empty() ){
+            std::stringstream fmt;
+            fmt << sizeof( T ) << "s"; //opaque items
+            format = fmt.str();
+        }
+        return format.c_str();
+    }
+};
+
+template< class T >
+struct item_format< const T > : item_format< T >{};
+
+#define PYPLUSPLUS_BUFFER_ITEM_FORMAT( type, fmt ) \\
+template<> struct item_format< type >{ static const char* value(){ return fmt; } };
+
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( bool, "?" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( char, "c" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( signed char, "b" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( unsigned char, "B" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( short, "h" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( unsigned short, "H" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( int, "i" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( unsigned int, "I" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( long, "l" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( unsigned long, "L" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( long long, "q" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( unsigned long long, "Q" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( float, "f" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( double, "d" )
+PYPLUSPLUS_BUFFER_ITEM_FORMAT( long double, "g" )
+
+#undef PYPLUSPLUS_BUFFER_ITEM_FORMAT
+
+namespace detail{
+
+//Python object, which exports the memory of a native array. The memory is
+//either owned by the object or by another Python object - the "owner".
+struct array_object{
+    PyObject_HEAD
+    PyObject* owner;
+    void* data;
+    void (*deleter)( void* );
+    const char* format;
+    Py_ssize_t itemsize;
+    int ndim;
+    Py_ssize_t shape[2];
+    Py_ssize_t strides[2];
+    int readonly;
+};
+
+inline int array_getbuffer( PyObject* self, Py_buffer* view, int flags ){
+    array_object* array = reinterpret_cast< array_object* >( self );
+    if( ( flags & PyBUF_WRITABLE ) == PyBUF_WRITABLE && array->readonly ){
+        view->obj = 0;
+        PyErr_SetString( PyExc_BufferError, "The array is read-only." );
+        return -1;
+    }
+    view->obj = self;
+    Py_INCREF( self );
+    view->buf = array->data;
+    view->len = array->itemsize;
+    for( int i = 0; i < array->ndim; ++i ){
+        view->len *= array->shape[i];
+    }
+    view->readonly = array->readonly;
+    view->itemsize = array->itemsize;
+    view->format = ( flags & PyBUF_FORMAT ) == PyBUF_FORMAT ? const_cast< char* >( array->format ) : 0;
+    view->ndim = array->ndim;
+    view->shape = ( flags & PyBUF_ND ) == PyBUF_ND ? array->shape : 0;
+    view->strides = ( flags & PyBUF_STRIDES ) == PyBUF_STRIDES ? array->strides : 0;
+    view->suboffsets = 0;
+    view->internal = 0;
+    return 0;
+}
+
+inline void array_dealloc( PyObject* self ){
+    array_object* array = reinterpret_cast< array_object* >( self );
+    if( array->deleter ){
+        array->deleter( array->data );
+    }
+    Py_XDECREF( array->owner );
+    PyTypeObject* type = Py_TYPE( self );
+    type->tp_free( self );
+#if PY_VERSION_HEX >= 0x03080000
+    Py_DECREF( type );
+#endif
+}
+
+inline PyTypeObject* array_type(){
+    static PyObject* type = 0;
+    if( !type ){
+        static PyType_Slot slots[] = {
+              { Py_bf_getbuffer, reinterpret_cast< void* >( &array_getbuffer ) }
+            , { Py_tp_dealloc, reinterpret_cast< void* >( &array_dealloc ) }
+            , { 0, 0 } };
+        static PyType_Spec spec = {
+            "pyplusplus.native_array", sizeof( array_object ), 0, Py_TPFLAGS_DEFAULT, slots };
+        type = PyType_FromSpec( &spec );
+        if( !type ){
+            boost::python::throw_error_already_set();
+        }
+    }
+    return reinterpret_cast< PyTypeObject* >( type );
+}
+
+template< class T >
+void delete_array( void* data ){
+    delete[] static_cast< T* >( data );
+}
+
+template< class T >
+boost::python::object
+make_memoryview( T* data, index_type rows, index_type columns
+                 , PyObject* owner, void (*deleter)( void* ) ){
+    array_object* array = PyObject_New( array_object, array_type() );
+    if( !array ){
+        if( deleter ){
+            deleter( const_cast< typename boost::remove_const< T >::type* >( data ) );
+        }
+        boost::python::throw_error_already_set();
+    }
+    Py_XINCREF( owner );
+    array->owner = owner;
+    array->data = const_cast< typename boost::remove_const< T >::type* >( data );
+    array->deleter = deleter;
+    array->format = item_format< T >::value();
+    array->itemsize = sizeof( T );
+    array->readonly = boost::is_const< T >::value ? 1 : 0;
+    if( columns < 0 ){
+        array->ndim = 1;
+        array->shape[0] = rows;
+        array->strides[0] = sizeof( T );
+    }
+    else{
+        array->ndim = 2;
+        array->shape[0] = rows;
+        array->shape[1] = columns;
+        array->strides[0] = columns * sizeof( T );
+        array->strides[1] = sizeof( T );
+    }
+    boost::python::handle<> array_handle( reinterpret_cast< PyObject* >( array ) );
+    return boost::python::object( boost::python::handle<>( PyMemoryView_FromObject( array_handle.get() ) ) );
+}
+
+} /*detail*/
+
+//creates new native array and returns memoryview, which owns it
+template< class T >
+boost::python::object new_array( index_type size, T*& data ){
+    data = new T[ size ];
+    return detail::make_memoryview( data, size, -1, 0, &detail::delete_array< T > );
+}
+
+//creates new native C matrix and returns 2D memoryview, which owns it
+template< class T >
+boost::python::object new_matrix( index_type rows, index_type columns, T*& data ){
+    data = new T[ rows * columns ];
+    return detail::make_memoryview( data, rows, columns, 0, &detail::delete_array< T > );
+}
+
+//returns memoryview of the native array, which is owned by another object. The
+//owner is kept alive, while the memoryview exists. The memoryview is read-only,
+//if the array items are const.
+template< class T >
+boost::python::object borrowed_array( T* data, index_type size, PyObject* owner ){
+    return detail::make_memoryview( data, size, -1, owner, 0 );
+}
+
+} /*buffer_protocol*/ } /*pyplusplus*/
+
+namespace pyplus_buffer = pyplusplus::buffer_protocol;
+
+#endif//__buffer_protocol_pyplusplus_hpp__
+
+"""
@@ -7,6 +7,8 @@
 This file contains C++ code to acquire/release the GIL.
 """
 
+namespace = "pyplusplus::threading"
+
 file_name = "__gil_guard.pypp.hpp"
 
 code = \
@@ -55,6 +57,33 @@ class gil_guard_t
     PyGILState_STATE m_gstate;
 };
 
+//releases the GIL, held by the current thread, for the lifetime of the object
+class gil_release_t
+{
+    public:
+    gil_release_t()
+     : m_state( PyEval_SaveThread() )
+    {}
+
+    ~gil_release_t() {
+        restore();
+    }
+
+    void restore() {
+        if( m_state )
+        {
+             PyEval_RestoreThread( m_state );
+             m_state = 0;
+        }
+    }
+
+    private:
+    gil_release_t( const gil_release_t& );
+    gil_release_t& operator=( const gil_release_t& );
+
+    PyThreadState* m_state;
+};
+
 } /* threading */ } /* pyplusplus*/ 
 
 
@@ -25,6 +25,7 @@ code = """// -*- mode:c++ -*-
 // 2008/12/08   Roman   Change indexing suite layout
 // 2009/01/30   Roman   patch from Maik Beckmann was applied - fixes error:
 //                      // error: no class template named 'extract_return_type'
+//                      fast paths for the containers of fundamental values
 // $Id: slice_handler.hpp,v 1.1.2.10 2003/11/24 16:35:52 raoulgough Exp $
 //
 
@@ -37,10 +38,16 @@ code = """// -*- mode:c++ -*-
 #include <boost/python/extract.hpp>
 #include <boost/python/make_function.hpp>
 #include <boost/mpl/apply.hpp>
+#include <boost/mpl/bool.hpp>
+#include <boost/type_traits/is_arithmetic.hpp>
+#include <boost/type_traits/is_same.hpp>
 #include <algorithm>
+#include <cstring>
+#include <vector>
 
 #include <indexing_suite/slice.hpp>
 #include <indexing_suite/python_iterator.hpp>
+#include "__buffer_protocol.pypp.hpp"
 
 namespace boost { namespace python { namespace indexing {
   template<class Algorithms, class Policy>
@@ -143,6 +150,179 @@ namespace boost { namespace python { namespace indexing {
   }
 
   namespace detail {
+    ////////////////////////////////////////////////////////////////////////
+    // Fast paths for the containers of fundamental values. The values are
+    // copied from the memory of the object, which exports the buffer
+    // protocol, or taken directly from the list or tuple items, instead of
+    // using the iterator protocol and two extractors per element.
+    ////////////////////////////////////////////////////////////////////////
+
+    template<bool is_fundamental>
+    struct fast_values
+    {
+      // Generic values - no fast path
+      template<class Algorithms>
+      static bool set_slice (
+          BOOST_DEDUCED_TYPENAME Algorithms::container &, slice const &, PyObject *)
+      {
+        return false;
+      }
+
+      template<class Helper, class Converter>
+      static bool get_slice (Helper &, Converter &, boost::python::list &)
+      {
+        return false;
+      }
+    };
+
+    template<>
+    struct fast_values<true>
+    {
+      template<typename T>
+      static bool extract_buffer (PyObject *values, std::vector<T> &result)
+      {
+        namespace buffer = pyplusplus::buffer_protocol;
+
+        if (!PyObject_CheckBuffer (values))
+          {
+            return false;
+          }
+
+        Py_buffer view;
+        if (0 != PyObject_GetBuffer (values, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT))
+          {
+            PyErr_Clear ();  // e.g. non contiguous buffer - use the slow path
+            return false;
+          }
+
+        bool const compatible = buffer::item_traits<T>::is_compatible (view);
+        if (compatible)
+          {
+            result.resize (view.len / sizeof (T));
+            if (!result.empty())
+              {
+                std::memcpy (&result[0], view.buf, result.size() * sizeof (T));
+              }
+          }
+
+        PyBuffer_Release (&view);
+        return compatible;
+      }
+
+      template<typename T>
+      static bool extract (PyObject *values, std::vector<T> &result)
+      {
+        if (extract_buffer (values, result))
+          {
+            return true;
+          }
+
+        if (!PyList_Check (values) && !PyTuple_Check (values))
+          {
+            return false;
+          }
+
+        boost::python::handle<> fast (
+            PySequence_Fast (values, "list or tuple is expected"));
+        Py_ssize_t const size = PySequence_Fast_GET_SIZE (fast.get());
+        PyObject **items = PySequence_Fast_ITEMS (fast.get());
+
+        result.reserve (size);
+        for (Py_ssize_t index = 0; index < size; ++index)
+          {
+            result.push_back (boost::python::extract<T> (items[index]) ());
+          }
+
+        return true;
+      }
+
+      template<class Algorithms>
+      static bool set_slice (
+          BOOST_DEDUCED_TYPENAME Algorithms::container &c, slice const &sl, PyObject *values)
+      {
+        std::vector<BOOST_DEDUCED_TYPENAME Algorithms::value_type> converted;
+
+        if (!extract (values, converted))
+          {
+            return false;
+          }
+
+        // All values were converted, so the container is not changed, if
+        // the conversion fails
+        BOOST_DEDUCED_TYPENAME Algorithms::slice_helper
+          helper (Algorithms::make_slice_helper (c, sl));
+
+        for (std::size_t index = 0; index < converted.size(); ++index)
+          {
+            helper.write (converted[index]);
+          }
+
+        if (helper.next())
+          {
+            helper.erase_remaining();
+          }
+
+        return true;
+      }
+
+      static void release (std::vector<PyObject *> &items)
+      {
+        for (std::size_t index = 0; index < items.size(); ++index)
+          {
+            Py_DECREF (items[index]);
+          }
+        items.clear();
+      }
+
+      template<class Helper, class Converter>
+      static bool get_slice (Helper &helper, Converter &converter, boost::python::list &result)
+      {
+        // Convert the values, then create the list of the known size,
+        // instead of appending the values one by one
+        std::vector<PyObject *> items;
+        try
+          {
+            while (helper.next())
+              {
+                PyObject *item = converter (helper.current());
+                if (!item)
+                  {
+                    boost::python::throw_error_already_set ();
+                  }
+                items.push_back (item);
+              }
+          }
+        catch (...)
+          {
+            release (items);
+            throw;
+          }
+
+        PyObject *list = PyList_New (items.size());
+        if (!list)
+          {
+            release (items);
+            boost::python::throw_error_already_set ();
+          }
+
+        for (std::size_t index = 0; index < items.size(); ++index)
+          {
+            PyList_SET_ITEM (list, index, items[index]);  // steals the reference
+          }
+
+        result = boost::python::list (boost::python::detail::new_reference (list));
+        return true;
+      }
+    };
+
+    // std::vector<bool> doesn't keep the values in contiguous memory
+    template<typename T>
+    struct fast_values_selector
+      : fast_values<boost::is_arithmetic<T>::value
+                    && !boost::is_same<T, bool>::value>
+    {
+    };
+
     ////////////////////////////////////////////////////////////////////////
     // postcall_override constructor
     ////////////////////////////////////////////////////////////////////////
@@ -201,6 +381,14 @@ namespace boost { namespace python { namespace indexing {
 
     slice_helper helper (Algorithms::make_slice_helper (c, sl));
 
+    typedef detail::fast_values_selector<
+        BOOST_DEDUCED_TYPENAME Algorithms::value_type> fast_path;
+
+    if (fast_path::get_slice (helper, converter, result))
+      {
+        return result;
+      }
+
     while (helper.next())
       {
         // Apply the result converter (only) to each element before
@@ -221,6 +409,14 @@ namespace boost { namespace python { namespace indexing {
   slice_handler<Algorithms, Policy>
   ::set_slice (container &c, slice sl, boost::python::object values)
   {
+    typedef detail::fast_values_selector<
+        BOOST_DEDUCED_TYPENAME Algorithms::value_type> fast_path;
+
+    if (fast_path::BOOST_NESTED_TEMPLATE set_slice<Algorithms> (c, sl, values.ptr()))
+      {
+        return;
+      }
+
     python_iterator value_iter (values);
 
     // Try two kinds of extractors - the first is more efficient (using
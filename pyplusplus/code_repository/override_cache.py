@@ -0,0 +1,119 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This file contains C++ code, which remembers, per Python class, whether the
+virtual function is overridden in Python.
+"""
+
+namespace = "pyplusplus::overrides"
+
+file_name = "__override_cache.pypp.hpp"
+
+code = \
+"""// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __override_cache_pyplusplus_hpp__
+#define __override_cache_pyplusplus_hpp__
+
+#include "boost/python.hpp"
+#include <vector>
+
+namespace pyplusplus{ namespace overrides{
+
+//returns true, if the type version tag is valid. Python changes the tag, when
+//the type or one of its bases is modified.
+inline bool
+has_valid_version_tag( PyTypeObject* type ){
+#if PY_VERSION_HEX >= 0x030C0000
+    return 0 != type->tp_version_tag;
+#else
+    return PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG );
+#endif
+}
+
+//remembers, per Python class, whether the virtual function is overridden.
+//The entry is recalculated, when the class dictionary, or the dictionary of
+//one of its bases, is changed. The functions, assigned to the instances, are
+//not taken into account.
+//The GIL should be held, while the cache is used.
+class override_cache_t{
+public:
+
+    bool is_overridden( PyTypeObject* type, const char* name, PyTypeObject* class_object ){
+        if( type == class_object ){
+            return false;
+        }
+        typedef std::vector< entry_t >::iterator iterator_t;
+        for( iterator_t i = m_entries.begin(); i != m_entries.end(); ++i ){
+            if( i->type != type ){
+                continue;
+            }
+            if( has_valid_version_tag( type ) && i->version_tag == type->tp_version_tag ){
+                return i->overridden;
+            }
+            m_entries.erase( i );
+            break;
+        }
+        bool overridden = lookup( type, name, class_object );
+        if( has_valid_version_tag( type ) ){
+            entry_t entry = { type, type->tp_version_tag, overridden };
+            m_entries.push_back( entry );
+        }
+        return overridden;
+    }
+
+private:
+
+    static bool lookup( PyTypeObject* type, const char* name, PyTypeObject* class_object ){
+        PyObject* attr = PyObject_GetAttrString( reinterpret_cast< PyObject* >( type ), name );
+        if( !attr ){
+            PyErr_Clear();
+            return false;
+        }
+        PyObject* function = attr;
+#if PY_VERSION_HEX < 0x03000000
+        if( PyMethod_Check( attr ) ){
+            function = PyMethod_GET_FUNCTION( attr );
+        }
+#endif
+        PyObject* exposed = class_object->tp_dict
+                            ? PyDict_GetItemString( class_object->tp_dict, name )
+                            : 0;
+        bool overridden = function != exposed;
+        Py_DECREF( attr );
+        return overridden;
+    }
+
+    struct entry_t{
+        PyTypeObject* type;
+        unsigned int version_tag;
+        bool overridden;
+    };
+
+    std::vector< entry_t > m_entries;
+};
+
+//returns false, if the virtual function is not overridden in Python class of
+//the wrapper owner, so the call to "get_override" could be skipped
+template< class TWrapped >
+bool is_overridden( const boost::python::detail::wrapper_base& wrapper, const char* name, override_cache_t& cache ){
+    PyObject* owner = boost::python::detail::wrapper_base_::get_owner( wrapper );
+    if( !owner ){
+        return false;
+    }
+    PyTypeObject* class_object
+        = boost::python::converter::registered< TWrapped >::converters.get_class_object();
+    return cache.is_overridden( Py_TYPE( owner ), name, class_object );
+}
+
+} /*overrides*/ } /*pyplusplus*/
+
+#endif//__override_cache_pyplusplus_hpp__
+
+"""
@@ -28,6 +28,7 @@ code = \
 #include "indexing_suite/iterator_range.hpp"
 #include "boost/python/object/class_detail.hpp"
 #include "boost/type_traits/is_same.hpp"
+#include "__buffer_protocol.pypp.hpp"
 namespace pyplusplus{ namespace call_policies{
 
 namespace bpl = boost::python;
@@ -150,6 +151,48 @@ private:
 
 };
 
+//returns the range as memoryview, which doesn't copy the array. The first
+//argument of the function( "self" ) is kept alive, while the memoryview exists.
+template < typename TGetSize, typename TValueType >
+struct return_range_buffer : bpl::default_call_policies{
+
+public:
+
+    typedef typename detail::return_raw_data_ref result_converter;
+
+    typedef TValueType value_type;
+    typedef TGetSize get_size_type;
+
+    template <class ArgumentPackage>
+    static PyObject* postcall(ArgumentPackage const& args, PyObject* result){
+        if( result == bpl::detail::none() ){
+            return result;
+        }
+#ifdef Py_CAPSULE_H
+        if( !PyCapsule_CheckExact( result ) ){
+            throw std::runtime_error( "Internal error: expected to get PyCapsule" );
+        }
+        value_type* raw_data = reinterpret_cast<value_type*>( PyCapsule_GetPointer( result, "pypp._C_API_" ) );
+#else
+        if( !PyCObject_Check( result ) ){
+            throw std::runtime_error( "Internal error: expected to get PyCObject" );
+        }
+        value_type* raw_data = reinterpret_cast<value_type*>( PyCObject_AsVoidPtr( result ) );
+#endif
+        Py_DECREF(result);//we don't need result anymore
+
+        bpl::tuple args_w( bpl::handle<>( bpl::borrowed( args ) ) );
+
+        get_size_type get_size;
+        PyObject* owner = 0;
+        if( 0 < PyTuple_Size( args ) ){
+            owner = PyTuple_GetItem( args, 0 );
+        }
+        bpl::object view = pyplusplus::buffer_protocol::borrowed_array( raw_data, get_size( args_w ), owner );
+        return bpl::incref( view.ptr() );
+    }
+};
+
 } /*pyplusplus*/ } /*call_policies*/
 
 
@@ -7,6 +7,7 @@ from .bpcreator import bpcreator_t
 from .ctypes_creator import ctypes_creator_t
 from .sort_algorithms import sort_classes as findout_desired_order
 from .call_policies_resolver import built_in_resolver_t
+from .type_traits_cache import type_traits_cache_t
 
 def create( decls, module_name ):
     maker = bpcreator_t(decls, module_name)
@@ -3,6 +3,10 @@
 # accompanying file LICENSE_1_0.txt or copy at
 # http://www.boost.org/LICENSE_1_0.txt)
 
+import io
+import pickle
+import logging
+import multiprocessing
 from . import types_database
 from . import creators_wizard
 from . import sort_algorithms
@@ -16,10 +20,64 @@ from pyplusplus import decl_wrappers
 from pyplusplus import code_creators
 from pyplusplus import code_repository
 from pyplusplus import _logging_
+from pyplusplus import utils
+from pyplusplus.utils import profiler as profiling
 
 ACCESS_TYPES = declarations.ACCESS_TYPES
 VIRTUALITY_TYPES = declarations.VIRTUALITY_TYPES
 
+#the creator, which visits the classes in parallel. Worker processes are forked,
+#so they inherit the reference together with the whole declarations tree.
+_parallel_creator = None
+
+def _visit_parallel_chunk( chunk_index ):
+    return _parallel_creator.visit_chunk( chunk_index )
+
+class _persistent_pickler_t( pickle.Pickler ):
+    """pickles the objects, shared by the parent and the worker processes, by key"""
+    def __init__( self, file, objects, keys ):
+        pickle.Pickler.__init__( self, file, pickle.HIGHEST_PROTOCOL )
+        self.__objects = objects
+        self.__keys = keys #id( object ) : key
+
+    def persistent_id( self, obj ):
+        key = self.__keys.get( id( obj ) )
+        if None is not key and self.__objects[ key ] is obj:
+            return key
+        return None
+
+class _persistent_unpickler_t( pickle.Unpickler ):
+    def __init__( self, file, objects ):
+        pickle.Unpickler.__init__( self, file )
+        self.__objects = objects
+
+    def persistent_load( self, key ):
+        return self.__objects[ key ]
+
+class _log_records_collector_t( logging.Handler ):
+    """collects the messages, written to `Py++` loggers, within worker process"""
+    def __init__( self ):
+        logging.Handler.__init__( self )
+        self.records = []
+        self.__handlers = {}
+
+    def emit( self, record ):
+        #the message arguments could not be pickled
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append( record )
+
+    def __enter__( self ):
+        for logger in _logging_.loggers.all:
+            self.__handlers[ logger ] = logger.handlers[:]
+            logger.handlers[:] = [ self ]
+        return self
+
+    def __exit__( self, *exc_info ):
+        for logger, handlers in self.__handlers.items():
+            logger.handlers[:] = handlers
+
 class bpcreator_t( declarations.decl_visitor_t ):
     """
     code creators factory for Boost.Python library
@@ -37,7 +95,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
                   , call_policies_resolver_=None
                   , types_db=None
                   , target_configuration=None
-                  , enable_indexing_suite=True ):
+                  , enable_indexing_suite=True
+                  , register_buffer_converters=False
+                  , processes=None
+                  , report_dependencies=True
+                  , type_traits_cache=None ):
         """Constructor.
 
         :param decls: Declarations that should be exposed in the final module.
@@ -47,6 +109,10 @@ class bpcreator_t( declarations.decl_visitor_t ):
         :param types_db: ...todo...
         :param target_configuration: A target configuration object can be used to customize the generated source code to a particular compiler or a particular version of Boost.Python.
         :param already_exposed_dbs: list of files/directories other modules, this module depends on, generated their code too
+        :param register_buffer_converters: if True, `std::vector` and fixed size arrays of fundamental types, used as function arguments, could be constructed from objects, which support the buffer protocol
+        :param processes: number of worker processes, which create the code creators of the classes. The created tree is identical to the one, created sequentially.
+        :param report_dependencies: if False, the unexposed declarations, the exposed ones depend on, are not reported by :meth:`create`. The report could be produced later, using :attr:`dependencies_manager`.
+        :param type_traits_cache: memoises the type traits, used by the factory, the built-in call policies resolver and the classes organizer. If None, the traits are not memoised.
         :type decls: list of declaration_t
         :type module_name: str
         :type boost_python_ns_name: str
@@ -54,12 +120,26 @@ class bpcreator_t( declarations.decl_visitor_t ):
         :type types_db: L:class:`types_database.types_database_t`
         :type target_configuration: :class:`code_creators.target_configuration_t`
         :type already_exposed_dbs: list of strings
+        :type processes: int
+        :type report_dependencies: bool
+        :type type_traits_cache: :class:`type_traits_cache.type_traits_cache_t`
         """
         declarations.decl_visitor_t.__init__(self)
         self.logger = _logging_.loggers.module_builder
         self.decl_logger = _logging_.loggers.declarations
 
         self.__enable_indexing_suite = enable_indexing_suite
+        self.__register_buffer_converters = register_buffer_converters
+        self.__processes = processes
+        self.__report_dependencies = report_dependencies
+        #the cache methods have the same names as the pygccxml type traits
+        self.__type_traits = type_traits_cache
+        if None is self.__type_traits:
+            self.__type_traits = declarations
+        self.__parallel_chunks = []
+        self.__persistent_objects = []
+        self.__persistent_keys = {}
+        self.__replaced_registrators = {} #id( created by worker ) : ( it, registrator )
         self.__target_configuration = target_configuration
         if not self.__target_configuration:
             self.__target_configuration = code_creators.target_configuration_t()
@@ -67,7 +147,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.__call_policies_resolver = call_policies_resolver_
         if not self.__call_policies_resolver:
             self.__call_policies_resolver \
-                = call_policies_resolver.built_in_resolver_t(self.__target_configuration)
+                = call_policies_resolver.built_in_resolver_t( self.__target_configuration, type_traits_cache )
 
         self.__types_db = types_db
         if not self.__types_db:
@@ -89,7 +169,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.__dependencies_manager = dependencies_manager.manager_t(self.decl_logger)
 
         prepared_decls = self._prepare_decls( decls )
-        self.__decls = sort_algorithms.sort( prepared_decls )
+        self.__decls = sort_algorithms.sort( prepared_decls, type_traits_cache )
 
         self.curr_code_creator = self.__module_body
         self.curr_decl = None
@@ -99,6 +179,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.__exposed_free_fun_overloads = set()
         self.__fc_manager = fake_constructors_manager.manager_t( global_ns )
 
+    @property
+    def dependencies_manager( self ):
+        """reference to :class:`dependencies_manager.manager_t`, which keeps the exported declarations"""
+        return self.__dependencies_manager
+
     def __print_readme( self, decl ):
         readme = decl.readme()
         if not readme:
@@ -154,14 +239,21 @@ class bpcreator_t( declarations.decl_visitor_t ):
         return to_be_exposed
 
     def _adopt_free_operator( self, operator ):
+        def is_exposed_under( creator ):
+            for cc in self.__extmodule.find_by_declaration( operator ):
+                parent = cc.parent
+                while parent and parent is not creator:
+                    parent = parent.parent
+                if parent is creator:
+                    return True
+            return False
+
         def adopt_operator_impl( operator, found_creators ):
             creator = [creator for creator in found_creators if isinstance( creator, code_creators.class_t )]
             if len(creator) == 1:
                 creator = creator[0]
                 #I think I don't need this condition any more
-                if not find( lambda creator: isinstance( creator, code_creators.declaration_based_t )
-                                             and operator is creator.declaration
-                             , creator.creators ):
+                if not is_exposed_under( creator ):
                     #expose operator only once
                     self.__dependencies_manager.add_exported( operator )
                     creator.adopt_creator( code_creators.operator_t( operator=operator ) )
@@ -169,10 +261,8 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 pass
             else:
                 assert not "Found %d class code creators" % len(creator)
-        find = code_creators.creator_finder.find_by_declaration
         if operator.target_class and operator.target_class.ignore == False:
-            found = find( lambda decl: operator.target_class is decl
-                          , self.__extmodule.body.creators )
+            found = self.__extmodule.find_by_declaration( operator.target_class )
             adopt_operator_impl( operator, found )
 
     def _is_registered_smart_pointer_creator( self, creator, db ):
@@ -196,10 +286,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
         goes over all class creators and apply held_type and registers smart pointers
         classes as needed
         """
-        find_classes = code_creators.creator_finder.find_by_class_instance
-        class_creators = find_classes( what=code_creators.class_t
-                                       , where=self.__extmodule.body.creators
-                                       , recursive=True )
+        class_creators = self.__extmodule.find_by_class_instance( code_creators.class_t )
         registrators_db = []
         for creator in class_creators:
             if None is creator.held_type:
@@ -212,10 +299,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
                     registrators_db.append(r)
 
     def _append_user_code( self ):
-        find_classes = code_creators.creator_finder.find_by_class_instance
-        class_creators = find_classes( what=code_creators.class_t
-                                       , where=self.__extmodule.body.creators
-                                       , recursive=True )
+        class_creators = self.__extmodule.find_by_class_instance( code_creators.class_t )
 
         ctext_t = code_creators.custom_text_t
         for cls_creator in class_creators:
@@ -232,8 +316,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 cls_creator.wrapper.adopt_creators( uc_creators )
 
             uc_creators = [ctext_t( uc.text ) for uc in cls_decl.declaration_code]
-            insert_pos = self.__extmodule.creators.index( self.__module_body )
-            self.__extmodule.adopt_creators( uc_creators, insert_pos )
+            self.__extmodule.adopt_creators_before( uc_creators, self.__module_body )
             cls_creator.associated_decl_creators.extend( uc_creators )
 
     def __get_exposed_containers(self):
@@ -304,6 +387,199 @@ class bpcreator_t( declarations.decl_visitor_t ):
         creators.reverse()
         self.__module_body.adopt_creators( creators, 0 )
 
+    def _register_buffer_converters( self ):
+        for type_ in self.__types_db.buffer_convertibles:
+            registrator = code_creators.buffer_converter_registrator_t( type_ )
+            self.__module_body.adopt_creator( registrator )
+
+    def _iter_exposed_decls( self, decls ):
+        """yields the declarations, the code creators are created for, in the visiting order"""
+        for decl in decls:
+            yield decl
+            if isinstance( decl, declarations.class_t ) and not decl.indexing_suite:
+                for f in decl.member_functions( allow_empty=True, recursive=False ):
+                    if f.ignore == False and f.use_overload_macro:
+                        yield f
+                for member in self._iter_exposed_decls( decl.get_exportable_members( sort_algorithms.sort ) ):
+                    yield member
+                for f in decl.redefined_funcs():
+                    if not isinstance( f, declarations.operator_t ):
+                        yield f
+            elif isinstance( decl, declarations.free_function_t ) and decl.use_overload_macro:
+                for f in decl.parent.free_functions( allow_empty=True, recursive=False ):
+                    if f.ignore == False and f.use_overload_macro:
+                        yield f
+
+    def _resolve_call_policies( self ):
+        """sets the default call policies of the exposed functions and variables
+
+        This is the only change the code creators factory does in the declarations.
+        It is done before the declarations are visited, so the visitor doesn't
+        change them and the classes could be visited by the worker processes.
+        """
+        for decl in self._iter_exposed_decls( self.__decls ):
+            if isinstance( decl, declarations.calldef_t ):
+                if isinstance( decl, ( declarations.destructor_t, declarations.free_operator_t ) ):
+                    continue
+                if isinstance( decl, declarations.member_operator_t ) \
+                   and decl.symbol not in ( '()', '[]', '=' ):
+                    continue
+                if self.__fc_manager.is_fake_constructor( decl ):
+                    continue
+                if None is decl.call_policies:
+                    decl.call_policies = self.__call_policies_resolver( decl )
+            elif isinstance( decl, declarations.variable_t ):
+                if decl.expose_address or not decl.expose_value or None is not decl.bits:
+                    continue
+                if not isinstance( decl.parent, declarations.class_t ) \
+                   or not declarations.is_reference( decl.type ):
+                    continue
+                if None is decl.getter_call_policies:
+                    decl.getter_call_policies = self.__call_policies_resolver( decl, 'get' )
+                if None is decl.setter_call_policies:
+                    decl.setter_call_policies = self.__call_policies_resolver( decl, 'set' )
+
+    CHUNKS_PER_PROCESS = 4
+
+    def is_parallel_visit_enabled( self ):
+        if not self.__processes or self.__processes < 2:
+            return False
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.logger.info( 'the platform does not support "fork", the declarations will be visited sequentially' )
+            return False
+        return True
+
+    def _register_persistent_objects( self ):
+        #the objects, which exist in the parent and the worker processes, are
+        #passed between them by key: the declarations and everything they own
+        objects = [ self.__extmodule, self.__module_body ]
+        global_ns = declarations.get_global_namespace( self.__decls )
+        simple_types = ( str, int, float, bool, type( None ) )
+        for decl in declarations.make_flatten( global_ns ):
+            objects.append( decl )
+            for value in vars( decl ).values():
+                if isinstance( value, simple_types ):
+                    continue
+                objects.append( value )
+                if isinstance( value, ( list, tuple ) ):
+                    objects.extend( value )
+        self.__persistent_objects = objects
+        self.__persistent_keys = dict( ( id( obj ), key ) for key, obj in enumerate( objects ) )
+
+    def _visit_classes_in_parallel( self ):
+        """
+        creates the code creators of the top level classes, using a pool of
+        worker processes, and returns dictionary: declaration index : result
+
+        Every worker process visits contiguous chunk of classes and returns
+        the created code creators, together with the exported declarations,
+        the types and the log records, collected by the class visitor. The results
+        are adopted by :meth:`_adopt_visited_class` in the "sequential" order.
+        """
+        global _parallel_creator
+
+        indexes = [ index for index, decl in enumerate( self.__decls )
+                    if isinstance( decl, declarations.class_t ) and not decl.indexing_suite ]
+        if len( indexes ) < 2:
+            return {}
+
+        with profiling.phase( 'register shared objects' ):
+            self._register_persistent_objects()
+
+        cost = lambda index: len( declarations.make_flatten( self.__decls[ index ] ) )
+        self.__parallel_chunks = utils.split_sequence_by_cost(
+            indexes, self.__processes * self.CHUNKS_PER_PROCESS, cost )
+
+        _parallel_creator = self
+        try:
+            with profiling.phase( 'visit classes in parallel' ):
+                #every chunk is visited by a freshly forked process, so it doesn't
+                #see the creators, created by the previous chunks
+                pool = multiprocessing.get_context( 'fork' ).Pool( self.__processes, maxtasksperchild=1 )
+                try:
+                    results = pool.map( _visit_parallel_chunk, list(range( len( self.__parallel_chunks ) )), chunksize=1 )
+                finally:
+                    pool.close()
+                    pool.join()
+            visited = {}
+            for chunk, data in zip( self.__parallel_chunks, results ):
+                unpickler = _persistent_unpickler_t( io.BytesIO( data ), self.__persistent_objects )
+                visited.update( list(zip( chunk, unpickler.load() )) )
+        finally:
+            _parallel_creator = None
+            self.__parallel_chunks = []
+            self.__persistent_objects = []
+            self.__persistent_keys = {}
+        return visited
+
+    def visit_chunk( self, chunk_index ):
+        """visits the classes of a single chunk, executed within worker process"""
+        results = []
+        for index in self.__parallel_chunks[ chunk_index ]:
+            results.append( self._visit_isolated_class( self.__decls[ index ] ) )
+        f = io.BytesIO()
+        _persistent_pickler_t( f, self.__persistent_objects, self.__persistent_keys ).dump( results )
+        return f.getvalue()
+
+    def _visit_isolated_class( self, cls ):
+        #visits the class, using empty types database, and returns everything
+        #it added to the shared state
+        types_db = self.__types_db
+        self.__types_db = types_database.types_database_t()
+        exported_count = len( self.__dependencies_manager.exported_decls )
+        free_operators_count = len( self.__free_operators )
+        body_count = len( self.__module_body.creators )
+        ext_creators = set( map( id, self.__extmodule.creators ) )
+        log_records = _log_records_collector_t()
+        try:
+            self.curr_decl = cls
+            with log_records:
+                declarations.apply_visitor( self, cls )
+            return ( self.__module_body.creators[ body_count: ]
+                     , [ cc for cc in self.__extmodule.creators if id( cc ) not in ext_creators ]
+                     , self.__types_db
+                     , self.__dependencies_manager.exported_decls[ exported_count: ]
+                     , self.__free_operators[ free_operators_count: ]
+                     , log_records.records )
+        finally:
+            self.__types_db = types_db
+
+    def _adopt_visited_class( self, visited ):
+        """adopts the code creators, created by the worker process, and merges
+        the shared state"""
+        body_creators, ext_creators, types_db, exported, free_operators, log_records = visited
+        for record in log_records:
+            logging.getLogger( record.name ).handle( record )
+        #the opaque type registrator and the array registrator are created only
+        #once, but worker processes don't know about each other
+        registrators = self.__replaced_registrators
+        for cc in ext_creators:
+            if isinstance( cc, code_creators.opaque_type_registrator_t ):
+                registrator = self.__opaque_types_manager.adopt_registrator( cc )
+                if registrator is not cc:
+                    #the replaced registrator is kept, so its id is not reused
+                    registrators[ id( cc ) ] = ( cc, registrator )
+            else:
+                self.__extmodule.adopt_declaration_creator( cc )
+
+        duplicated_arrays = []
+        for creator in body_creators + ext_creators:
+            for cc in code_creators.make_flatten_generator( creator ):
+                if registrators and isinstance( cc, code_creators.registration_based_t ):
+                    cc.associated_decl_creators[:] \
+                        = [ registrators.get( id( associated ), ( None, associated ) )[1]
+                            for associated in cc.associated_decl_creators ]
+                if isinstance( cc, code_creators.array_1_registrator_t ) \
+                   and not self._register_array_1( cc.array_type ):
+                    duplicated_arrays.append( cc )
+        for cc in duplicated_arrays:
+            cc.parent.remove_creator( cc )
+
+        self.__module_body.adopt_creators( body_creators )
+        self.__types_db.merge( types_db )
+        self.__dependencies_manager.extend_exported( exported )
+        self.__free_operators.extend( free_operators )
+
     def create(self, decl_headers=None):
         """
         create and return the module for the extension - code creators tree root.
@@ -312,32 +588,51 @@ class bpcreator_t( declarations.decl_visitor_t ):
                              But you can pass a list of headers here to override that search.
         :rtype: :class:`code_creators.module_t`
         """
+        with profiling.phase( 'resolve call policies' ):
+            self._resolve_call_policies()
         # Invoke the appropriate visit_*() method on all decls
-        for decl in self.__decls:
-            self.curr_decl = decl
-            declarations.apply_visitor( self, decl )
-        for operator in self.__free_operators:
-            self._adopt_free_operator( operator )
-        self._treat_smart_pointers()
+        with profiling.phase( 'visit declarations' ):
+            visited = {}
+            if self.is_parallel_visit_enabled():
+                visited = self._visit_classes_in_parallel()
+            for index, decl in enumerate( self.__decls ):
+                if index in visited:
+                    self._adopt_visited_class( visited[ index ] )
+                else:
+                    self.curr_decl = decl
+                    declarations.apply_visitor( self, decl )
+        with profiling.phase( 'adopt free operators' ):
+            for operator in self.__free_operators:
+                self._adopt_free_operator( operator )
+        with profiling.phase( 'treat smart pointers' ):
+            self._treat_smart_pointers()
         if self.__enable_indexing_suite:
-            self._treat_indexing_suite()
+            with profiling.phase( 'treat indexing suite' ):
+                self._treat_indexing_suite()
+        if self.__register_buffer_converters:
+            with profiling.phase( 'register buffer converters' ):
+                self._register_buffer_converters()
         for creator in code_creators.make_flatten_generator( self.__extmodule ):
             creator.target_configuration = self.__target_configuration
         #last action.
-        self._append_user_code()
-
-        add_include = self.__extmodule.add_include
-        #add system headers
-        system_headers = self.__extmodule.get_system_files( recursive=True, unique=True, language='c++' )
-        for header in system_headers:
-            add_include( header, user_defined=False, system=True )
-        #add user defined header files
-        if decl_headers is None:
-            decl_headers = declarations.declaration_files( self.__decls )
-        for header in decl_headers:
-            add_include( header, user_defined=False, system=False )
-
-        self.__dependencies_manager.inform_user()
+        with profiling.phase( 'append user code' ):
+            self._append_user_code()
+
+        with profiling.phase( 'add includes' ):
+            add_include = self.__extmodule.add_include
+            #add system headers
+            system_headers = self.__extmodule.get_system_files( recursive=True, unique=True, language='c++' )
+            for header in system_headers:
+                add_include( header, user_defined=False, system=True )
+            #add user defined header files
+            if decl_headers is None:
+                decl_headers = declarations.declaration_files( self.__decls )
+            for header in decl_headers:
+                add_include( header, user_defined=False, system=False )
+
+        if self.__report_dependencies:
+            with profiling.phase( 'report dependencies' ):
+                self.__dependencies_manager.inform_user()
 
         return self.__extmodule
 
@@ -348,10 +643,6 @@ class bpcreator_t( declarations.decl_visitor_t ):
         if self.__fc_manager.is_fake_constructor( self.curr_decl ):
             return
 
-        fwrapper = None
-        if None is self.curr_decl.call_policies:
-            self.curr_decl.call_policies = self.__call_policies_resolver( self.curr_decl )
-
         maker_cls, fwrapper_cls = creators_wizard.find_out_mem_fun_creator_classes( self.curr_decl )
 
         maker = None
@@ -386,6 +677,21 @@ class bpcreator_t( declarations.decl_visitor_t ):
                                                                , function_code_creator=maker )
                 self.curr_code_creator.adopt_creator( static_method )
 
+        if self.curr_decl.batch_transformation:
+            self._add_batch_entry_point()
+
+    def _add_batch_entry_point( self ):
+        #exposes the function, which calls the current function for every item of the buffers
+        wrapper = code_creators.batch_fun_wrapper_t( self.curr_decl )
+        self.__extmodule.adopt_declaration_creator( wrapper )
+        maker = code_creators.batch_fun_t( self.curr_decl, wrapper )
+        maker.associated_decl_creators.append( wrapper )
+        self.curr_code_creator.adopt_creator( maker )
+        if isinstance( self.curr_decl.parent, declarations.class_t ):
+            static_method = code_creators.static_method_t( function=self.curr_decl
+                                                           , function_code_creator=maker )
+            self.curr_code_creator.adopt_creator( static_method )
+
     def visit_constructor( self ):
         self.__types_db.update( self.curr_decl )
         self.__dependencies_manager.add_exported( self.curr_decl )
@@ -410,8 +716,6 @@ class bpcreator_t( declarations.decl_visitor_t ):
             #~ maker = code_creators.constructor_transformed_t( constructor=self.curr_decl )
         #~ else:
         maker = code_creators.constructor_t( constructor=self.curr_decl, wrapper=cwrapper )
-        if None is self.curr_decl.call_policies:
-            self.curr_decl.call_policies = self.__call_policies_resolver( self.curr_decl )
         self.curr_code_creator.adopt_creator( maker )
 
         if self.curr_decl.allow_implicit_conversion:
@@ -434,9 +738,6 @@ class bpcreator_t( declarations.decl_visitor_t ):
 
     def visit_casting_operator( self ):
         self.__dependencies_manager.add_exported( self.curr_decl )
-        if None is self.curr_decl.call_policies:
-            self.curr_decl.call_policies = self.__call_policies_resolver( self.curr_decl )
-
         self.__types_db.update( self.curr_decl )
         if not self.curr_decl.parent.is_abstract and not declarations.is_reference( self.curr_decl.return_type ):
             maker = code_creators.casting_operator_t( operator=self.curr_decl )
@@ -470,8 +771,6 @@ class bpcreator_t( declarations.decl_visitor_t ):
                     for f in overloads:
                         self.__types_db.update( f )
                         self.__dependencies_manager.add_exported( f )
-                        if None is f.call_policies:
-                            f.call_policies = self.__call_policies_resolver( f )
 
                     overloads_cls_creator = code_creators.free_fun_overloads_class_t( overloads )
                     self.__extmodule.adopt_declaration_creator( overloads_cls_creator )
@@ -484,17 +783,13 @@ class bpcreator_t( declarations.decl_visitor_t ):
                     ctext_t = code_creators.custom_text_t
                     for f in overloads:
                         uc_creators = [ctext_t( uc.text ) for uc in f.declaration_code]
-                        insert_pos = self.__extmodule.creators.index( self.__module_body )
-                        self.__extmodule.adopt_creators( uc_creators, insert_pos )
+                        self.__extmodule.adopt_creators_before( uc_creators, self.__module_body )
                         overloads_reg.associated_decl_creators.extend( uc_creators )
         else:
             self.__types_db.update( self.curr_decl )
             self.__dependencies_manager.add_exported( self.curr_decl )
-            if None is self.curr_decl.call_policies:
-                self.curr_decl.call_policies = self.__call_policies_resolver( self.curr_decl )
-
             maker = None
-            if self.curr_decl.transformations:
+            if self.curr_decl.exported_transformations:
                 wrapper = code_creators.free_fun_transformed_wrapper_t( self.curr_decl )
                 self.__extmodule.adopt_declaration_creator( wrapper )
                 maker = code_creators.free_fun_transformed_t( self.curr_decl, wrapper )
@@ -504,10 +799,12 @@ class bpcreator_t( declarations.decl_visitor_t ):
             self.curr_code_creator.adopt_creator( maker )
             self.__opaque_types_manager.register_opaque( maker, self.curr_decl )
 
+            if self.curr_decl.batch_transformation:
+                self._add_batch_entry_point()
+
             ctext_t = code_creators.custom_text_t
             uc_creators = [ctext_t( uc.text ) for uc in self.curr_decl.declaration_code]
-            insert_pos = self.__extmodule.creators.index( self.__module_body )
-            self.__extmodule.adopt_creators( uc_creators, insert_pos )
+            self.__extmodule.adopt_creators_before( uc_creators, self.__module_body )
             maker.associated_decl_creators.extend( uc_creators )
 
     def visit_free_operator( self ):
@@ -542,8 +839,6 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 for f in overloads:
                     self.__types_db.update( f )
                     self.__dependencies_manager.add_exported( f )
-                    if None is f.call_policies:
-                        f.call_policies = self.__call_policies_resolver( f )
 
                 overloads_cls_creator = code_creators.mem_fun_overloads_class_t( overloads )
                 self.__extmodule.adopt_declaration_creator( overloads_cls_creator )
@@ -624,9 +919,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
         #all static_methods_t should be moved to the end
         #better approach is to move them after last def of relevant function
         static_methods = [creator for creator in cls_cc.creators if isinstance( creator, code_creators.static_method_t )]
-        for static_method in static_methods:
-            cls_cc.remove_creator( static_method )
-            cls_cc.adopt_creator( static_method )
+        cls_cc.move_creators( static_methods )
 
         if cls_decl.exception_translation_code:
             translator = code_creators.exception_translator_t( cls_decl )
@@ -715,14 +1008,10 @@ class bpcreator_t( declarations.decl_visitor_t ):
             elif declarations.is_array( self.curr_decl.type ):
                 wrapper = code_creators.array_mv_wrapper_t( variable=self.curr_decl )
                 maker = code_creators.array_mv_t( variable=self.curr_decl, wrapper=wrapper )
-            elif declarations.is_pointer( self.curr_decl.type ):
+            elif self.__type_traits.is_pointer( self.curr_decl.type ):
                 wrapper = code_creators.member_variable_wrapper_t( variable=self.curr_decl )
                 maker = code_creators.member_variable_t( variable=self.curr_decl, wrapper=wrapper )
             elif declarations.is_reference( self.curr_decl.type ):
-                if None is self.curr_decl.getter_call_policies:
-                    self.curr_decl.getter_call_policies = self.__call_policies_resolver( self.curr_decl, 'get' )
-                if None is self.curr_decl.setter_call_policies:
-                    self.curr_decl.setter_call_policies = self.__call_policies_resolver( self.curr_decl, 'set' )
                 wrapper = code_creators.mem_var_ref_wrapper_t( variable=self.curr_decl )
                 maker = code_creators.mem_var_ref_t( variable=self.curr_decl, wrapper=wrapper )
                 self.__opaque_types_manager.register_opaque( maker, self.curr_decl )
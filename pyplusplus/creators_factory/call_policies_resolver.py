@@ -12,25 +12,29 @@ from pyplusplus.decl_wrappers import python_traits
 #TODO: add opaque to documentation
 
 class resolver_t( object ):
-    def __init__( self ):
+    def __init__( self, type_traits_cache=None ):
         object.__init__( self )
+        #the cache methods have the same names as the pygccxml type traits
+        self._type_traits = type_traits_cache
+        if None is self._type_traits:
+            self._type_traits = declarations
 
     def __call__(self, decl, hint=None):
         raise NotImplementedError()
 
 class default_policy_resolver_t(resolver_t):
-    def __init__( self ):
-        resolver_t.__init__( self )
+    def __init__( self, type_traits_cache=None ):
+        resolver_t.__init__( self, type_traits_cache )
         self.__const_char_pointer \
             = declarations.pointer_t( declarations.const_t( declarations.char_t() ) )
 
     def _resolve_by_type( self, some_type ):
-        temp_type = declarations.remove_alias( some_type )
-        temp_type = declarations.remove_cv( temp_type )
+        temp_type = self._type_traits.remove_alias( some_type )
+        temp_type = self._type_traits.remove_cv( temp_type )
         if isinstance( temp_type, declarations.fundamental_t ) \
            or isinstance( temp_type, declarations.declarated_t ):
             return decl_wrappers.default_call_policies()
-        if declarations.is_same( some_type, self.__const_char_pointer ):
+        if self._type_traits.is_same( some_type, self.__const_char_pointer ):
             return decl_wrappers.default_call_policies()
         return None
 
@@ -47,8 +51,10 @@ class default_policy_resolver_t(resolver_t):
             return decl_wrappers.default_call_policies()
 
 class void_pointer_resolver_t(resolver_t):
-    def __init__( self ):
-        resolver_t.__init__( self )
+    def __init__( self, type_traits_cache=None ):
+        resolver_t.__init__( self, type_traits_cache )
+        self.__void_ptr = declarations.pointer_t( declarations.void_t() )
+        self.__const_void_ptr = declarations.pointer_t( declarations.const_t( declarations.void_t() ) )
 
     def __call__( self, calldef, hint=None ):
         if not isinstance( calldef, declarations.calldef_t ):
@@ -56,17 +62,15 @@ class void_pointer_resolver_t(resolver_t):
 
         if isinstance( calldef, declarations.constructor_t ):
             return None
-        return_type = declarations.remove_alias( calldef.return_type )
-        void_ptr = declarations.pointer_t( declarations.void_t() )
-        const_void_ptr = declarations.pointer_t( declarations.const_t( declarations.void_t() ) )
-        if declarations.is_same( return_type, void_ptr ) \
-           or declarations.is_same( return_type, const_void_ptr ):
+        return_type = self._type_traits.remove_alias( calldef.return_type )
+        if self._type_traits.is_same( return_type, self.__void_ptr ) \
+           or self._type_traits.is_same( return_type, self.__const_void_ptr ):
             return decl_wrappers.return_value_policy( decl_wrappers.return_opaque_pointer )
         return None
 
 class return_value_policy_resolver_t(resolver_t):
-    def __init__( self ):
-        resolver_t.__init__( self )
+    def __init__( self, type_traits_cache=None ):
+        resolver_t.__init__( self, type_traits_cache )
         self.__const_wchar_pointer \
             = declarations.pointer_t( declarations.const_t( declarations.wchar_t() ) )
         
@@ -77,12 +81,12 @@ class return_value_policy_resolver_t(resolver_t):
         if isinstance( calldef, declarations.constructor_t ):
             return None
 
-        return_type = declarations.remove_alias( calldef.return_type )
+        return_type = self._type_traits.remove_alias( calldef.return_type )
         if isinstance( return_type, declarations.reference_t ) \
            and isinstance( return_type.base, declarations.const_t ):
             return decl_wrappers.return_value_policy( decl_wrappers.copy_const_reference )
 
-        if declarations.is_same( return_type, self.__const_wchar_pointer ):
+        if self._type_traits.is_same( return_type, self.__const_wchar_pointer ):
             return decl_wrappers.return_value_policy( decl_wrappers.return_by_value )
         
         if opaque_types_manager.find_out_opaque_decl( return_type, ensure_opaque_decl=True ):
@@ -91,8 +95,8 @@ class return_value_policy_resolver_t(resolver_t):
         return None
         
 class return_internal_reference_resolver_t( resolver_t ):
-    def __init__( self ):    
-        resolver_t.__init__( self )
+    def __init__( self, type_traits_cache=None ):
+        resolver_t.__init__( self, type_traits_cache )
         
     def __call__(self, calldef, hint=None):
         if not isinstance( calldef, declarations.calldef_t ):
@@ -104,7 +108,7 @@ class return_internal_reference_resolver_t( resolver_t ):
         if calldef.symbol != '[]':
             return None
             
-        return_type = declarations.remove_cv( calldef.return_type )
+        return_type = self._type_traits.remove_cv( calldef.return_type )
         if declarations.is_reference( return_type ): 
             return_type = declarations.remove_reference( return_type )
         if python_traits.is_immutable( return_type ):
@@ -129,8 +133,8 @@ class return_self_resolver_t( resolver_t ):
         return decl_wrappers.return_self()
 
 class variable_accessors_resolver_t( resolver_t ):
-    def __init__( self ):    
-        resolver_t.__init__( self )
+    def __init__( self, type_traits_cache=None ):
+        resolver_t.__init__( self, type_traits_cache )
     
     def __call__( self, variable, hint=None ):
         if not isinstance( variable, declarations.variable_t ):
@@ -151,7 +155,7 @@ class variable_accessors_resolver_t( resolver_t ):
         if not isinstance( base_type, declarations.declarated_t ):
             return None
         
-        base_type = declarations.remove_alias( base_type )
+        base_type = self._type_traits.remove_alias( base_type )
         decl = base_type.declaration
         
         if declarations.is_class_declaration( decl ):
@@ -174,15 +178,15 @@ class variable_accessors_resolver_t( resolver_t ):
             return decl_wrappers.default_call_policies()
 
 class built_in_resolver_t(resolver_t):
-    def __init__( self, config=None):
-        resolver_t.__init__( self )
-        self.__resolvers = [ default_policy_resolver_t()
-                             , return_value_policy_resolver_t() ]        
+    def __init__( self, config=None, type_traits_cache=None ):
+        resolver_t.__init__( self, type_traits_cache )
+        self.__resolvers = [ default_policy_resolver_t( type_traits_cache )
+                             , return_value_policy_resolver_t( type_traits_cache ) ]
         assert not config or isinstance( config, code_creators.target_configuration_t )
         if not config or config.boost_python_supports_void_ptr:
-            self.__resolvers.append( void_pointer_resolver_t() )
-        self.__resolvers.append( return_internal_reference_resolver_t() )
-        self.__resolvers.append( variable_accessors_resolver_t() )
+            self.__resolvers.append( void_pointer_resolver_t( type_traits_cache ) )
+        self.__resolvers.append( return_internal_reference_resolver_t( type_traits_cache ) )
+        self.__resolvers.append( variable_accessors_resolver_t( type_traits_cache ) )
         self.__resolvers.append( return_self_resolver_t() )        
 
     def __call__( self, calldef, hint=None ):
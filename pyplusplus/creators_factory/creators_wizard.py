@@ -20,24 +20,25 @@ def find_out_mem_fun_creator_classes( decl ):
     maker_cls = None
     fwrapper_cls = None
     access_level = decl.parent.find_out_member_access_type( decl )
-    if len( decl.transformations ) not in ( 0, 1 ):
+    transformations = decl.exported_transformations
+    if len( transformations ) not in ( 0, 1 ):
         raise RuntimeError( "Right now `Py++` does not support multiple transformation applied on a single function." )
     if access_level == ACCESS_TYPES.PUBLIC:
         if decl.virtuality == VIRTUALITY_TYPES.NOT_VIRTUAL:
-            if decl.transformations:
+            if transformations:
                 maker_cls = code_creators.mem_fun_transformed_t
                 fwrapper_cls = code_creators.mem_fun_transformed_wrapper_t
             else:
                 maker_cls = code_creators.mem_fun_t
         elif decl.virtuality == VIRTUALITY_TYPES.PURE_VIRTUAL:
-            if decl.transformations:
+            if transformations:
                 maker_cls = code_creators.mem_fun_v_transformed_t
                 fwrapper_cls = code_creators.mem_fun_v_transformed_wrapper_t
             else:
                 fwrapper_cls = code_creators.mem_fun_pv_wrapper_t
                 maker_cls = code_creators.mem_fun_pv_t
         else:
-            if decl.transformations:
+            if transformations:
                 fwrapper_cls = code_creators.mem_fun_v_transformed_wrapper_t
                 maker_cls = code_creators.mem_fun_v_transformed_t
             else:
@@ -52,16 +52,48 @@ duplicated_wrapper_aliases_reporter \
 
 
 class manager_t( object ):
+    """
+    collects the exported declarations and reports the declarations, they
+    depend on, which were not exported
+
+    The dependencies graph is built once, when the report is requested, so
+    the report could be skipped, or produced later, on demand.
+    """
+
     def __init__( self, logger ):
         object.__init__( self )
         self.__exported_decls = []
+        self.__exported_ids = set()
         self.__logger = logger
+        self.__used_not_exported = None #[ ( dependency, depend on it declarations ) ]
 
     def add_exported( self, decl ):
-        self.__exported_decls.append( decl )
+        if id( decl ) in self.__exported_ids:
+            return
+        self.__add_exported( decl )
         if isinstance( decl, declarations.class_t ) and decl.indexing_suite:
+            #the query is recursive, so the internal declarations of the nested
+            #classes are included too
             included_decls = decl.decls( lambda d: d.ignore==False, allow_empty=True, recursive=True )
-            for decl in included_decls: self.add_exported(decl)
+            for included in included_decls:
+                if id( included ) not in self.__exported_ids:
+                    self.__add_exported( included )
+
+    def __add_exported( self, decl ):
+        self.__exported_decls.append( decl )
+        self.__exported_ids.add( id( decl ) )
+        self.__used_not_exported = None
+
+    @property
+    def exported_decls( self ):
+        """list of the exported declarations, in the order they were added"""
+        return self.__exported_decls
+
+    def extend_exported( self, decls ):
+        """adds the declarations, collected by other manager"""
+        for decl in decls:
+            if id( decl ) not in self.__exported_ids:
+                self.__add_exported( decl )
 
     def __is_std_decl( self, decl ):
         #Every class under std should be exported by Boost.Python and\\or `Py++`
@@ -89,14 +121,23 @@ class manager_t( object ):
 
         return dependencies
 
-    def __has_unexposed_dependency( self, exported_ids, depend_on_decl, dependency ):
+    def __resolve_dependency_target( self, depend_on_decl, targets ):
+        #returns the declaration, which should be exported, or None. The answer
+        #doesn't depend on the dependency, so it is calculated once per declaration
+        key = id( depend_on_decl )
+        if key in targets:
+            return targets[ key ]
+        targets[ key ] = target = self.__find_out_dependency_target( depend_on_decl, targets )
+        return target
+
+    def __find_out_dependency_target( self, depend_on_decl, targets ):
         sptr_traits = declarations.smart_pointer_traits
 
         if None is depend_on_decl:
-            return
+            return None
 
         if self.__is_std_decl( depend_on_decl ):
-            return
+            return None
 
         if sptr_traits.is_smart_pointer( depend_on_decl ):
             try:
@@ -105,64 +146,95 @@ class manager_t( object ):
                     value_type = declarations.remove_cv( value_type )
                     value_type = declarations.remove_declarated( value_type )
                 if isinstance( value_type, declarations.declaration_t ):
-                    return self.__has_unexposed_dependency( exported_ids, value_type, dependency )
+                    return self.__resolve_dependency_target( value_type, targets )
             except RuntimeError:
                 pass
 
         if isinstance( depend_on_decl, decl_wrappers.decl_wrapper_t ):
             if depend_on_decl.already_exposed:
-                return
+                return None
             if isinstance( depend_on_decl, declarations.class_types ):
                 if depend_on_decl.opaque:
-                    return
-                if dependency.hint == "base class":
-                    return #base class for some class don't have to be exported
+                    return None
             if isinstance( depend_on_decl, declarations.variable_t ):
-                if not decl.expose_value:
-                    return
+                if not depend_on_decl.expose_value:
+                    return None
+        return depend_on_decl
+
+    def __is_relevant_dependency( self, target, dependency ):
+        if isinstance( target, decl_wrappers.decl_wrapper_t ) \
+           and isinstance( target, declarations.class_types ) \
+           and dependency.hint == "base class":
+            return False #base class for some class don't have to be exported
 
         if isinstance( dependency.decl, declarations.variable_t ):
             #the only dependency of the variable is its type
             if not dependency.decl.expose_value:
-                return
+                return False
 
         if dependency.hint == "return type":
             #in this case we don't check, the return type but the function
             if isinstance( dependency.decl, declarations.calldef_t ):
                 if dependency.decl.return_type and dependency.decl.call_policies \
                    and decl_wrappers.is_return_opaque_pointer_policy( dependency.decl.call_policies ):
-                   return
+                   return False
+        return True
 
-        return id( depend_on_decl ) not in exported_ids
+    def __is_w1040_enabled( self, decl, enabled ):
+        #the messages are disabled globally or per declaration, the most
+        #declarations don't disable messages, so they share the answer
+        key = id( decl ) if decl.disabled_messages else None
+        if key not in enabled:
+            enabled[ key ] = bool( messages.filter_disabled_msgs( [messages.W1040], decl.disabled_messages ) )
+        return enabled[ key ]
 
     def __find_out_used_but_not_exported( self ):
         used_not_exported = []
-        exported_ids = set( [id( d ) for d in self.__exported_decls] )
+        targets = {} #id( depend on it declaration ) : declaration, which should be exported, or None
+        enabled = {} #id( declaration ) or None : whether W1040 should be reported
         for decl in self.__exported_decls:
             for dependency in self.__build_dependencies( decl ):
-                for depend_on_decl in dependency.find_out_depend_on_it_declarations():
-                    if self.__has_unexposed_dependency( exported_ids, depend_on_decl, dependency ):
-                        if messages.filter_disabled_msgs([messages.W1040], depend_on_decl.disabled_messages ):
-                            #need to report dependency errors
-                            used_not_exported.append(dependency)
+                depend_on_decls = dependency.find_out_depend_on_it_declarations()
+                for depend_on_decl in depend_on_decls:
+                    target = self.__resolve_dependency_target( depend_on_decl, targets )
+                    if None is target or id( target ) in self.__exported_ids:
+                        continue
+                    if not self.__is_relevant_dependency( target, dependency ):
+                        continue
+                    if self.__is_w1040_enabled( depend_on_decl, enabled ):
+                        #need to report dependency errors
+                        used_not_exported.append( ( dependency, depend_on_decls ) )
         return used_not_exported
 
+    @property
+    def used_but_not_exported( self ):
+        """list of ( dependency, declarations ), which describe the unexposed
+        declarations, the exported ones depend on
+
+        The list is calculated on demand and is cached, until new declaration
+        is exported.
+        """
+        if None is self.__used_not_exported:
+            self.__used_not_exported = self.__find_out_used_but_not_exported()
+        return self.__used_not_exported
+
     def __group_by_unexposed( self, dependencies ):
         groups = {}
-        for dependency in dependencies:
-            for depend_on_decl in dependency.find_out_depend_on_it_declarations():
+        for dependency, depend_on_decls in dependencies:
+            for depend_on_decl in depend_on_decls:
                 if id( depend_on_decl ) not in groups:
                     groups[ id( depend_on_decl ) ] = []
-                groups[ id( depend_on_decl ) ].append( dependency )
+                groups[ id( depend_on_decl ) ].append( ( dependency, depend_on_decls ) )
         return groups
 
     def __create_dependencies_msg( self, dependencies ):
         msg = []
-        for depend_on_decl in dependencies[0].find_out_depend_on_it_declarations():
-            decls = []
-            for dependency in dependencies:
-                decls.append( os.linesep + ' ' + str( dependency.declaration ) )
-            msg.append( "%s;%s" % ( depend_on_decl, messages.W1040 % ''.join( decls ) ) )
+        decls = []
+        for dependency, depend_on_decls in dependencies:
+            decls.append( os.linesep + ' ' + str( dependency.declaration ) )
+        decls = ''.join( decls )
+        for depend_on_decl in dependencies[0][1]:
+            msg.append( "%s;%s" % ( depend_on_decl, messages.W1040 % decls ) )
         return os.linesep.join( msg )
 
     def __report_duplicated_aliases( self ):
@@ -197,8 +269,9 @@ class manager_t( object ):
             dwar.report( self.__logger )
 
     def inform_user( self ):
-        used_not_exported_decls = self.__find_out_used_but_not_exported()
-        groups = self.__group_by_unexposed( used_not_exported_decls )
+        """reports the unexposed declarations, the exported ones depend on,
+        and the duplicated aliases"""
+        groups = self.__group_by_unexposed( self.used_but_not_exported )
         for group in groups.values():
             self.__logger.warn( self.__create_dependencies_msg( group ) )
         self.__report_duplicated_aliases()
@@ -80,3 +80,13 @@ class manager_t( object ):
             else:
                 opaque_type_registrator = self.__exposed_opaque_decls[ id(decl) ]
             creator.associated_decl_creators.append(opaque_type_registrator)
+
+    def adopt_registrator( self, registrator ):
+        """adopts the registrator, created by other manager, and returns the
+        registrator, which should be used for the declaration"""
+        decl_id = id( registrator.declaration )
+        if decl_id in self.__exposed_opaque_decls:
+            return self.__exposed_opaque_decls[ decl_id ]
+        self.__exposed_opaque_decls[ decl_id ] = registrator
+        self.__extmodule.adopt_declaration_creator( registrator )
+        return registrator
@@ -12,10 +12,14 @@ class COLOR:
     BLACK = 2
 
 class class_organizer_t(object):
-    def __init__( self, decls, include_vars=False):
+    def __init__( self, decls, include_vars=False, type_traits_cache=None ):
         object.__init__( self )
 
         self.__include_vars = include_vars
+        #the cache methods have the same names as the pygccxml type traits
+        self.__type_traits = type_traits_cache
+        if None is self.__type_traits:
+            self.__type_traits = declarations
         self.__classes = [x for x in decls if isinstance( x, declarations.class_t )]
         self.__classes.sort( key = lambda cls: cls.decl_string )
         self.__dependencies_graph = self._build_graph()
@@ -56,9 +60,9 @@ class class_organizer_t(object):
                     continue
                 if not arg.default_value:
                     continue
-                if declarations.is_pointer( arg.type ) and arg.default_value == 0:
+                if self.__type_traits.is_pointer( arg.type ) and arg.default_value == 0:
                     continue
-                base_type = declarations.base_type( arg.type )
+                base_type = self.__type_traits.base_type( arg.type )
                 if not isinstance( base_type, declarations.declarated_t ):
                     continue
                 top_class_inst = self.__get_top_class_inst( base_type.declaration )
@@ -68,9 +72,9 @@ class class_organizer_t(object):
         if self.__include_vars:
             vars = [decl for decl in declarations.make_flatten( class_ ) if isinstance( decl, declarations.variable_t )]
             for var in vars:
-                if declarations.is_pointer( var.type ):
+                if self.__type_traits.is_pointer( var.type ):
                     continue
-                base_type = declarations.base_type( var.type )
+                base_type = self.__type_traits.base_type( var.type )
                 if not isinstance( base_type, declarations.declarated_t ):
                     continue
                 top_class_inst = self.__get_top_class_inst( base_type.declaration )
@@ -217,8 +221,8 @@ class calldef_organizer_t( object ):
         result = self.join_groups(groups)
         return result
 
-def sort_classes( classes, include_vars=False ):
-    organizer = class_organizer_t( classes, include_vars=include_vars )
+def sort_classes( classes, include_vars=False, type_traits_cache=None ):
+    organizer = class_organizer_t( classes, include_vars=include_vars, type_traits_cache=type_traits_cache )
     return organizer.desired_order()
 
 def sort_calldefs( decls ):
@@ -228,9 +232,9 @@ USE_CALLDEF_ORGANIZER = False
 #If you understand what problem calldef_organizer_t solves, than may be you should
 #use this.
 
-def sort( decls ):
+def sort( decls, type_traits_cache=None ):
     classes = [x for x in decls if isinstance( x, declarations.class_t )]
-    ordered = sort_classes( classes )
+    ordered = sort_classes( classes, type_traits_cache=type_traits_cache )
 
     ids = set( [ id( inst ) for inst in ordered ] )
     for decl in decls:
@@ -0,0 +1,68 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which memoises the most frequently used pygccxml type traits"""
+
+from pygccxml import declarations
+
+class type_traits_cache_t( object ):
+    """
+    memoises pygccxml type traits, while the code creators tree is built
+
+    :class:`bpcreator_t`, the call policies resolvers and the classes organizer
+    call :func:`declarations.remove_alias`, :func:`declarations.base_type` and
+    few other type traits on the same type instances thousands of times. They
+    call the methods of this class, if the cache is passed to them. The methods
+    have the same names and arguments as the pygccxml functions and remember
+    the result for every type instance. The cache keeps a reference to the type,
+    so its `id` could not be reused.
+
+    The result depends on the declarations tree, so the cache should be cleared,
+    when the declarations are changed. :class:`module_builder.module_builder_t`
+    owns the cache and clears it, when :meth:`build_code_creator` returns.
+    """
+
+    def __init__( self ):
+        object.__init__( self )
+        self.__cache = {} #( trait, ids of the types ) : ( types, result )
+        self.hits = 0
+        self.misses = 0
+
+    def __call_trait( self, trait, *types ):
+        key = ( trait, ) + tuple( map( id, types ) )
+        try:
+            result = self.__cache[ key ][1]
+            self.hits += 1
+            return result
+        except KeyError:
+            pass
+        result = trait( *types )
+        self.misses += 1
+        self.__cache[ key ] = ( types, result )
+        return result
+
+    def remove_alias( self, type_ ):
+        """memoised :func:`declarations.remove_alias`"""
+        return self.__call_trait( declarations.remove_alias, type_ )
+
+    def base_type( self, type_ ):
+        """memoised :func:`declarations.base_type`"""
+        return self.__call_trait( declarations.base_type, type_ )
+
+    def is_pointer( self, type_ ):
+        """memoised :func:`declarations.is_pointer`"""
+        return self.__call_trait( declarations.is_pointer, type_ )
+
+    def remove_cv( self, type_ ):
+        """memoised :func:`declarations.remove_cv`"""
+        return self.__call_trait( declarations.remove_cv, type_ )
+
+    def is_same( self, type1, type2 ):
+        """memoised :func:`declarations.is_same`"""
+        return self.__call_trait( declarations.is_same, type1, type2 )
+
+    def clear( self ):
+        """clears the cache"""
+        self.__cache.clear()
@@ -19,6 +19,8 @@ class types_database_t( object ):
         self.__fundamental_strs = list(declarations.FUNDAMENTAL_TYPES.keys())
         self.__normalize_data = [ ',', '<', '>', '*', '&', '(', ')', '::' ]
         self.__containers = set()
+        self.__buffer_convertibles = {} #decl_string : type
+        self.__fixed_arrays = [ 'boost::array', 'std::array', 'std::tr1::array' ]
 
     def update_containers( self, decl ):
         assert decl.indexing_suite
@@ -30,6 +32,7 @@ class types_database_t( object ):
                 self._update_db( self.__return_types, decl.return_type )
             for arg in decl.arguments:
                 self._update_db( self.__arguments_types, arg.type )
+                self._update_buffer_convertibles_db( arg.type )
         elif isinstance( decl, declarations.variable_t ):
             self._update_db( self.__variables, decl.type )
         else:
@@ -86,6 +89,44 @@ class types_database_t( object ):
         return True
 
 
+    def _is_buffer_item( self, type_, allow_bool ):
+        type_ = declarations.remove_alias( type_ )
+        if not declarations.is_arithmetic( type_ ):
+            return False
+        return allow_bool or not declarations.is_bool( type_ )
+
+    def _update_buffer_convertibles_db( self, type_ ):
+        #std::vector and fixed size arrays of fundamental types, passed by value
+        #or by const reference, could be constructed from the buffer
+        type_ = declarations.remove_alias( type_ )
+        if declarations.is_reference( type_ ):
+            type_ = declarations.remove_reference( type_ )
+            if not declarations.is_const( type_ ):
+                return
+        type_ = declarations.remove_cv( type_ )
+        if not declarations.is_class( type_ ):
+            return
+        decl_string = type_.decl_string
+        if decl_string in self.__buffer_convertibles:
+            return
+        if declarations.vector_traits.is_my_case( type_ ):
+            try:
+                item_type = declarations.vector_traits.element_type( type_ )
+            except RuntimeError:
+                return
+            if not self._is_buffer_item( item_type, allow_bool=False ):
+                return
+        elif templates.is_instantiation( decl_string ):
+            name, args = templates.split( decl_string )
+            if self._normalize( name ) not in self.__fixed_arrays or 2 != len( args ):
+                return
+            item_type = declarations.FUNDAMENTAL_TYPES.get( self._normalize( args[0] ) )
+            if None is item_type or not self._is_buffer_item( item_type, allow_bool=True ):
+                return
+        else:
+            return
+        self.__buffer_convertibles[ decl_string ] = type_
+
     def _update_db( self, db, type_ ):
         if self._update_containers_db( type_ ):
             return
@@ -104,6 +145,22 @@ class types_database_t( object ):
             if (smart_ptr, type_) not in db[pointee]:
                 db[ pointee ].append( (smart_ptr, type_) )
 
+    def merge( self, other ):
+        """adds the types, collected by other database, to this one"""
+        dbs = [ ( self.__variables, other.__variables )
+                , ( self.__return_types, other.__return_types )
+                , ( self.__arguments_types, other.__arguments_types ) ]
+        for db, other_db in dbs:
+            for pointee, entries in other_db.items():
+                if pointee not in db:
+                    db[ pointee ] = []
+                for entry in entries:
+                    if entry not in db[ pointee ]:
+                        db[ pointee ].append( entry )
+        self.__containers.update( other.__containers )
+        for decl_string, type_ in other.__buffer_convertibles.items():
+            self.__buffer_convertibles.setdefault( decl_string, type_ )
+
     def _find_smart_ptrs( self, db, class_decl ):
         decl_string = self._normalize( class_decl.decl_string )
         if decl_string in db:
@@ -185,3 +242,9 @@ class types_database_t( object ):
         return self.__containers
     used_containers = property( _get_used_containers)
 
+    @property
+    def buffer_convertibles( self ):
+        """list of `std::vector` and fixed size arrays of fundamental types, used
+        as arguments, which could be constructed from the buffer protocol objects"""
+        return [ self.__buffer_convertibles[ key ] for key in sorted( self.__buffer_convertibles.keys() ) ]
+
@@ -48,6 +48,21 @@ def creators_affect_on_me( me ):
             return self._get_definition_set( self._creator )
     return impl( me ).affect_creators()
 
+def namespace_aliases_affect_on_me( me ):
+    """
+    find all namespace aliases, which influence on code generated by "me".
+
+    The function returns the namespace_alias_t creators of :func:`creators_affect_on_me`,
+    in the same order, but it uses the aliases index, maintained by every
+    compound code creator, instead of walking over all left siblings.
+    """
+    answer = []
+    child = me
+    while child and child.parent:
+        answer.extend( child.parent.namespace_aliases_before( child ) )
+        child = child.parent
+    return answer
+
 __RE_VALID_IDENTIFIER = re.compile( r"[_a-z]\w*", re.I | re.L | re.U )
 def create_valid_name(name):
     """
@@ -87,11 +102,8 @@ def create_valid_name(name):
 def create_identifier(creator, full_name ):
     """Return new full name, which takes into account namespace aliases"""
 
-    from pyplusplus import code_creators
-    dset = creators_affect_on_me( creator )
-    dset = [x for x in dset if isinstance( x, code_creators.namespace_alias_t )]
     full_name = full_name.lstrip( '::' )
-    for nsalias in dset:
+    for nsalias in namespace_aliases_affect_on_me( creator ):
         fnsname = nsalias.full_namespace_name + '::'
         if full_name.startswith( fnsname ):
             new_name = nsalias.alias + '::' + full_name[ len(fnsname) :  ]
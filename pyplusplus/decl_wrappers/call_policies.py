@@ -371,11 +371,12 @@ class return_range_t( call_policy_t ):
     For complete documentation and usage example see "Call policies" document.
     """
     HEADER_FILE = "__return_range.pypp.hpp"
-    def __init__( self, get_size_class, value_type, value_policies):
+    def __init__( self, get_size_class, value_type, value_policies, as_buffer=False):
         call_policy_t.__init__( self )
         self._value_type = value_type
         self._get_size_class = get_size_class
         self._value_policies = value_policies
+        self._as_buffer = as_buffer
 
     def is_predefined( self ):
         """Returns True if call policy is defined in Boost.Python library, False otherwise"""
@@ -404,21 +405,39 @@ class return_range_t( call_policy_t ):
         self._value_policies = new_value_policies
     value_policies = property( _get_value_policies, _set_value_policies )
 
+    def _get_as_buffer( self ):
+        return self._as_buffer
+    def _set_as_buffer( self, as_buffer ):
+        self._as_buffer = as_buffer
+    as_buffer = property( _get_as_buffer, _set_as_buffer
+                          , doc="if True, the array is returned as memoryview, which doesn't copy it" )
+
     def _create_impl(self, function_creator ):
+        if self.as_buffer:
+            name = algorithm.create_identifier( function_creator, '::pyplusplus::call_policies::return_range_buffer' )
+            return declarations.templates.join( name, [ self.get_size_class, self.value_type.decl_string ] )
         name = algorithm.create_identifier( function_creator, '::pyplusplus::call_policies::return_range' )
         args = [ self.get_size_class, self.value_type.decl_string ]
         if not self.value_policies.is_default():
             args.append( self.value_policies.create_type() )
         return declarations.templates.join( name, args )
 
-def return_range( function, get_size_class, value_policies=None ):
-    """create `Py++` defined return_range call policies code generator"""
+def return_range( function, get_size_class, value_policies=None, as_buffer=False ):
+    """create `Py++` defined return_range call policies code generator
+
+    If `as_buffer` is True, the array is returned as memoryview, which refers
+    to the native array, without copying it. The memoryview keeps alive the
+    first argument of the function( "self" ). It is read-only, if the array
+    items are const.
+    """
     r_type = function.return_type
     if not declarations.is_pointer( r_type ):
         raise TypeError( 'Function "%s" return type should be pointer, got "%s"'
                          % r_type.decl_string )
 
     value_type = declarations.remove_pointer( r_type )
+    if as_buffer:
+        return return_range_t( get_size_class, value_type, default_call_policies(), as_buffer )
     if None is value_policies:
         if python_traits.is_immutable( value_type ):
             value_policies = default_call_policies()
@@ -34,6 +34,10 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
         self._overridable = None
         self._non_overridable_reason = None
         self._transformations = None
+        self._release_gil = False
+        self._release_gil_transformation = None
+        self._cache_override = False
+        self._batch_transformation = None
 
     def get_call_policies(self):
         return self._call_policies
@@ -81,6 +85,25 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
                                          +"Thus, the generated code is safe, when a user creates function overloading." \
                                          +"Default value is computed, based on information from the declarations tree" )
 
+    def _get_release_gil(self):
+        return self._release_gil
+    def _set_release_gil(self, release_gil):
+        self._release_gil = release_gil
+    release_gil = property( _get_release_gil, _set_release_gil
+                            , doc="boolean, if True, the GIL is released, while the function is executed. " \
+                                 +"The arguments are converted and the result is converted back with the GIL held. " \
+                                 +"Applies to public member and free functions only. Default value is False." )
+
+    def _get_cache_override(self):
+        return self._cache_override
+    def _set_cache_override(self, cache_override):
+        self._cache_override = cache_override
+    cache_override = property( _get_cache_override, _set_cache_override
+                               , doc="boolean, if True, the wrapper of the virtual function remembers, per Python class, " \
+                                    +"whether the function is overridden, so the Python attribute lookup is skipped, " \
+                                    +"when it is not. Functions, assigned to the instances, are not taken into account. " \
+                                    +"Applies to virtual functions with the default implementation. Default value is False." )
+
     def _get_use_default_arguments(self):
         return self._use_default_arguments
     def _set_use_default_arguments(self, use_default_arguments):
@@ -156,6 +179,41 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
         """
         self.transformations.append( ft.function_transformation_t( self, transformer_creators, **keywd ) )
 
+    @property
+    def exported_transformations(self):
+        """return list of function transformations, used to expose the function
+
+        If the function should release the GIL and it has no transformations, the
+        list contains an empty transformation, which keeps the function alias.
+        :attr:`transformations` is not changed.
+        """
+        if self.transformations or not self.release_gil:
+            return self.transformations
+        if isinstance( self, ( declarations.constructor_t, declarations.casting_operator_t ) ):
+            return self.transformations
+        if isinstance( self.parent, declarations.class_t ) \
+           and declarations.ACCESS_TYPES.PUBLIC != self.parent.find_out_member_access_type( self ):
+            return self.transformations
+        if None is self._release_gil_transformation \
+           or self._release_gil_transformation.alias != self.alias:
+            self._release_gil_transformation = ft.function_transformation_t( self, [], alias=self.alias )
+        return [ self._release_gil_transformation ]
+
+    @property
+    def batch_transformation(self):
+        """return function transformation, which describes the batch entry point, or None"""
+        return self._batch_transformation
+
+    def add_batch_entry_point(self, alias=None):
+        """expose additional function, which calls the function for every item of the arguments.
+
+        The entry point takes an object, which exports the buffer protocol, for every
+        argument and returns the results as `memoryview` object. The default alias is
+        the function alias with "_batch" suffix. Applies to free and static member
+        functions, which arguments and return type are fundamental types.
+        """
+        self._batch_transformation = ft.function_transformation_t( self, [], alias=alias, batch=True )
+
     def _exportable_impl_derived( self ):
         return ''
 
@@ -324,6 +382,7 @@ class constructor_t( declarations.constructor_t, calldef_t ):
         return self._body
     def _set_body(self, body):
         self._body = body
+        decl_wrapper.configuration_changed()
     body = property( _get_body, _set_body
                      , doc="string, class-wrapper constructor body" )
 
@@ -184,11 +184,10 @@ class class_t( class_common_details_t
         self._registration_code_head = []
         self._registration_code_tail = []
         self._declaration_code = []
-        self._wrapper_code = []
-        self._destructor_code = []
+        self._wrapper_code = decl_wrapper.configuration_list_t()
+        self._destructor_code = decl_wrapper.configuration_list_t()
         self._exception_translation_code = None
         self._properties = []
-        self._redefined_funcs = None
         self._require_self_reference  = False
         self._exposed_class_type = self.EXPOSED_CLASS_TYPE.DECLARED
         self._expose_this = None
@@ -211,6 +210,7 @@ class class_t( class_common_details_t
             self._fake_constructors.append( f )
         else:
             self._fake_constructors.extend( f )
+        decl_wrapper.configuration_changed()
 
     def _get_redefine_operators( self ):
         return self._redefine_operators
@@ -421,6 +421,12 @@ class class_t( class_common_details_t
 
     def get_exportable_members( self, sort=None ):
         """returns list of internal declarations that should\\could be exported"""
+        members = self._derived_value( 'exportable_members', self.__find_exportable_members )
+        if sort:
+            return sort( members[:] )
+        return members[:]
+
+    def __find_exportable_members( self ):
         #TODO: obviously this function should be shorter. Almost all logic of this class
         #      should be spread between decl_wrapper classes
         members = [mv for mv in self.public_members if mv.ignore == False and mv.exportable]
@@ -449,11 +455,7 @@ class class_t( class_common_details_t
             return True
         #-#if declarations.has_destructor( self ) \
         #-#   and not declarations.has_public_destructor( self ):
-        members = list(filter( is_exportable, members ))
-        sorted_members = members
-        if sort:
-            sorted_members = sort( members )
-        return sorted_members
+        return list(filter( is_exportable, members ))
 
     @property
     def properties( self ):
@@ -504,10 +506,9 @@ class class_t( class_common_details_t
         The wrapper for class `derived`, should define `do_nothing` function,
         otherwise the generated code will not compile
         """
+        return self._derived_value( 'redefined_funcs', self.__find_redefined_funcs )
 
-        if isinstance( self._redefined_funcs, list ):
-            return self._redefined_funcs
-
+    def __find_redefined_funcs( self ):
         all_included = declarations.custom_matcher_t( lambda decl: decl.ignore == False and decl.exportable )
         all_protected = declarations.access_type_matcher_t( 'protected' ) & all_included
         all_pure_virtual = declarations.virtuality_type_matcher_t( VIRTUALITY_TYPES.PURE_VIRTUAL )
@@ -597,15 +598,16 @@ class class_t( class_common_details_t
         functions.extend( list(tmp.values()) )
 
         functions.sort( key=lambda f: ( f.name, f.location.as_tuple() ) )
-
-        self._redefined_funcs = functions
-        return self._redefined_funcs
+        return functions
 
     def is_wrapper_needed(self):
         """returns an explanation( list of str ) why wrapper is needed.
 
         If wrapper is not needed than [] will be returned.
         """
+        return self._derived_value( 'is_wrapper_needed', self.__explain_wrapper_need )[:]
+
+    def __explain_wrapper_need( self ):
         explanation = []
         if self.wrapper_code:
             explanation.append( messages.W1020 )
@@ -15,6 +15,62 @@ class CODE_GENERATOR_TYPES:
     CTYPES = 'ctypes'
     all = [ BOOST_PYTHON, CTYPES ]
 
+#The configuration generation. It is incremented every time the configuration,
+#the derived properties are calculated from, is changed( exclude/include,
+#wrapper code, ... ), so the derived properties could be memoised.
+__generation = [0]
+
+def configuration_generation():
+    """returns the current configuration generation"""
+    return __generation[0]
+
+def configuration_changed():
+    """invalidates the derived properties of all declarations"""
+    __generation[0] += 1
+
+class configuration_list_t( list ):
+    """list, which invalidates the derived properties of all declarations, when it is changed
+
+    The user code lists( wrapper code, destructor code ) are available as
+    properties, so the user could change them directly.
+    """
+    def append( self, item ):
+        list.append( self, item )
+        configuration_changed()
+
+    def extend( self, items ):
+        list.extend( self, items )
+        configuration_changed()
+
+    def insert( self, index, item ):
+        list.insert( self, index, item )
+        configuration_changed()
+
+    def remove( self, item ):
+        list.remove( self, item )
+        configuration_changed()
+
+    def pop( self, *args ):
+        item = list.pop( self, *args )
+        configuration_changed()
+        return item
+
+    def clear( self ):
+        list.clear( self )
+        configuration_changed()
+
+    def __setitem__( self, index, item ):
+        list.__setitem__( self, index, item )
+        configuration_changed()
+
+    def __delitem__( self, index ):
+        list.__delitem__( self, index )
+        configuration_changed()
+
+    def __iadd__( self, items ):
+        self.extend( items )
+        return self
+
 class decl_wrapper_t(object):
     """code generator declaration configuration base class
 
@@ -34,6 +90,7 @@ class decl_wrapper_t(object):
         self.__msgs_to_ignore = set()
         self._include_files = []
         self._code_generator = None
+        self._derived_values = {} #name : ( generation, value )
 
     @property
     def code_generator( self ):
@@ -45,6 +102,17 @@ class decl_wrapper_t(object):
         """reference to :attr:`_logging_.loggers.declarations`"""
         return _logging_.loggers.declarations
 
+    def _derived_value( self, name, calculate ):
+        """returns the value of the derived property. The value is calculated
+        once per configuration generation"""
+        generation = configuration_generation()
+        cached = self._derived_values.get( name )
+        if cached and cached[0] == generation:
+            return cached[1]
+        value = calculate()
+        self._derived_values[ name ] = ( generation, value )
+        return value
+
     def _get_documentation( self ):
         return self._documentation
     def _set_documentation( self, value ):
@@ -112,6 +180,7 @@ class decl_wrapper_t(object):
         return self._ignore
     def _set_ignore( self, value ):
         self._ignore = value
+        configuration_changed()
     ignore = property( _get_ignore, _set_ignore
                        , doc="Boolean flag, which says whether to export declaration to Python or not. Code generators: ctypes, Boost.Python" )
 
@@ -119,6 +188,7 @@ class decl_wrapper_t(object):
         return self._already_exposed
     def set_already_exposed( self, value ):
         self._already_exposed = value
+        configuration_changed()
     already_exposed = property( get_already_exposed, set_already_exposed
                                 , doc="boolean flag, which says whether the declaration is already exposed or not" )
 
@@ -172,6 +242,7 @@ class decl_wrapper_t(object):
         This function should be use in case `Py++` made a mistake and signed the
         declaration as non-exportable."""
         self._exportable = exportable
+        configuration_changed()
 
     exportable = property( get_exportable, set_exportable
                           , doc="Returns True if declaration could be exported to Python, otherwise False" )
@@ -12,6 +12,8 @@ from .writer import writer_t
 from .single_file import single_file_t
 from .multiple_files import multiple_files_t
 from .balanced_files import balanced_files_t
+from .balanced_files import compile_cost_estimator_t
+from .balanced_files import record_compile_times
 from .class_multiple_files import class_multiple_files_t
 from .md5sum_repository import repository_t
 from .md5sum_repository import cached_repository_t
@@ -23,28 +25,28 @@ def has_pypp_extenstion( fname ):
             return True
     return False
 
-def write_file( data, file_path, encoding='ascii' ):
+def write_file( data, file_path, encoding='ascii', binary_exposed_decls_db=False ):
     """writes data to file"""
     if isinstance( data, str ):
         writer_t.write_file( data, file_path, encoding=encoding )
     else:
-        sf = single_file_t( data, file_path, encoding=encoding )
+        sf = single_file_t( data, file_path, encoding=encoding, binary_exposed_decls_db=binary_exposed_decls_db )
         sf.write()
 
-def write_multiple_files( extmodule, dir_path, files_sum_repository=None, encoding='ascii' ):
+def write_multiple_files( extmodule, dir_path, files_sum_repository=None, encoding='ascii', processes=None, binary_exposed_decls_db=False ):
     """writes extmodule to multiple files"""
-    mfs = multiple_files_t( extmodule, dir_path, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = multiple_files_t( extmodule, dir_path, files_sum_repository=files_sum_repository, encoding=encoding, processes=processes, binary_exposed_decls_db=binary_exposed_decls_db )
     mfs.write()
     return mfs.written_files
 
-def write_balanced_files( extmodule, dir_path, number_of_buckets, files_sum_repository=None, encoding='ascii' ):
+def write_balanced_files( extmodule, dir_path, number_of_buckets, files_sum_repository=None, encoding='ascii', processes=None, compile_cost=None, binary_exposed_decls_db=False ):
     """writes extmodule to fixed number of multiple .cpp files"""
-    mfs = balanced_files_t( extmodule, dir_path, number_of_buckets, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = balanced_files_t( extmodule, dir_path, number_of_buckets, files_sum_repository=files_sum_repository, encoding=encoding, processes=processes, compile_cost=compile_cost, binary_exposed_decls_db=binary_exposed_decls_db )
     mfs.write()
     return mfs.written_files
 
-def write_class_multiple_files( extmodule, dir_path, huge_classes, files_sum_repository, encoding='ascii' ):
+def write_class_multiple_files( extmodule, dir_path, huge_classes, files_sum_repository, encoding='ascii', binary_exposed_decls_db=False ):
     """writes extmodule to multiple files and splits huge classes to few source files"""
-    mfs = class_multiple_files_t( extmodule, dir_path, huge_classes, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = class_multiple_files_t( extmodule, dir_path, huge_classes, files_sum_repository=files_sum_repository, encoding=encoding, binary_exposed_decls_db=binary_exposed_decls_db )
     mfs.write()
     return mfs.written_files
@@ -7,6 +7,7 @@
 
 import os
 import math
+import json
 from . import multiple_files
 from pyplusplus import messages
 from pyplusplus import _logging_
@@ -14,6 +15,138 @@ from pygccxml import declarations
 from pyplusplus import decl_wrappers
 from pyplusplus import code_creators
 from pyplusplus.utils import split_sequence
+from pyplusplus.utils import split_sequence_by_cost
+
+class compile_cost_estimator_t( object ):
+    """
+    estimates the compilation time of the code, generated for a class
+
+    The estimation takes into account the number of exposed functions, the
+    number of virtual functions, which are overridden in the wrapper class,
+    the number of template instantiations and the number of the code creators.
+    If the cost profile is given, the recorded cost of the class is used instead
+    of the estimation. See :func:`record_compile_times`.
+    """
+    CLASS_COST = 10.0
+    CALLDEF_COST = 1.0
+    VIRTUAL_WRAPPER_COST = 3.0
+    TEMPLATE_INSTANTIATION_COST = 5.0
+    CREATOR_COST = 0.2
+
+    def __init__( self, cost_profile=None ):
+        """
+        :param cost_profile: the cost profile file name, could be None
+        :type cost_profile: str
+        """
+        object.__init__( self )
+        self.cost_profile = cost_profile
+        self.__profile = {}
+        if cost_profile and os.path.exists( cost_profile ):
+            self.__profile = load_cost_profile( cost_profile )[ 'classes' ]
+        self.__class_creators = []
+        self.__scale = None
+
+    @staticmethod
+    def class_key( class_creator ):
+        """the name, the class cost is kept under"""
+        return class_creator.declaration.decl_string
+
+    def estimate( self, class_creator ):
+        """returns the estimated cost of the class code creator"""
+        cost = self.CLASS_COST
+        if declarations.templates.is_instantiation( class_creator.declaration.name ):
+            cost += self.TEMPLATE_INSTANTIATION_COST
+        creators = code_creators.make_flatten_list( class_creator )
+        wrapper = getattr( class_creator, 'wrapper', None )
+        if wrapper:
+            creators.extend( code_creators.make_flatten_list( wrapper ) )
+        for creator in creators:
+            cost += self.CREATOR_COST
+            if not isinstance( creator, code_creators.declaration_based_t ) \
+               or not isinstance( creator.declaration, declarations.calldef_t ):
+                continue
+            if isinstance( creator.parent, code_creators.class_wrapper_t ):
+                virtuality = getattr( creator.declaration, 'virtuality', declarations.VIRTUALITY_TYPES.NOT_VIRTUAL )
+                if virtuality != declarations.VIRTUALITY_TYPES.NOT_VIRTUAL:
+                    cost += self.VIRTUAL_WRAPPER_COST
+            else:
+                cost += self.CALLDEF_COST
+                if declarations.templates.is_instantiation( creator.declaration.name ):
+                    cost += self.TEMPLATE_INSTANTIATION_COST
+        return cost
+
+    def prepare( self, class_creators ):
+        """gives the estimator the list of all classes, which are going to be balanced"""
+        self.__class_creators = class_creators
+        self.__scale = None
+
+    def __call__( self, class_creator ):
+        if not self.__profile:
+            return self.estimate( class_creator )
+        key = self.class_key( class_creator )
+        if key in self.__profile:
+            return self.__profile[ key ]
+        if None is self.__scale:
+            #the profile keeps seconds, so the estimations of the classes, which
+            #were not recorded yet, should be scaled
+            self.__scale = 1.0
+            estimations = [ self.estimate( cc ) for cc in self.__class_creators
+                            if self.class_key( cc ) in self.__profile ]
+            if estimations:
+                self.__scale = sum( self.__profile[ self.class_key( cc ) ] for cc in self.__class_creators
+                                    if self.class_key( cc ) in self.__profile ) / sum( estimations )
+        return self.estimate( class_creator ) * self.__scale
+
+def load_cost_profile( file_name ):
+    """loads the cost profile from the file
+
+    The profile is a dictionary, which contains two dictionaries:
+
+      * `classes` - class name : recorded compilation time
+      * `files` - file name : { class name : cost, used to balance the file }
+    """
+    profile = { 'classes' : {}, 'files' : {} }
+    if os.path.exists( file_name ):
+        f = open( file_name, 'r' )
+        try:
+            profile.update( json.load( f ) )
+        finally:
+            f.close()
+    return profile
+
+def save_cost_profile( file_name, profile ):
+    """saves the cost profile to the file"""
+    f = open( file_name, 'w+' )
+    try:
+        json.dump( profile, f, indent=1, sort_keys=True )
+    finally:
+        f.close()
+
+def record_compile_times( cost_profile, compile_times ):
+    """records the real compilation time of the files, written by :class:`balanced_files_t`
+
+    The compilation time of every file is distributed between the classes of the
+    file, proportionally to their estimated cost. Next time, the recorded costs
+    are used to balance the files.
+
+    :param cost_profile: the cost profile file name
+    :type cost_profile: str
+
+    :param compile_times: file name : compilation time( seconds )
+    :type compile_times: dict
+    """
+    profile = load_cost_profile( cost_profile )
+    for fpath, seconds in compile_times.items():
+        estimations = profile[ 'files' ].get( os.path.basename( fpath ) )
+        if not estimations:
+            continue
+        total = sum( estimations.values() )
+        for class_name, estimation in estimations.items():
+            if total:
+                profile[ 'classes' ][ class_name ] = seconds * estimation / total
+            else:
+                profile[ 'classes' ][ class_name ] = seconds / len( estimations )
+    save_cost_profile( cost_profile, profile )
 
 #TODO: to add namespace_alias_t classes
 class balanced_files_t(multiple_files.multiple_files_t):
@@ -30,7 +163,10 @@ class balanced_files_t(multiple_files.multiple_files_t):
                   , number_of_buckets
                   , write_main=True
                   , files_sum_repository=None
-                  , encoding='ascii'):
+                  , encoding='ascii'
+                  , processes=None
+                  , compile_cost=None
+                  , binary_exposed_decls_db=False):
         """Constructor.
 
         :param extmodule: The root of a code creator tree
@@ -41,19 +177,74 @@ class balanced_files_t(multiple_files.multiple_files_t):
         :param write_main:  if it is True, the class will write out a main file
             that calls all the registration methods.
         :type write_main: boolean
+
+        :param processes: number of worker processes used to render and write
+            the buckets. None or 1 means the files are written sequentially.
+        :type processes: int
+
+        :param compile_cost: if it is None, every file gets the same number of
+            classes. Otherwise the classes are balanced by their estimated
+            compilation cost, so the most "expensive" file is as cheap as possible.
+            The argument could be True, the cost profile file name or
+            :class:`compile_cost_estimator_t` instance.
+        :type compile_cost: bool, str or :class:`compile_cost_estimator_t`
+
+        :param binary_exposed_decls_db: if True, the exposed declarations database
+            is saved in the binary format
+        :type binary_exposed_decls_db: bool
         """
-        multiple_files.multiple_files_t.__init__( self, extmodule, directory_path, write_main, files_sum_repository, encoding)
+        multiple_files.multiple_files_t.__init__( self, extmodule, directory_path, write_main, files_sum_repository, encoding, processes, binary_exposed_decls_db)
         self.number_of_buckets = number_of_buckets
+        if compile_cost is True:
+            compile_cost = compile_cost_estimator_t()
+        elif isinstance( compile_cost, str ):
+            compile_cost = compile_cost_estimator_t( compile_cost )
+        self.compile_cost = compile_cost
+
+    def split_classes_by_cost( self, class_creators ):
+        """split the classes to buckets, using their estimated compilation cost
+
+        The classes keep their order, so the base classes are still registered
+        before the derived ones.
+        """
+        self.compile_cost.prepare( class_creators )
+        costs = dict( ( id( cc ), self.compile_cost( cc ) ) for cc in class_creators )
+        buckets = split_sequence_by_cost( class_creators, self.number_of_buckets, lambda cc: costs[ id( cc ) ] )
+        if self.compile_cost.cost_profile:
+            profile = load_cost_profile( self.compile_cost.cost_profile )
+            for index, bucket in enumerate( buckets ):
+                file_name = self.extmodule.body.name + '_classes_%d' % (index+1) + self.SOURCE_EXT
+                profile[ 'files' ][ file_name ] \
+                    = dict( ( self.compile_cost.class_key( cc ), costs[ id( cc ) ] ) for cc in bucket )
+            save_cost_profile( self.compile_cost.cost_profile, profile )
+        return buckets
 
     def split_classes( self ):
         class_creators = [x for x in self.extmodule.body.creators if isinstance(x, ( code_creators.class_t, code_creators.class_declaration_t ) )]
 
         class_creators = [cc for cc in class_creators if not cc.declaration.already_exposed]
 
-        buckets = split_sequence(class_creators, len(class_creators)/self.number_of_buckets )
-        if len(buckets) > self.number_of_buckets:
-            buckets[len(buckets)-2] += buckets[len(buckets)-1]
-            buckets = buckets[:len(buckets)-1]
+        if self.compile_cost:
+            buckets = self.split_classes_by_cost( class_creators )
+        else:
+            buckets = split_sequence(class_creators, len(class_creators)/self.number_of_buckets )
+            if len(buckets) > self.number_of_buckets:
+                buckets[len(buckets)-2] += buckets[len(buckets)-1]
+                buckets = buckets[:len(buckets)-1]
+
+        if self.is_parallel_split_enabled():
+            units = []
+            for index, bucket in enumerate( buckets ):
+                if not bucket:
+                    continue
+                units.append( ( self.extmodule.body.name + '_classes_%d' % (index+1)
+                                , 'register_classes_%d' % (index+1)
+                                , bucket ) )
+            self.split_in_parallel( units )
+            for file_name, function_name, bucket in units:
+                header_name = os.path.join( self.directory_path, file_name ) + self.HEADER_EXT
+                self.commit_creators_split( bucket, function_name, header_name, -1 )
+            return
 
         for index, bucket in enumerate( buckets ):
             self.split_creators( bucket
@@ -39,12 +39,14 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
                   , huge_classes
                   , num_of_functions_per_file=20
                   , files_sum_repository=None
-                  , encoding='ascii'):
+                  , encoding='ascii'
+                  , binary_exposed_decls_db=False):
         multiple_files.multiple_files_t.__init__(self
                                                  , extmodule
                                                  , directory_path
                                                  , files_sum_repository=files_sum_repository
-                                                 , encoding=encoding)
+                                                 , encoding=encoding
+                                                 , binary_exposed_decls_db=binary_exposed_decls_db)
         self.huge_classes = huge_classes
         self.num_of_functions_per_file = num_of_functions_per_file
         self.internal_splitters = [
@@ -6,13 +6,43 @@
 """defines a class that writes :class:`code_creators.bpmodule_t` to multiple files"""
 
 import os
+import multiprocessing
 from . import writer
+from . import md5sum_repository
+from pyplusplus import utils
 from pyplusplus import messages
 from pyplusplus import _logging_
 from pygccxml import declarations
 from pyplusplus import decl_wrappers
 from pyplusplus import code_creators
 
+#the writer, which is split in parallel. Worker processes are forked, so they
+#inherit the reference together with the whole code creators tree.
+_parallel_writer = None
+
+def _write_parallel_chunk( chunk_index ):
+    return _parallel_writer.write_chunk( chunk_index )
+
+class _recording_repository_t( md5sum_repository.repository_t ):
+    """repository, which remembers the updates made by a worker process, so
+    they could be merged into the real repository later"""
+    def __init__( self, repository ):
+        md5sum_repository.repository_t.__init__( self )
+        self.__repository = repository
+        self.updates = []
+
+    def get_file_value( self, fpath ):
+        return self.__repository.get_file_value( fpath )
+
+    def get_text_value( self, text ):
+        return self.__repository.get_text_value( text )
+
+    def update_value( self, fpath, hash_value ):
+        self.updates.append( ( fpath, hash_value ) )
+
+    def save_values( self ):
+        pass
+
 #TODO: to add namespace_alias_t classes
 class multiple_files_t(writer.writer_t):
     """
@@ -22,7 +52,10 @@ class multiple_files_t(writer.writer_t):
     HEADER_EXT = '.pypp.hpp'
     SOURCE_EXT = '.pypp.cpp'
 
-    def __init__(self, extmodule, directory_path, write_main=True, files_sum_repository=None, encoding='ascii'):
+    #how many chunks of classes every worker process will get
+    CHUNKS_PER_PROCESS = 4
+
+    def __init__(self, extmodule, directory_path, write_main=True, files_sum_repository=None, encoding='ascii', processes=None, binary_exposed_decls_db=False):
         """
         :param extmodule: code creators tree root
         :type extmodule: :class:`code_creators.bpmodule_t`
@@ -30,8 +63,14 @@ class multiple_files_t(writer.writer_t):
         :type directory_path: str
         :param write_main:  if True, the class will write out a main file that calls all the registration methods.
         :type write_main: boolean
+        :param processes: number of worker processes used to render and write class files.
+                          None or 1 means the files are written sequentially.
+        :type processes: int
+        :param binary_exposed_decls_db: if True, the exposed declarations database is saved in the binary format
+        :type binary_exposed_decls_db: bool
         """
-        writer.writer_t.__init__( self, extmodule, files_sum_repository, encoding=encoding )
+        writer.writer_t.__init__( self, extmodule, files_sum_repository, encoding=encoding
+                                  , binary_exposed_decls_db=binary_exposed_decls_db )
         self.__directory_path = directory_path
         self.create_dir( directory_path )
         self.include_creators = []  # List of include_t creators that contain the generated headers
@@ -43,9 +82,10 @@ class multiple_files_t(writer.writer_t):
         self.__predefined_include_creators \
             = [creator for creator in self.extmodule.creators if isinstance( creator, code_creators.include_t )]
         self.__value_traits = [x for x in self.extmodule.creators if isinstance(x, code_creators.value_traits_t)]
+        self.processes = processes
+        self.__parallel_chunks = []
 
-
-    def write_file( self, fpath, content ):
+    def register_written_file( self, fpath ):
         if fpath in self.written_files:
             msg = ['`Py++` is going to write different content to the same file(%s).' % fpath]
             msg.append('The following is a short list of possible explanations for this behaviour:' )
@@ -54,8 +94,10 @@ class multiple_files_t(writer.writer_t):
             msg.append('* module_builder_t contains two or more classes with the same wrapper alias')
             msg.append('Please carefully review `Py++` warning messages. It should contain an additional information.')
             raise RuntimeError( os.linesep.join(msg) )
-
         self.written_files.append( fpath )
+
+    def write_file( self, fpath, content ):
+        self.register_written_file( fpath )
         writer.writer_t.write_file( fpath, content, self.files_sum_repository, self.encoding )
 
     def create_dir( self, directory_path ):
@@ -204,6 +246,13 @@ class multiple_files_t(writer.writer_t):
         else:
             return os.linesep.join( [creator.create() for creator in ns_creators] )
 
+    def find_declaration_creators( self, registration_creators ):
+        """returns unique list of declaration code creators, the "register" function creators depend on"""
+        declaration_creators = []
+        for rc in registration_creators:
+            declaration_creators.extend( self.associated_decl_creators( rc ) )
+        return self.get_unique_creators( declaration_creators )
+
     def create_source( self, file_name, function_name, registration_creators ):
         """
         return the content of a cpp file.
@@ -218,10 +267,7 @@ class multiple_files_t(writer.writer_t):
         :type creators: list of :class:`code_creators.code_creator_t`
         :rtype: str
         """
-        declaration_creators = []
-        for rc in registration_creators:
-            declaration_creators.extend( self.associated_decl_creators( rc ) )
-        declaration_creators = self.get_unique_creators( declaration_creators )
+        declaration_creators = self.find_declaration_creators( registration_creators )
 
         creators = registration_creators + declaration_creators
 
@@ -266,6 +312,9 @@ class multiple_files_t(writer.writer_t):
 
         self.write_file( file_path + self.SOURCE_EXT, cpp_code )
 
+        self.commit_class_split( class_creator, function_name, header_name )
+
+    def commit_class_split( self, class_creator, function_name, header_name ):
         # Replace the create() method so that only the register() method is called
         # (this is called later for the main source file).
         class_creator.create = lambda: function_name +'();'
@@ -287,18 +336,139 @@ class multiple_files_t(writer.writer_t):
                 return
             self.split_class_impl( class_creator )
         except IOError as error:
-            msg = [ 'Failed to write code for class "%s" into file.;' % class_creator.declaration.name ]
-            msg.append( "May be the class name is too long?." )
-            msg.append( "Error: %s'" % str(error) )
-            self.logger.error( os.linesep.join( msg ) )
+            self.__report_class_error( class_creator, error )
             raise
 
+    def __report_class_error( self, class_creator, error ):
+        msg = [ 'Failed to write code for class "%s" into file.;' % class_creator.declaration.name ]
+        msg.append( "May be the class name is too long?." )
+        msg.append( "Error: %s'" % str(error) )
+        self.logger.error( os.linesep.join( msg ) )
+
     def split_classes( self ):
         # Obtain a list of all class creators...
         class_creators = [x for x in self.extmodule.body.creators if isinstance(x, ( code_creators.class_t, code_creators.class_declaration_t ) )]
+        if self.is_parallel_split_enabled():
+            class_creators = [cc for cc in class_creators if not cc.declaration.already_exposed]
+            units = []
+            for cc in class_creators:
+                function_name = 'register_%s_class' % cc.alias
+                units.append( ( cc.alias, function_name, [cc] ) )
+            self.split_in_parallel( units
+                                    , on_error=lambda unit, error: self.__report_class_error( unit[2][0], error ) )
+            for file_name, function_name, creators in units:
+                header_name = os.path.join( self.directory_path, file_name ) + self.HEADER_EXT
+                self.commit_class_split( creators[0], function_name, header_name )
+            return
         # ...and write a .h/.cpp file for each class
         for cls in class_creators: self.split_class(cls)
 
+    def is_parallel_split_enabled( self ):
+        if not self.processes or self.processes < 2:
+            return False
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.logger.info( 'the platform does not support "fork", the files will be written sequentially' )
+            return False
+        return True
+
+    def split_in_parallel( self, units, on_error=None ):
+        """
+        render and write the header and source files of every unit, using a
+        pool of worker processes
+
+        A unit is a tuple( file name, "register" function name, registration
+        creators ). The generated files are identical to the ones, created by
+        :meth:`split_creators`. The method doesn't modify code creators tree, the
+        caller is responsible to do this, once all files were written.
+
+        :param units: list of the units, in the "sequential" writing order
+        :param on_error: callable( unit, error ), which reports :class:`IOError`,
+                         raised while the unit files were written. The error is
+                         reported and raised again by the calling process.
+        """
+        global _parallel_writer
+
+        for file_name, function_name, creators in units:
+            file_path = os.path.join( self.directory_path, file_name )
+            self.register_written_file( file_path + self.HEADER_EXT )
+            self.register_written_file( file_path + self.SOURCE_EXT )
+
+        #Every chunk is processed by a freshly forked process, so the declaration
+        #creators, consumed by the previous chunks, should be "released" by
+        #the chunk itself.
+        units_per_chunk = max( 1, len( units ) // ( self.processes * self.CHUNKS_PER_PROCESS ) )
+        consumed = []
+        self.__parallel_chunks = []
+        for chunk in utils.split_sequence( units, units_per_chunk ):
+            self.__parallel_chunks.append( ( chunk, consumed[:] ) )
+            for file_name, function_name, creators in chunk:
+                consumed.extend( self.find_declaration_creators( creators ) )
+        consumed = [cc for cc in self.get_unique_creators( consumed )
+                    if not isinstance( cc, self.ref_count_creators )]
+
+        _parallel_writer = self
+        try:
+            pool = multiprocessing.get_context( 'fork' ).Pool( self.processes, maxtasksperchild=1 )
+            try:
+                results = pool.map( _write_parallel_chunk, list(range( len( self.__parallel_chunks ) )), chunksize=1 )
+            finally:
+                pool.close()
+                pool.join()
+        finally:
+            _parallel_writer = None
+            self.__parallel_chunks = []
+
+        for updates, code_cache_entries, render_report, failure in results:
+            for fname, hash_value in updates:
+                self.files_sum_repository.update_value( fname, hash_value )
+            if self.extmodule.code_cache:
+                self.extmodule.code_cache.merge( code_cache_entries )
+            if self.extmodule.render_statistics:
+                self.extmodule.render_statistics.merge( render_report )
+            if failure:
+                failed_file_name, error = failure
+                if on_error:
+                    on_error( [ unit for unit in units if unit[0] == failed_file_name ][0], error )
+                raise error
+        #leave the tree in the same state, the sequential algorithm leaves it
+        for creator in consumed:
+            creator.create = lambda: ''
+
+    def write_chunk( self, chunk_index ):
+        """writes the files of a single chunk of units, executed within worker process"""
+        units, consumed = self.__parallel_chunks[ chunk_index ]
+        render_statistics = self.extmodule.render_statistics
+        if render_statistics:
+            #the statistics, collected by the parent process, were copied too
+            render_statistics.clear()
+        for creator in consumed:
+            if not isinstance( creator, self.ref_count_creators ):
+                creator.create = lambda: ''
+        repository = _recording_repository_t( self.files_sum_repository )
+        failure = None
+        for file_name, function_name, creators in units:
+            file_path = os.path.join( self.directory_path, file_name )
+            try:
+                writer.writer_t.write_file( file_path + self.HEADER_EXT
+                                            , self.create_header( file_name, self.create_function_code( function_name ) )
+                                            , repository
+                                            , self.encoding )
+                writer.writer_t.write_file( file_path + self.SOURCE_EXT
+                                            , self.create_source( file_name, function_name, creators )
+                                            , repository
+                                            , self.encoding )
+            except IOError as error:
+                #the calling process reports the error, as the sequential algorithm does
+                failure = ( file_name, error )
+                break
+        code_cache_entries = {}
+        if self.extmodule.code_cache:
+            code_cache_entries = self.extmodule.code_cache.used_entries
+        render_report = None
+        if render_statistics:
+            render_report = render_statistics.report()
+        return repository.updates, code_cache_entries, render_report, failure
+
     def create_value_traits_header_name( self, value_class ):
         return "_" + value_class.alias + "__value_traits" + self.HEADER_EXT
 
@@ -345,6 +515,9 @@ class multiple_files_t(writer.writer_t):
         self.write_file( file_path + self.SOURCE_EXT
                          , self.create_source( file_pattern, function_name, creators ))
 
+        self.commit_creators_split( creators, function_name, header_name, registrator_pos )
+
+    def commit_creators_split( self, creators, function_name, header_name, registrator_pos ):
         for creator in creators:
             creator.create = lambda: ''
         self.extmodule.body.adopt_creator(
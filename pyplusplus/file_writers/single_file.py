@@ -11,8 +11,8 @@ from . import writer
 class single_file_t(writer.writer_t):
     """generates all code into single cpp file"""
 
-    def __init__(self, extmodule, file_name, encoding='ascii'):
-        writer.writer_t.__init__(self, extmodule, encoding=encoding)
+    def __init__(self, extmodule, file_name, encoding='ascii', binary_exposed_decls_db=False):
+        writer.writer_t.__init__(self, extmodule, encoding=encoding, binary_exposed_decls_db=binary_exposed_decls_db)
         self.__fname = file_name
 
     @property
@@ -29,5 +29,5 @@ class single_file_t(writer.writer_t):
         for header in headers:
             self.extmodule.add_include( header )
         self.write_code_repository( target_dir )
-        self.write_file( self.file_name, self.extmodule.create(), encoding=self.encoding )
+        self.write_file_chunks( self.file_name, self.extmodule.create_chunks(), encoding=self.encoding )
         self.save_exposed_decls_db( target_dir )
@@ -8,11 +8,15 @@
 import os
 import time
 import codecs
+import shutil
+import itertools
+import tempfile
 from . import md5sum_repository
 from pyplusplus import utils
 from pyplusplus import _logging_
 from pyplusplus import code_creators
 from pyplusplus import code_repository
+from pyplusplus.utils import profiler as profiling
 
 class writer_t(object):
     """Base class for all module/code writers.
@@ -24,11 +28,12 @@ class writer_t(object):
     """
     logger = _logging_.loggers.file_writer
 
-    def __init__(self, extmodule, files_sum_repository=None, encoding='ascii'):
+    def __init__(self, extmodule, files_sum_repository=None, encoding='ascii', binary_exposed_decls_db=False):
         object.__init__(self)
         self.__extmodule = extmodule
         self.__files_sum_repository = files_sum_repository
         self.__encoding=encoding
+        self.__binary_exposed_decls_db = binary_exposed_decls_db
         if None is files_sum_repository:
             self.__files_sum_repository = md5sum_repository.dummy_repository_t()
         self.__exposed_decls_db = utils.exposed_decls_db_t()
@@ -48,6 +53,11 @@ class writer_t(object):
         """encoding name used to write generated code to files"""
         return self.__encoding
 
+    @property
+    def binary_exposed_decls_db( self ):
+        """if True, the exposed declarations database is saved in the binary format"""
+        return self.__binary_exposed_decls_db
+
     @property
     def extmodule(self):
         """The root of the code creator tree ( code_creators.module_t )"""
@@ -107,52 +117,131 @@ class writer_t(object):
         :param content: The content of the file
         :type content: str
         """
-        fname = os.path.split( fpath )[1]
-        writer_t.logger.debug( 'write code to file "%s" - started' % fpath )
-        start_time = time.clock()
-        fcontent_new = []
-        if os.path.splitext( fpath )[1] == '.py':
-            fcontent_new.append( '# This file has been generated by Py++.' )
-        else:
-            fcontent_new.append( '// This file has been generated by Py++.' )
-        fcontent_new.append( os.linesep * 2 )
-        fcontent_new.append( content )
-        fcontent_new.append( os.linesep ) #keep gcc happy
-        fcontent_new = ''.join( fcontent_new )
-        if not isinstance( fcontent_new, str ):
-            fcontent_new = str( fcontent_new, encoding )
-
-        new_hash_value = None
-        curr_hash_value = None
-        if files_sum_repository:
-            new_hash_value  = files_sum_repository.get_text_value( fcontent_new )
-            curr_hash_value = files_sum_repository.get_file_value( fname )
-            if new_hash_value == curr_hash_value:
-                writer_t.logger.debug( 'file was not changed( hash ) - done( %f seconds )'
-                                       % ( time.clock() - start_time ) )
-                return
-
-        if None is curr_hash_value and os.path.exists( fpath ):
-            #It could be a first time the user uses files_sum_repository, don't force him
-            #to recompile the code
-            #small optimization to cut down compilation time
-            f = codecs.open( fpath, 'rb', encoding )
-            fcontent = f.read()
+        with profiling.phase( 'write files' ):
+            fname = os.path.split( fpath )[1]
+            writer_t.logger.debug( 'write code to file "%s" - started' % fpath )
+            start_time = time.perf_counter()
+            fcontent_new = []
+            if os.path.splitext( fpath )[1] == '.py':
+                fcontent_new.append( '# This file has been generated by Py++.' )
+            else:
+                fcontent_new.append( '// This file has been generated by Py++.' )
+            fcontent_new.append( os.linesep * 2 )
+            fcontent_new.append( content )
+            fcontent_new.append( os.linesep ) #keep gcc happy
+            fcontent_new = ''.join( fcontent_new )
+            if not isinstance( fcontent_new, str ):
+                fcontent_new = str( fcontent_new, encoding )
+
+            new_hash_value = None
+            curr_hash_value = None
+            if files_sum_repository:
+                new_hash_value  = files_sum_repository.get_text_value( fcontent_new )
+                curr_hash_value = files_sum_repository.get_file_value( fname )
+                if new_hash_value == curr_hash_value:
+                    writer_t.logger.debug( 'file was not changed( hash ) - done( %f seconds )'
+                                           % ( time.perf_counter() - start_time ) )
+                    return
+
+            if None is curr_hash_value and os.path.exists( fpath ):
+                #It could be a first time the user uses files_sum_repository, don't force him
+                #to recompile the code
+                #small optimization to cut down compilation time
+                f = codecs.open( fpath, 'rb', encoding )
+                fcontent = f.read()
+                f.close()
+                if fcontent == fcontent_new:
+                    writer_t.logger.debug( 'file was not changed( content ) - done( %f seconds )'
+                                           % ( time.perf_counter() - start_time ) )
+                    return
+
+            writer_t.logger.debug( 'file changed or it does not exist' )
+
+            writer_t.create_backup( fpath )
+            f = codecs.open( fpath, 'w+b', encoding )
+            f.write( fcontent_new )
             f.close()
-            if fcontent == fcontent_new:
-                writer_t.logger.debug( 'file was not changed( content ) - done( %f seconds )'
-                                       % ( time.clock() - start_time ) )
-                return
+            if new_hash_value:
+                files_sum_repository.update_value( fname, new_hash_value )
+            writer_t.logger.info( 'file "%s" - updated( %f seconds )' % ( fname, time.perf_counter() - start_time ) )
+
+    @staticmethod
+    def write_file_chunks( fpath, chunks, files_sum_repository=None, encoding='ascii' ):
+        """Write a source file, which content is represented by the code chunks.
+
+        This method is the streaming version of :meth:`writer_t.write_file`. The
+        chunks are written to a temporary file and the md5 sum is calculated on
+        the fly. The temporary file is renamed to the destination file, only if
+        the content was changed, so the whole content is never held in memory.
+
+        :param fpath: File name
+        :type fpath: str
+        :param chunks: The content of the file
+        :type chunks: iterable of str
+        """
+        with profiling.phase( 'write files' ):
+            fname = os.path.split( fpath )[1]
+            writer_t.logger.debug( 'write code to file "%s" - started' % fpath )
+            start_time = time.perf_counter()
+            header = []
+            if os.path.splitext( fpath )[1] == '.py':
+                header.append( '# This file has been generated by Py++.' )
+            else:
+                header.append( '// This file has been generated by Py++.' )
+            header.append( os.linesep * 2 )
+
+            text_hash = md5sum_repository.md5() #the same as md5sum_repository.get_md5_text_value
+            file_hash = md5sum_repository.md5()
+            fd, tmp_fpath = tempfile.mkstemp( prefix=fname + '.', suffix='.tmp'
+                                              , dir=os.path.dirname( os.path.abspath( fpath ) ) )
+            try:
+                f = os.fdopen( fd, 'wb' )
+                try:
+                    for data in itertools.chain( header, chunks, [ os.linesep ] ): #keep gcc happy
+                        if not isinstance( data, str ):
+                            data = str( data, encoding )
+                        text_hash.update( data.encode() )
+                        data = data.encode( encoding )
+                        file_hash.update( data )
+                        f.write( data )
+                finally:
+                    f.close()
+
+                new_hash_value = text_hash.hexdigest()
+                curr_hash_value = None
+                if files_sum_repository:
+                    curr_hash_value = files_sum_repository.get_file_value( fname )
+                    if new_hash_value == curr_hash_value:
+                        writer_t.logger.debug( 'file was not changed( hash ) - done( %f seconds )'
+                                               % ( time.perf_counter() - start_time ) )
+                        return
+
+                if None is curr_hash_value and os.path.exists( fpath ):
+                    #It could be a first time the user uses files_sum_repository, don't force him
+                    #to recompile the code
+                    if file_hash.hexdigest() == md5sum_repository.get_md5_file_value( fpath ):
+                        writer_t.logger.debug( 'file was not changed( content ) - done( %f seconds )'
+                                               % ( time.perf_counter() - start_time ) )
+                        return
 
-        writer_t.logger.debug( 'file changed or it does not exist' )
+                writer_t.logger.debug( 'file changed or it does not exist' )
 
-        writer_t.create_backup( fpath )
-        f = codecs.open( fpath, 'w+b', encoding )
-        f.write( fcontent_new )
-        f.close()
-        if new_hash_value:
-            files_sum_repository.update_value( fname, new_hash_value )
-        writer_t.logger.info( 'file "%s" - updated( %f seconds )' % ( fname, time.clock() - start_time ) )
+                if os.path.exists( fpath ):
+                    #the destination file should always exist, so the backup is copied
+                    shutil.copyfile( fpath, fpath + '~' )
+                    shutil.copymode( fpath, tmp_fpath )
+                else:
+                    umask = os.umask( 0 )
+                    os.umask( umask )
+                    os.chmod( tmp_fpath, 0o666 & ~umask )
+                os.replace( tmp_fpath, fpath )
+                tmp_fpath = None
+            finally:
+                if tmp_fpath and os.path.exists( tmp_fpath ):
+                    os.remove( tmp_fpath )
+            if files_sum_repository:
+                files_sum_repository.update_value( fname, new_hash_value )
+            writer_t.logger.info( 'file "%s" - updated( %f seconds )' % ( fname, time.perf_counter() - start_time ) )
 
     def get_user_headers( self, creators ):
         headers = []
@@ -162,6 +251,6 @@ class writer_t(object):
         return code_creators.code_creator_t.unique_headers( headers )
 
     def save_exposed_decls_db( self, file_path ):
-        self.__exposed_decls_db.save( file_path )
+        self.__exposed_decls_db.save( file_path, binary=self.__binary_exposed_decls_db )
 
 
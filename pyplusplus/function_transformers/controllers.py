@@ -250,6 +250,101 @@ class free_fun_controller_t( sealed_fun_controller_t ):
         for t in transformations: t.configure_free_fun( self )
 
 
+def batch_item_type( type_ ):
+    """returns fundamental type of the batch item, passed by value or by
+    constant reference, or None"""
+    type_ = declarations.remove_alias( type_ )
+    if declarations.is_reference( type_ ):
+        type_ = declarations.remove_reference( type_ )
+        if not declarations.is_const( type_ ):
+            return None
+    type_ = declarations.remove_cv( type_ )
+    if declarations.is_arithmetic( type_ ):
+        return type_
+    return None
+
+class batch_fun_controller_t( sealed_fun_controller_t ):
+    """controller of the free or static member function wrapper, which calls
+    the function for every item of the arguments
+
+    Every argument of the wrapper is an object, which exports the buffer protocol.
+    The buffers should have the same size. The results are written into a new
+    native array, which is returned as `memoryview` object.
+    """
+    def __init__( self, function ):
+        sealed_fun_controller_t.__init__( self, function )
+        if isinstance( function.parent, declarations.class_t ) and not function.has_static:
+            raise ValueError( '%s\nin order to create batch entry point, the function should be free or static member function.' % function )
+        if not function.arguments:
+            raise ValueError( '%s\nin order to create batch entry point, the function should have arguments.' % function )
+
+        self.__index_var = self.register_variable_name( 'index' )
+        self.__size_var = self.register_variable_name( 'size' )
+
+        views = []
+        for index, arg in enumerate( function.arguments ):
+            item_type = batch_item_type( arg.type )
+            if None is item_type:
+                raise ValueError( '%s\nin order to create batch entry point, argument %s type must be a fundamental type (got %s).' \
+                                  % ( function, arg.name, arg.type ) )
+            w_arg = self.find_wrapper_arg( arg.name )
+            w_arg.type = declarations.dummy_type_t( "boost::python::object" )
+            w_arg.default_value = None
+            view = self.declare_variable(
+                          declarations.dummy_type_t( "pyplus_buffer::buffer_view_t< %s >" % item_type.decl_string )
+                        , "native_" + arg.name
+                        , '( %s, false )' % w_arg.name )
+            views.append( view )
+            self.modify_arg_expression( index, '%s.data()[ %s ]' % ( view, self.__index_var ) )
+
+        self.add_pre_call_code( 'pyplus_buffer::index_type %s = %s.size();' % ( self.__size_var, views[0] ) )
+        for view in views[1:]:
+            self.add_pre_call_code( 'pyplus_buffer::check_batch_size( %s.size(), %s );' % ( view, self.__size_var ) )
+
+        self.__output_var = None
+        if not declarations.is_void( function.return_type ):
+            item_type = batch_item_type( function.return_type )
+            if None is item_type:
+                raise ValueError( '%s\nin order to create batch entry point, return type must be a fundamental type (got %s).' \
+                                  % ( function, function.return_type ) )
+            self.__output_var = self.declare_variable( declarations.pointer_t( item_type ), 'output', ' = 0' )
+            self.add_pre_call_code( 'boost::python::object %s = pyplus_buffer::new_array( %s, %s );'
+                                    % ( self.result_variable.name, self.__size_var, self.__output_var ) )
+
+    def apply( self, transformations ):
+        if transformations:
+            raise ValueError( '%s\nbatch entry point could not be combined with function transformers.' % self.function )
+
+    @property
+    def template( self ):
+        return templates.batch_fun.body
+
+    @property
+    def inst_arg( self ):
+        return None
+
+    @property
+    def index_variable( self ):
+        "name of the loop variable"
+        return self.__index_var
+
+    @property
+    def size_variable( self ):
+        "name of the variable, which holds the number of items in the buffers"
+        return self.__size_var
+
+    @property
+    def output_variable( self ):
+        "name of the pointer to the results array or None, if the function returns void"
+        return self.__output_var
+
+    @property
+    def wrapper_return_type( self ):
+        if declarations.is_void( self.function.return_type ):
+            return self.function.return_type
+        else:
+            return declarations.dummy_type_t( 'boost::python::object' )
+
 class virtual_mem_fun_controller_t( controller_base_t ):
     class override_fun_controller_t( controller_base_t ):
         def __init__( self, function ):
@@ -308,7 +403,7 @@ class virtual_mem_fun_controller_t( controller_base_t ):
             self.__py_arg_expressions[ index ] = None
             
         def modify_py_arg_expression( self, index, expression ):
-            self.arg_expressions[ index ] = expression
+            self.__py_arg_expressions[ index ] = expression
     
     class default_fun_controller_t( sealed_fun_controller_t ):
         def __init__( self, function ):
@@ -15,7 +15,10 @@ class function_transformation_t:
     def __init__(self, function, transformer_creator, **keywd):
         self.__function = function
         self.__controller = None
-        if isinstance( function.parent, declarations.class_t ):
+        self.__batch = keywd.get( 'batch', False )
+        if self.__batch:
+            self.__controller = controllers.batch_fun_controller_t( function )
+        elif isinstance( function.parent, declarations.class_t ):
             if declarations.VIRTUALITY_TYPES.NOT_VIRTUAL == function.virtuality:
                 self.__controller = controllers.mem_fun_controller_t( function )
             elif declarations.VIRTUALITY_TYPES.PURE_VIRTUAL == function.virtuality:
@@ -46,7 +49,9 @@ class function_transformation_t:
     @property
     def alias( self ):
         if None is self.__alias:
-            if self.__function.overloads:
+            if self.__batch:
+                self.__alias = self.__function.alias + '_batch'
+            elif self.__function.overloads:
                 self.__alias = self.unique_name
             else:
                 self.__alias = self.__function.alias
@@ -66,8 +71,17 @@ class function_transformation_t:
             headers.extend( transformer.required_headers() )
         if self.__function.call_policies:
             headers.append( code_repository.call_policies.file_name )
+        if self.thread_safe or getattr( self.__function, 'release_gil', False ):
+            headers.append( code_repository.gil_guard.file_name )
+        if self.batch:
+            headers.append( code_repository.buffer_protocol.file_name )
         return headers
 
+    @property
+    def batch( self ):
+        """True, if the function wrapper calls the function for every item of the arguments buffers"""
+        return self.__batch
+
     @property
     def thread_safe( self ):
         return self.__thread_safe
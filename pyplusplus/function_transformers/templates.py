@@ -23,10 +23,24 @@ class sealed_fun:
         , '}'
     ]))
 
+class batch_fun:
+    body = Template( os.linesep.join([
+          'static $return_type $unique_function_name( $arg_declarations ){'
+        , '    $declare_variables'
+        , '    $pre_call'
+        , '    for( pyplus_buffer::index_type $index = 0; $index < $size; ++$index ){'
+        , '        $save_result$function_name($arg_expressions);'
+        , '    }'
+        , '    $post_call'
+        , '    $return'
+        , '}'
+    ]))
+
 class virtual_mem_fun:    
     override = Template( os.linesep.join([
           'virtual $return_type $function_name( $arg_declarations )$constness $throw{'
         , '    namespace bpl = boost::python;'
+        , '    $acquire_gil'
         , '    if( bpl::override $py_function_var = this->get_override( "$function_alias" ) ){'
         , '        $declare_py_variables'
         , '        $py_pre_call'
@@ -35,6 +49,7 @@ class virtual_mem_fun:
         , '        $py_return'
         , '    }'
         , '    else{'
+        , '        $release_gil'
         , '        $cpp_return$wrapped_class::$function_name( $cpp_arg_expressions );'
         , '    }'
         , '}'
@@ -59,6 +74,7 @@ class pure_virtual_mem_fun:
     override = Template( os.linesep.join([
           'virtual $return_type $function_name( $arg_declarations )$constness $throw{'
         , '    namespace bpl = boost::python;'
+        , '    $acquire_gil'
         , '    if( bpl::override $py_function_var = this->get_override( "$function_alias" ) ){'
         , '        $declare_py_variables'
         , '        $py_pre_call'
@@ -347,15 +347,20 @@ class output_static_array_t(transformer.transformer_t):
 
     void get_vec3(double* v) -> v = get_vec3()
     # v will be a list with 3 floats
+
+    If `as_buffer` is True, v will be a writable memoryview, which owns the
+    native array, so it could be passed to NumPy without copying the items.
     """
 
-    def __init__(self, function, arg_ref, size):
+    def __init__(self, function, arg_ref, size, as_buffer=False):
         """Constructor.
 
         :param arg_ref: Index of the argument that is an output array
         :type arg_ref: int        
         :param size: The fixed size of the output array
         :type size: int
+        :param as_buffer: return memoryview instead of list
+        :type as_buffer: bool
         """
         transformer.transformer_t.__init__( self, function )
         self.arg = self.get_argument( arg_ref )
@@ -367,16 +372,40 @@ class output_static_array_t(transformer.transformer_t):
 
         self.array_size = size
         self.array_item_type = declarations.array_item_type( self.arg.type )
+        self.as_buffer = as_buffer
 
     def __str__(self):
+        if self.as_buffer:
+            return "output_array(%s,%d,as_buffer)"%( self.arg.name, self.array_size)
         return "output_array(%s,%d)"%( self.arg.name, self.array_size)
 
     def required_headers( self ):
         """Returns list of header files that transformer generated code depends on."""
+        if self.as_buffer:
+            return [ code_repository.convenience.file_name, code_repository.buffer_protocol.file_name ]
         return [ code_repository.convenience.file_name ]
 
+    def __configure_sealed_as_buffer(self, controller):
+        controller.remove_wrapper_arg( self.arg.name )
+
+        #the native array is allocated and owned by the memoryview
+        native_array = controller.declare_variable(
+                            declarations.pointer_t( declarations.remove_const( self.array_item_type ) )
+                          , "native_" + self.arg.name
+                          , ' = 0' )
+        pyarray = controller.declare_variable(
+                            declarations.dummy_type_t( "boost::python::object" )
+                          , 'py_' + self.arg.name
+                          , ' = pyplus_buffer::new_array( %d, %s )' % ( self.array_size, native_array ) )
+
+        controller.modify_arg_expression( self.arg_index, native_array )
+        controller.return_variable( pyarray )
+
     def __configure_sealed(self, controller):
         global _arr2seq
+        if self.as_buffer:
+            self.__configure_sealed_as_buffer( controller )
+            return
         #removing arg from the function wrapper definition
         controller.remove_wrapper_arg( self.arg.name )
 
@@ -628,16 +657,20 @@ class output_static_matrix_t(transformer.transformer_t):
 
     get_matrix(double m[3][3]) ->  m = get_matrix()
     # m will be a sequence of 3 sequences of 3 floats
+
+    If `as_buffer` is True, m will be a writable 2D memoryview, which owns the
+    native matrix, so it could be passed to NumPy without copying the items.
     """
 
-    def __init__(self, function, arg_ref, rows, columns):
+    def __init__(self, function, arg_ref, rows, columns, as_buffer=False):
         """Constructor.
 
         :param arg_ref: Index of the argument that is an output matrix
         :type arg_ref: int
         :param rows, columns: The fixed size of the output matrix
         :type rows, columns: int
-        
+        :param as_buffer: return memoryview instead of list of lists
+        :type as_buffer: bool
         """
         transformer.transformer_t.__init__( self, function )
 
@@ -651,16 +684,43 @@ class output_static_matrix_t(transformer.transformer_t):
         self.rows = rows
         self.columns = columns
         self.matrix_item_type = declarations.remove_const( declarations.array_item_type( declarations.array_item_type( self.arg.type ) ) )
+        self.as_buffer = as_buffer
 
     def __str__(self):
+        if self.as_buffer:
+            return "output_matrix(%s,%d,%d,as_buffer)"%( self.arg.name, self.rows, self.columns)
         return "output_matrix(%s,%d,%d)"%( self.arg.name, self.rows, self.columns)
 
     def required_headers( self ):
         """Returns list of header files that transformer generated code depends on."""
+        if self.as_buffer:
+            return [ code_repository.convenience.file_name, code_repository.buffer_protocol.file_name ]
         return [ code_repository.convenience.file_name ]
 
+    def __configure_sealed_as_buffer(self, controller):
+        controller.remove_wrapper_arg( self.arg.name )
+
+        #the native matrix is allocated and owned by the memoryview
+        native_matrix = controller.declare_variable(
+                            declarations.pointer_t( self.matrix_item_type )
+                          , "native_" + self.arg.name
+                          , ' = 0' )
+        pymatrix = controller.declare_variable(
+                            declarations.dummy_type_t( "boost::python::object" )
+                          , 'py_' + self.arg.name
+                          , ' = pyplus_buffer::new_matrix( %d, %d, %s )'
+                            % ( self.rows, self.columns, native_matrix ) )
+
+        controller.modify_arg_expression( self.arg_index
+                                          , 'reinterpret_cast< %s(*)[%d] >( %s )'
+                                            % ( self.matrix_item_type.decl_string, self.columns, native_matrix ) )
+        controller.return_variable( pymatrix )
+
     def __configure_sealed(self, controller):
         global _cmatrix2pymatrix
+        if self.as_buffer:
+            self.__configure_sealed_as_buffer( controller )
+            return
         #removing arg from the function wrapper definition
         controller.remove_wrapper_arg( self.arg.name )
 
@@ -917,6 +977,96 @@ class input_c_buffer_t(transformer.transformer_t):
         self.__configure_v_mem_fun_override( controller.override_controller )
         self.__configure_v_mem_fun_default( controller.default_controller )
 
+class input_buffer_t(transformer.transformer_t):
+    """
+    handles an input of C buffer, using Python buffer protocol:
+
+    void write( byte \\*buffer, int size ) -> void write( object, which exports buffer protocol )
+
+    Unlike :class:`input_c_buffer_t`, the items are not copied: the function gets
+    the pointer to the memory of the Python object( bytes, bytearray, memoryview,
+    array.array, NumPy array ). The buffer should be C contiguous and its items
+    should have the same type as the items of "buffer" argument.
+    """
+
+    def __init__(self, function, buffer_arg_ref, size_arg_ref, writable=None):
+        """Constructor.
+
+        :param buffer_arg_ref: "reference" to the buffer argument
+        :param size_arg_ref: "reference" to argument, which holds buffer size
+        :param writable: if it is True, the object should export writable buffer.
+                         By default, it is True, if the buffer items are not const.
+        """
+        transformer.transformer_t.__init__( self, function )
+
+        self.buffer_arg = self.get_argument( buffer_arg_ref )
+        self.buffer_arg_index = self.function.arguments.index( self.buffer_arg )
+
+        self.size_arg = self.get_argument( size_arg_ref )
+        self.size_arg_index = self.function.arguments.index( self.size_arg )
+
+        if not is_ptr_or_array( self.buffer_arg.type ):
+            raise ValueError( '%s\nin order to use "input_buffer" transformation, "buffer" argument %s type must be a array or a pointer (got %s).' \
+                              % ( function, self.buffer_arg.name, self.buffer_arg.type) )
+
+        if not declarations.is_integral( self.size_arg.type ):
+            raise ValueError( '%s\nin order to use "input_buffer" transformation, "size" argument %s type must be an integral type (got %s).' \
+                              % ( function, self.size_arg.name, self.size_arg.type) )
+
+        item_type = declarations.array_item_type( self.buffer_arg.type )
+        if None is writable:
+            writable = not declarations.is_const( item_type )
+        self.writable = writable
+        self.buffer_item_type = declarations.remove_const( item_type )
+
+    def __str__(self):
+        return "input_buffer(buffer arg=%s, size arg=%s, writable=%s)" \
+               % ( self.buffer_arg.name, self.size_arg.name, self.writable )
+
+    def required_headers( self ):
+        """Returns list of header files that transformer generated code depends on."""
+        return [ code_repository.buffer_protocol.file_name ]
+
+    def __configure_sealed(self, controller):
+        w_buffer_arg = controller.find_wrapper_arg( self.buffer_arg.name )
+        w_buffer_arg.type = declarations.dummy_type_t( "boost::python::object" )
+
+        controller.remove_wrapper_arg( self.size_arg.name )
+
+        buffer_var = controller.declare_variable(
+                          declarations.dummy_type_t( "pyplus_buffer::buffer_view_t< %s >" % self.buffer_item_type.decl_string )
+                        , "native_" + self.buffer_arg.name
+                        , '( %s, %s )' % ( w_buffer_arg.name, str( bool( self.writable ) ).lower() ) )
+
+        controller.modify_arg_expression( self.buffer_arg_index, '%s.data()' % buffer_var )
+        controller.modify_arg_expression( self.size_arg_index
+                                          , 'static_cast< %s >( %s.size() )'
+                                            % ( declarations.remove_const( self.size_arg.type ).decl_string, buffer_var ) )
+
+    def __configure_v_mem_fun_default( self, controller ):
+        self.__configure_sealed( controller )
+
+    def __configure_v_mem_fun_override( self, controller ):
+        #the override gets memoryview of the native buffer. The memoryview is
+        #released after the call, because the buffer could be destroyed.
+        py_buffer = controller.declare_py_variable(
+                          declarations.dummy_type_t( 'boost::python::object' )
+                        , 'py_' + self.buffer_arg.name
+                        , '( pyplus_buffer::borrowed_array( %s, %s, 0 ) )' % ( self.buffer_arg.name, self.size_arg.name ) )
+        controller.modify_py_arg_expression( self.buffer_arg_index, py_buffer )
+        controller.remove_py_arg( self.size_arg_index )
+        controller.add_py_post_call_code( '%s.attr( "release" )();' % py_buffer )
+
+    def configure_mem_fun( self, controller ):
+        self.__configure_sealed( controller )
+
+    def configure_free_fun(self, controller ):
+        self.__configure_sealed( controller )
+
+    def configure_virtual_mem_fun( self, controller ):
+        self.__configure_v_mem_fun_override( controller.override_controller )
+        self.__configure_v_mem_fun_default( controller.default_controller )
+
 class transfer_ownership_t(type_modifier_t):
     """see http://boost.org/libs/python/doc/v2/faq.html#ownership
     """
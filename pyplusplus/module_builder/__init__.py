@@ -9,6 +9,8 @@ This package provides simple and convenient interface to `Py++` functionality.
 
 from .boost_python_builder import builder_t as module_builder_t
 from .ctypes_builder import ctypes_module_builder_t
+from pyplusplus.creators_factory import type_traits_cache_t
+from .parse_cache import shared_parse_cache_t
 
 #aliases for functionality located in pygccxml.parser module
 from pygccxml.parser import COMPILATION_MODE
@@ -9,6 +9,7 @@ import time
 import types
 import warnings
 from . import module_builder
+from . import parse_cache
 
 from pygccxml import parser
 from pygccxml import utils as pygccxml_utils
@@ -20,6 +21,7 @@ from pyplusplus import decl_wrappers
 from pyplusplus import file_writers
 from pyplusplus import code_creators
 from pyplusplus import creators_factory
+from pyplusplus.utils import profiler as profiling
 
 class builder_t(module_builder.module_builder_t):
     """
@@ -44,7 +46,10 @@ class builder_t(module_builder.module_builder_t):
                   , cflags=""
                   , encoding='ascii'
                   , compiler=None
-                  , gccxml_config=None):
+                  , gccxml_config=None
+                  , profiler=None
+                  , shared_parse_cache=None
+                  , binary_exposed_decls_db=False):
         """
         :param files: list of files, declarations from them you want to export
         :type files: list of strings or :class:`parser.file_configuration_t` instances
@@ -68,9 +73,30 @@ class builder_t(module_builder.module_builder_t):
         :param gccxml_config: instance of pygccxml.parser.config_t class, holds
                               gccxml( compiler ) configuration. You can use this
                               argument instead of passing the compiler configuration separately.
+
+        :param profiler: if it is not None, the wall time, the CPU time and the peak memory
+                         of every code generation phase are recorded in it, as well as the
+                         rendering cost of every code creator class. Use
+                         :meth:`utils.phase_profiler_t.save` to write JSON report.
+        :type profiler: :class:`utils.phase_profiler_t`
+
+        :param shared_parse_cache: directory of the declarations cache, which could be shared
+                                   by all processes, which generate code, even if they
+                                   run concurrently. Every parsed file is cached separately,
+                                   so the common headers are parsed once. It is ignored, if
+                                   `cache` argument is given.
+        :type shared_parse_cache: str
+
+        :param binary_exposed_decls_db: if True, the exposed declarations database, written
+                                        together with the generated code, is saved in the
+                                        compact binary format. See :meth:`register_module_dependency`.
+        :type binary_exposed_decls_db: bool
         """
         module_builder.module_builder_t.__init__( self, global_ns=None, encoding=encoding )
 
+        self.profiler = profiler
+        self.binary_exposed_decls_db = binary_exposed_decls_db
+
         if not gccxml_config:
             gccxml_config = parser.config_t( gccxml_path=gccxml_path
                                              , working_directory=working_directory
@@ -82,22 +108,32 @@ class builder_t(module_builder.module_builder_t):
                                              , cflags=cflags
                                              , compiler=compiler)
 
+        if shared_parse_cache and not cache:
+            cache = parse_cache.shared_parse_cache_t( shared_parse_cache )
+
         #may be in future I will add those directories to user_defined_directories to self.__code_creator.
         self.__parsed_files = list(map( pygccxml_utils.normalize_path
                                    , parser.project_reader_t.get_os_file_names( files ) ))
         tmp = [os.path.split( file_ )[0] for file_ in self.__parsed_files]
         self.__parsed_dirs = [_f for _f in tmp if _f]
 
-        self.global_ns = self.__parse_declarations( files
-                                                    , gccxml_config
-                                                    , compilation_mode
-                                                    , cache
-                                                    , indexing_suite_version)
-        self.global_ns.decls(recursive=True, allow_empty=True)._code_generator = decl_wrappers.CODE_GENERATOR_TYPES.CTYPES
+        with profiling.activate( self.profiler ):
+            self.global_ns = self.__parse_declarations( files
+                                                        , gccxml_config
+                                                        , compilation_mode
+                                                        , cache
+                                                        , indexing_suite_version)
+            self.global_ns.decls(recursive=True, allow_empty=True)._code_generator = decl_wrappers.CODE_GENERATOR_TYPES.CTYPES
+
+            self.__code_creator = None
+            self.__dependencies_manager = None
+            if optimize_queries:
+                with profiling.phase( 'run_query_optimizer' ):
+                    self.run_query_optimizer()
 
-        self.__code_creator = None
-        if optimize_queries:
-            self.run_query_optimizer()
+        #memoises type traits, while the code creators tree is built. Set it
+        #to None to disable the memoisation.
+        self.type_traits_cache = creators_factory.type_traits_cache_t()
 
         self.__declarations_code_head = []
         self.__declarations_code_tail = []
@@ -122,9 +158,10 @@ class builder_t(module_builder.module_builder_t):
         the declarations.
         """
 
-        db = utils.exposed_decls_db_t()
-        db.load( other_module_generated_code_dir )
-        db.update_decls( self.global_ns )
+        with profiling.activate( self.profiler ), profiling.phase( 'register_module_dependency' ):
+            db = utils.exposed_decls_db_t()
+            db.load( other_module_generated_code_dir )
+            db.update_decls( self.global_ns )
 
 
     def __parse_declarations( self, files, gccxml_config, compilation_mode, cache, indexing_suite_version ):
@@ -132,12 +169,13 @@ class builder_t(module_builder.module_builder_t):
             gccxml_config = parser.config_t()
         if None is compilation_mode:
             compilation_mode = parser.COMPILATION_MODE.FILE_BY_FILE
-        start_time = time.clock()
+        start_time = time.perf_counter()
         self.logger.debug( 'parsing files - started' )
-        reader = parser.project_reader_t( gccxml_config, cache, decl_wrappers.dwfactory_t() )
-        decls = reader.read_files( files, compilation_mode )
+        with profiling.phase( 'parse' ):
+            reader = parser.project_reader_t( gccxml_config, cache, decl_wrappers.dwfactory_t() )
+            decls = reader.read_files( files, compilation_mode )
 
-        self.logger.debug( 'parsing files - done( %f seconds )' % ( time.clock() - start_time ) )
+        self.logger.debug( 'parsing files - done( %f seconds )' % ( time.perf_counter() - start_time ) )
         self.logger.debug( 'settings declarations defaults - started' )
 
         global_ns = decls_package.matcher.get_single(
@@ -149,10 +187,11 @@ class builder_t(module_builder.module_builder_t):
             for cls in global_ns.decls(decl_type=decls_package.class_declaration_t):
                 cls.indexing_suite_version = indexing_suite_version
 
-        start_time = time.clock()
-        self.__apply_decls_defaults(decls)
+        start_time = time.perf_counter()
+        with profiling.phase( 'apply_decls_defaults' ):
+            self.__apply_decls_defaults(decls)
         self.logger.debug( 'settings declarations defaults - done( %f seconds )'
-                           % ( time.clock() - start_time ) )
+                           % ( time.perf_counter() - start_time ) )
         return global_ns
 
     def __filter_by_location( self, flatten_decls ):
@@ -213,7 +252,11 @@ class builder_t(module_builder.module_builder_t):
                        , types_db=None
                        , target_configuration=None
                        , enable_indexing_suite=True
-                       , doc_extractor=None):
+                       , doc_extractor=None
+                       , code_cache=None
+                       , register_buffer_converters=False
+                       , processes=None
+                       , report_dependencies=True):
         """
         Creates :class:`code_creators.bpmodule_t` code creator.
 
@@ -228,18 +271,56 @@ class builder_t(module_builder.module_builder_t):
 
         :param doc_extractor: callable, that takes as argument reference to declaration and returns documentation string
         :type doc_extractor: callable or None
-        """
 
-        creator = creators_factory.bpcreator_t( self.global_ns
-                                                , module_name
-                                                , boost_python_ns_name
-                                                , call_policies_resolver_
-                                                , types_db
-                                                , target_configuration
-                                                , enable_indexing_suite )
-        self.__code_creator = creator.create()
-        self.__code_creator.replace_included_headers(self.__parsed_files)
-        self.__code_creator.update_documentation( doc_extractor )
+        :param code_cache: the code cache file name. `Py++` keeps in the file the code, generated
+                           for every function, variable and enum. This is a render cache: next time
+                           you generate code, the code creators tree is still built, but only
+                           declarations, which were changed, are rendered.
+        :type code_cache: str
+
+        :param register_buffer_converters: if True, `Py++` registers converters, which construct
+                                           `std::vector`, `boost::array` and `std::array` of fundamental
+                                           types, used as function arguments, from objects, which
+                                           support the buffer protocol: `array.array`, `numpy.ndarray`...
+        :type register_buffer_converters: bool
+
+        :param processes: number of worker processes, which create the code creators of the classes.
+                          The created code creators tree is identical to the one, created sequentially.
+        :type processes: int
+
+        :param report_dependencies: if False, the unexposed declarations, the exposed ones depend on,
+                                    are not reported. The report could be produced later, using
+                                    :meth:`report_dependencies` method.
+        :type report_dependencies: bool
+        """
+        with profiling.activate( self.profiler ), profiling.phase( 'build_code_creator' ):
+            try:
+                creator = creators_factory.bpcreator_t( self.global_ns
+                                                        , module_name
+                                                        , boost_python_ns_name
+                                                        , call_policies_resolver_
+                                                        , types_db
+                                                        , target_configuration
+                                                        , enable_indexing_suite
+                                                        , register_buffer_converters=register_buffer_converters
+                                                        , processes=processes
+                                                        , report_dependencies=report_dependencies
+                                                        , type_traits_cache=self.type_traits_cache )
+                self.__code_creator = creator.create()
+                self.__dependencies_manager = creator.dependencies_manager
+            finally:
+                #the user could change the declarations after the method returns
+                if self.type_traits_cache:
+                    self.type_traits_cache.clear()
+            self.__code_creator.replace_included_headers(self.__parsed_files)
+            with profiling.phase( 'update_documentation' ):
+                self.__code_creator.update_documentation( doc_extractor )
+            if code_cache:
+                self.__code_creator.code_cache = code_creators.code_cache_t( code_cache )
+            if self.profiler:
+                statistics = code_creators.render_statistics_t()
+                self.__code_creator.render_statistics = statistics
+                self.profiler.add_report( 'rendering', statistics.report )
         return self.__code_creator
 
     @property
@@ -249,6 +330,18 @@ class builder_t(module_builder.module_builder_t):
             raise RuntimeError( "self.module is equal to None. Did you forget to call build_code_creator function?" )
         return self.__code_creator
 
+    def report_dependencies( self ):
+        """reports the unexposed declarations, the exposed ones depend on
+
+        The report is produced by :meth:`build_code_creator`, unless it was
+        called with `report_dependencies=False`.
+        """
+        if self.__dependencies_manager is None:
+            raise RuntimeError( "The dependencies report is not available. Did you forget to call build_code_creator function? "
+                                "Call it with report_dependencies=False, to produce the report with this method only." )
+        with profiling.activate( self.profiler ), profiling.phase( 'report dependencies' ):
+            self.__dependencies_manager.inform_user()
+
     def has_code_creator( self ):
         """
         Function, that will return True if build_code_creator function has been
@@ -320,8 +413,17 @@ class builder_t(module_builder.module_builder_t):
         :type file_name: string
 
         """
-        self.__merge_user_code()
-        file_writers.write_file( self.code_creator, file_name, encoding=self.encoding )
+        with profiling.activate( self.profiler ), profiling.phase( 'write_module' ):
+            self.__merge_user_code()
+            file_writers.write_file( self.code_creator
+                                     , file_name
+                                     , encoding=self.encoding
+                                     , binary_exposed_decls_db=self.binary_exposed_decls_db )
+            self.__save_code_cache()
+
+    def __save_code_cache( self ):
+        if self.code_creator.code_cache:
+            self.code_creator.code_cache.save()
 
     def __work_on_unused_files( self, dir_name, written_files, on_unused_file_found ):
         all_files = os.listdir( dir_name )
@@ -341,7 +443,8 @@ class builder_t(module_builder.module_builder_t):
                       , dir_name
                       , huge_classes=None
                       , on_unused_file_found=os.remove
-                      , use_files_sum_repository=False):
+                      , use_files_sum_repository=False
+                      , processes=None):
         """
         writes module to multiple files
 
@@ -356,29 +459,39 @@ class builder_t(module_builder.module_builder_t):
         :param use_files_sum_repository: `Py++` can generate file, which will contain `md5` sum of every generated file.
                                           Next time you generate code, md5sum will be loaded from the file and compared.
                                           This could speed-up code generation process by 10-15%.
+
+        :param processes: number of worker processes, which render and write class files.
+                          The generated files are identical to the ones written sequentially.
+                          The argument is ignored, if `huge_classes` is specified.
+        :type processes: int
         """
-        self.__merge_user_code()
-
-        files_sum_repository = None
-        if use_files_sum_repository:
-            cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
-            files_sum_repository = file_writers.cached_repository_t( cache_file )
-
-        written_files = []
-        if None is huge_classes:
-            written_files = file_writers.write_multiple_files(
-                                self.code_creator
-                                , dir_name
-                                , files_sum_repository=files_sum_repository
-                                , encoding=self.encoding)
-        else:
-            written_files = file_writers.write_class_multiple_files(
-                                self.code_creator
-                                , dir_name
-                                , huge_classes
-                                , files_sum_repository=files_sum_repository
-                                , encoding=self.encoding)
-        self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
+        with profiling.activate( self.profiler ), profiling.phase( 'split_module' ):
+            self.__merge_user_code()
+
+            files_sum_repository = None
+            if use_files_sum_repository:
+                cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
+                files_sum_repository = file_writers.cached_repository_t( cache_file )
+
+            written_files = []
+            if None is huge_classes:
+                written_files = file_writers.write_multiple_files(
+                                    self.code_creator
+                                    , dir_name
+                                    , files_sum_repository=files_sum_repository
+                                    , encoding=self.encoding
+                                    , processes=processes
+                                    , binary_exposed_decls_db=self.binary_exposed_decls_db)
+            else:
+                written_files = file_writers.write_class_multiple_files(
+                                    self.code_creator
+                                    , dir_name
+                                    , huge_classes
+                                    , files_sum_repository=files_sum_repository
+                                    , encoding=self.encoding
+                                    , binary_exposed_decls_db=self.binary_exposed_decls_db)
+            self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
+            self.__save_code_cache()
 
         return written_files
 
@@ -386,7 +499,9 @@ class builder_t(module_builder.module_builder_t):
                                , dir_name
                                , number_of_files
                                , on_unused_file_found=os.remove
-                               , use_files_sum_repository=False):
+                               , use_files_sum_repository=False
+                               , processes=None
+                               , compile_cost=None):
         """
         Writes module to fixed number of multiple cpp files
 
@@ -402,21 +517,37 @@ class builder_t(module_builder.module_builder_t):
         :param use_files_sum_repository: `Py++` can generate file, which will contain md5 sum of every generated file.
                                           Next time you generate code, md5sum will be loaded from the file and compared.
                                           This could speed-up code generation process by 10-15%.
-        """
-        self.__merge_user_code()
-
-        files_sum_repository = None
-        if use_files_sum_repository:
-            cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
-            files_sum_repository = file_writers.cached_repository_t( cache_file )
 
-        written_files = file_writers.write_balanced_files( self.code_creator
-                                                           , dir_name
-                                                           , number_of_buckets=number_of_files
-                                                           , files_sum_repository=files_sum_repository
-                                                           , encoding=self.encoding)
+        :param processes: number of worker processes, which render and write the files.
+                          The generated files are identical to the ones written sequentially.
+        :type processes: int
 
-        self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
+        :param compile_cost: if it is not None, the classes are distributed between the files
+                             by their estimated compilation cost, instead of their number.
+                             It could be True, the cost profile file name or
+                             :class:`file_writers.compile_cost_estimator_t` instance.
+                             Use :func:`file_writers.record_compile_times` to record the
+                             real compilation time of the files in the cost profile.
+        """
+        with profiling.activate( self.profiler ), profiling.phase( 'balanced_split_module' ):
+            self.__merge_user_code()
+
+            files_sum_repository = None
+            if use_files_sum_repository:
+                cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
+                files_sum_repository = file_writers.cached_repository_t( cache_file )
+
+            written_files = file_writers.write_balanced_files( self.code_creator
+                                                               , dir_name
+                                                               , number_of_buckets=number_of_files
+                                                               , files_sum_repository=files_sum_repository
+                                                               , encoding=self.encoding
+                                                               , processes=processes
+                                                               , compile_cost=compile_cost
+                                                               , binary_exposed_decls_db=self.binary_exposed_decls_db)
+
+            self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
+            self.__save_code_cache()
 
         return written_files
 
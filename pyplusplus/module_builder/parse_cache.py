@@ -0,0 +1,169 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines declarations cache, which could be shared by few processes"""
+
+import os
+import mmap
+import shutil
+import pickle
+import hashlib
+import tempfile
+import pygccxml
+import pyplusplus
+from pygccxml.parser import declarations_cache
+
+class shared_parse_cache_t( declarations_cache.cache_base_t ):
+    """
+    content addressed, on disk cache of the parsed declarations
+
+    Every parsed file is kept in its own entry. The entry key is calculated
+    from the file content, the parser configuration( include paths, defined
+    symbols, flags ), the XML generator executable and the pygccxml and `Py++`
+    versions, so the cache directory could be shared by all processes, which
+    generate code for different modules. The entry also keeps the content
+    signatures of all included files and it is used, only if none of them was
+    changed.
+
+    Entries are written to a temporary file, which is renamed to the final
+    name, so the concurrent writers don't need a lock and the readers never
+    see a partially written entry. The entry is read through `mmap` and the
+    declarations are unpickled only after the included files were verified.
+    """
+
+    FORMAT_VERSION = 1
+    ENTRY_EXT = '.pypp.decls'
+
+    def __init__( self, directory ):
+        """
+        :param directory: the cache directory. It is created, if it doesn't exist.
+        :type directory: str
+        """
+        declarations_cache.cache_base_t.__init__( self )
+        self.__directory = os.path.abspath( directory )
+        if not os.path.isdir( self.__directory ):
+            try:
+                os.makedirs( self.__directory )
+            except OSError:
+                if not os.path.isdir( self.__directory ): #created by another process
+                    raise
+        self.__file_signatures = {} #file name : ( mtime, size, signature )
+        self.__generator_signatures = {} #executable : signature
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory( self ):
+        """the cache directory"""
+        return self.__directory
+
+    def _file_signature( self, file_name ):
+        """returns the file content signature, the value is recalculated only if
+        the file modification time or size were changed"""
+        try:
+            stat = os.stat( file_name )
+        except OSError:
+            return None
+        cached = self.__file_signatures.get( file_name )
+        if cached and cached[:2] == ( stat.st_mtime, stat.st_size ):
+            return cached[2]
+        signature = declarations_cache.file_signature( file_name )
+        self.__file_signatures[ file_name ] = ( stat.st_mtime, stat.st_size, signature )
+        return signature
+
+    def _generator_signature( self, configuration ):
+        """returns signature of the XML generator executable"""
+        executable = getattr( configuration, 'xml_generator_path', None ) \
+                     or getattr( configuration, 'gccxml_path', None ) \
+                     or ''
+        if executable not in self.__generator_signatures:
+            resolved = shutil.which( executable ) if executable else None
+            signature = executable
+            if resolved:
+                stat = os.stat( resolved )
+                signature = '%s:%d:%d' % ( resolved, stat.st_size, stat.st_mtime )
+            self.__generator_signatures[ executable ] = signature
+        return self.__generator_signatures[ executable ]
+
+    def _entry_key( self, source_file, configuration ):
+        content = self._file_signature( source_file )
+        if None is content:
+            return None
+        key = hashlib.sha1()
+        for item in ( self.FORMAT_VERSION
+                      , pygccxml.__version__
+                      , pyplusplus.__version__
+                      , self._generator_signature( configuration )
+                      , declarations_cache.configuration_signature( configuration )
+                      , content ):
+            key.update( str( item ).encode( 'utf-8' ) )
+        return key.hexdigest()
+
+    def _entry_path( self, key ):
+        return os.path.join( self.__directory, key[:2], key + self.ENTRY_EXT )
+
+    def cached_value( self, source_file, configuration ):
+        """returns the cached declarations or None"""
+        key = self._entry_key( source_file, configuration )
+        entry = key and self._entry_path( key )
+        if not entry or not os.path.exists( entry ):
+            self.misses += 1
+            return None
+        try:
+            f = open( entry, 'rb' )
+            try:
+                view = mmap.mmap( f.fileno(), 0, access=mmap.ACCESS_READ )
+                try:
+                    unpickler = pickle.Unpickler( view )
+                    included_files = unpickler.load()
+                    for file_name, signature in included_files:
+                        if self._file_signature( file_name ) != signature:
+                            self.misses += 1
+                            return None
+                    decls = unpickler.load()
+                finally:
+                    view.close()
+            finally:
+                f.close()
+        except Exception:
+            self.logger.debug( 'unable to load declarations cache entry "%s"' % entry )
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decls
+
+    def update( self, source_file, configuration, declarations, included_files ):
+        """writes new entry to the cache"""
+        key = self._entry_key( source_file, configuration )
+        if not key:
+            return
+        included_files = [ ( file_name, self._file_signature( file_name ) )
+                           for file_name in included_files ]
+        entry = self._entry_path( key )
+        entry_dir = os.path.dirname( entry )
+        if not os.path.isdir( entry_dir ):
+            try:
+                os.makedirs( entry_dir )
+            except OSError:
+                if not os.path.isdir( entry_dir ):
+                    raise
+        fd, temp_name = tempfile.mkstemp( suffix='.tmp', dir=entry_dir )
+        try:
+            f = os.fdopen( fd, 'wb' )
+            try:
+                pickler = pickle.Pickler( f, pickle.HIGHEST_PROTOCOL )
+                pickler.dump( included_files )
+                pickler.dump( declarations )
+            finally:
+                f.close()
+            os.replace( temp_name, entry )
+        except Exception:
+            if os.path.exists( temp_name ):
+                os.remove( temp_name )
+            raise
+
+    def flush( self ):
+        """the entries are written immediately, there is nothing to flush"""
+        pass
@@ -9,8 +9,11 @@ tree.
 """
 import os
 import math
+import struct
+from hashlib import md5
 from pygccxml import declarations
 from pyplusplus import code_creators  
+from .profiler import phase_profiler_t
 
 class missing_call_policies:
     @staticmethod
@@ -52,6 +55,42 @@ def split_sequence(seq, bucket_size):
         to = min( ( i + 1) * bucket_size, seq_len )
         buckets.append( seq[ from_ : to ] )
     return buckets
+
+def split_sequence_by_cost( seq, number_of_buckets, cost ):
+    """split sequence to maximum number_of_buckets contiguous buckets, so
+    the cost of the most "expensive" bucket is minimal
+
+    :param cost: callable, which returns the cost of the sequence item
+    """
+    costs = [ float( cost( item ) ) for item in seq ]
+    if not seq:
+        return []
+    if number_of_buckets <= 1:
+        return [ seq ]
+
+    def split( limit ):
+        buckets = [ [] ]
+        bucket_cost = 0.0
+        for item, item_cost in zip( seq, costs ):
+            if buckets[-1] and bucket_cost + item_cost > limit:
+                buckets.append( [] )
+                bucket_cost = 0.0
+            buckets[-1].append( item )
+            bucket_cost += item_cost
+        return buckets
+
+    #binary search for the smallest limit, the sequence could be split with
+    low = max( costs )
+    high = sum( costs )
+    for i in range( 64 ):
+        if high - low <= 1e-9 * high:
+            break
+        middle = ( low + high ) / 2
+        if len( split( middle ) ) <= number_of_buckets:
+            high = middle
+        else:
+            low = middle
+    return split( high )
     
 
 class exposed_decls_db_t( object ):
@@ -114,75 +153,108 @@ class exposed_decls_db_t( object ):
                    and self.signature == other.signature \
                    and self.normalized_name == other.normalized_name
         
+    #binary format: the magic, the number of rows and the sorted array of
+    #rows. Every row is the md5 digest of( key, normalized name, signature )
+    #followed by the exposed sign.
+    BINARY_MAGIC = b'PYPPEDB1'
+    BINARY_HEADER = struct.Struct( '<8sI' )
+    BINARY_ROW = struct.Struct( '<16sc' )
+
     def __init__( self ):
-        self.__registry = {} # key : { name : set(row) }
+        self.__registry = {} # row digest : exposed sign
+        self.__rows = {} # row digest : row, the binary file doesn't contain the rows
         self.__row_delimiter = os.linesep
-        
-    def save( self, fpath ):
+
+    @staticmethod
+    def row_digest( row ):
+        """returns md5 digest of the row, which identifies the declaration"""
+        return md5( '@'.join( [ row.key, row.normalized_name, row.signature ] ).encode( 'utf-8' ) ).digest()
+
+    def save( self, fpath, binary=False ):
+        """saves the database to the file
+
+        :param binary: if it is True the database is saved in the binary format,
+                       otherwise in the text one. The database, which contains
+                       declarations loaded from the binary file, could be saved
+                       in the binary format only.
+        """
+        if not binary and len( self.__rows ) != len( self.__registry ):
+            raise RuntimeError( 'The database contains declarations, loaded from the binary file. '
+                                'They could be saved in the binary format only.' )
         if os.path.isdir( fpath ):
             fpath = os.path.join( fpath, self.DEFAULT_FILE_NAME )
         f = open( fpath, 'w+b' )
-        for name2rows in self.__registry.values():
-            for rows in name2rows.values():
-                for row in rows:
-                    f.write( ('%s%s' % ( str(row), self.__row_delimiter )).encode('ascii') )
+        if binary:
+            f.write( self.BINARY_HEADER.pack( self.BINARY_MAGIC, len( self.__registry ) ) )
+            for digest, exposed_sign in sorted( self.__registry.items() ):
+                f.write( self.BINARY_ROW.pack( digest, exposed_sign.encode( 'ascii' ) ) )
+        else:
+            for row in self.__rows.values():
+                f.write( ('%s%s' % ( str(row), self.__row_delimiter )).encode('ascii') )
         f.close()
 
     def load( self, fpath ):
+        """loads the database from the file, the file format is detected automatically
+
+        The file is read at once and the rows of the binary file are unpacked
+        directly from the read buffer.
+        """
         if os.path.isdir( fpath ):
-            fpath = os.path.join( fpath, self.DEFAULT_FILE_NAME )        
+            fpath = os.path.join( fpath, self.DEFAULT_FILE_NAME )
         f = open( fpath, 'r+b' )
-        for line in f:
-            line = line.decode('ascii')
-            row = self.row_t( line.replace( self.__row_delimiter, '' ) )            
-            self.__update_registry( row )
-    
-    def __update_registry( self, row ):        
-        if row.key not in self.__registry:            
-            self.__registry[ row.key ] = { row.normalized_name : [row] }
-        else:       
-            if row.normalized_name not in self.__registry[ row.key ]:
-                self.__registry[ row.key ][row.normalized_name] = [row]
-            else:
-                self.__registry[ row.key ][row.normalized_name].append(row)
-    
+        data = f.read()
+        f.close()
+        if data.startswith( self.BINARY_MAGIC ):
+            self.__load_binary( data )
+        else:
+            for line in data.decode( 'ascii' ).splitlines():
+                if line:
+                    self.__update_registry( self.row_t( line ) )
+
+    def __load_binary( self, data ):
+        magic, size = self.BINARY_HEADER.unpack_from( data )
+        offset = self.BINARY_HEADER.size
+        rows = memoryview( data )[ offset : offset + size * self.BINARY_ROW.size ]
+        for digest, exposed_sign in self.BINARY_ROW.iter_unpack( rows ):
+            self.__registry.setdefault( digest, exposed_sign.decode( 'ascii' ) )
+
+    def __update_registry( self, row ):
+        digest = self.row_digest( row )
+        if digest not in self.__registry:
+            self.__registry[ digest ] = row.exposed_sign
+            self.__rows[ digest ] = row
+
     def __find_row_in_registry( self, row ):
-        try:
-            decls = [rrow for rrow in self.__registry[ row.key ][ row.normalized_name ] if rrow.does_refer_same_decl( row )]
-            if decls:
-                return decls[0]
-            else:
-                return None
-        except KeyError:
-            return None
-        
+        """returns the exposed sign of the row or None"""
+        return self.__registry.get( self.row_digest( row ) )
+
     def __find_in_registry( self, decl ):
         row = self.row_t( decl )
         found = self.__find_row_in_registry( row )
         if found:
-            return found        
+            return found
         if isinstance( decl, declarations.class_t ):
             row.update_key( declarations.class_declaration_t )
             found = self.__find_row_in_registry( row )
             if found:
-                return found        
+                return found
         if isinstance( decl, declarations.class_declaration_t ):
             row.update_key( declarations.class_t )
             found = self.__find_row_in_registry( row )
             if found:
-                return found        
+                return found
         return None
-        
+
     def is_exposed( self, decl ):
-        row = self.__find_in_registry( decl)
-        return row and self.row_t.EXPOSED_DECL_SIGN == row.exposed_sign
+        exposed_sign = self.__find_in_registry( decl)
+        return exposed_sign and self.row_t.EXPOSED_DECL_SIGN == exposed_sign
         
     def update_decls( self, global_ns ):
         for decl in global_ns.decls():
-            row = self.__find_in_registry( decl )
-            if not row:
+            exposed_sign = self.__find_in_registry( decl )
+            if not exposed_sign:
                 continue
-            if self.row_t.EXPOSED_DECL_SIGN == row.exposed_sign:
+            if self.row_t.EXPOSED_DECL_SIGN == exposed_sign:
                 decl.ignore = False
                 decl.already_exposed = True
             else:
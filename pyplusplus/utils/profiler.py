@@ -0,0 +1,164 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which measures the time and the memory, consumed by the
+code generation phases
+
+The phases are reported to the "active" profiler, so the code, which defines
+the phases, doesn't have to know whether the profiling is enabled::
+
+    from pyplusplus.utils import profiler
+
+    with profiler.phase( 'treat smart pointers' ):
+        ...
+
+The module builder activates its profiler for the duration of its methods.
+"""
+
+import json
+import time
+import contextlib
+try:
+    import resource
+except ImportError:
+    resource = None #Windows
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+class phase_profiler_t( object ):
+    """
+    collects wall time, CPU time and peak memory of the code generation phases
+
+    The phases could be nested, the name of the nested phase is prefixed by
+    the name of the enclosing one: "build_code_creator/treat smart pointers".
+    If the phase is entered few times, the measurements are accumulated.
+    """
+
+    PHASE_SEPARATOR = '/'
+
+    def __init__( self, trace_memory=False ):
+        """
+        :param trace_memory: if it is True, the peak memory of every phase is
+                             measured using :mod:`tracemalloc` module. It slows
+                             down the code generation significantly.
+        :type trace_memory: bool
+        """
+        object.__init__( self )
+        self.trace_memory = trace_memory and bool( tracemalloc )
+        self.__phases = {} #name : statistics
+        self.__stack = [] #[ [ name, peak memory ] ]
+        self.__reports = [] #[ ( name, callable ) ]
+
+    def __phase_statistics( self, name ):
+        if name not in self.__phases:
+            self.__phases[ name ] = { 'name' : name
+                                      , 'calls' : 0
+                                      , 'wall_time' : 0.0
+                                      , 'cpu_time' : 0.0
+                                      , 'peak_memory' : None
+                                      , 'max_rss' : None }
+        return self.__phases[ name ]
+
+    def __update_parents_peak( self ):
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self.__stack:
+            frame[1] = max( frame[1], peak )
+
+    @contextlib.contextmanager
+    def phase( self, name ):
+        """measures the phase, executed within the `with` statement"""
+        if self.__stack:
+            name = self.__stack[-1][0] + self.PHASE_SEPARATOR + name
+        statistics = self.__phase_statistics( name )
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            self.__update_parents_peak()
+            if hasattr( tracemalloc, 'reset_peak' ):
+                tracemalloc.reset_peak()
+        self.__stack.append( [ name, 0 ] )
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield statistics
+        finally:
+            statistics[ 'calls' ] += 1
+            statistics[ 'wall_time' ] += time.perf_counter() - start_wall
+            statistics[ 'cpu_time' ] += time.process_time() - start_cpu
+            if self.trace_memory:
+                self.__update_parents_peak()
+            frame = self.__stack.pop()
+            if self.trace_memory:
+                statistics[ 'peak_memory' ] = max( frame[1], statistics[ 'peak_memory' ] or 0 )
+                if started_tracing:
+                    tracemalloc.stop()
+            if resource:
+                statistics[ 'max_rss' ] = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+
+    @property
+    def phases( self ):
+        """list of the phases statistics, in the order they were started"""
+        return list( self.__phases.values() )
+
+    def add_report( self, name, report ):
+        """adds section to the report
+
+        :param report: callable, which returns the section content, when the
+                       report is created. The content should be serializable to JSON.
+        """
+        self.__reports = [ item for item in self.__reports if item[0] != name ]
+        self.__reports.append( ( name, report ) )
+
+    def report( self ):
+        """returns the report, which could be serialized to JSON
+
+        The wall and CPU times are in seconds, the peak memory is in bytes
+        and "max_rss" is the maximum resident set size of the process, as
+        reported by the operating system, at the end of the phase.
+        """
+        report = { 'phases' : self.phases }
+        for name, section in self.__reports:
+            report[ name ] = section()
+        return report
+
+    def save( self, file_name ):
+        """writes the report to the file, in JSON format"""
+        f = open( file_name, 'w+' )
+        try:
+            json.dump( self.report(), f, indent=1 )
+        finally:
+            f.close()
+
+#the profiler, the phases are reported to
+__active = [ None ]
+
+def active():
+    """returns the active profiler or None"""
+    return __active[0]
+
+@contextlib.contextmanager
+def activate( profiler ):
+    """makes the profiler active, within the `with` statement. The profiler
+    could be None, in this case the phases are not measured"""
+    previous = __active[0]
+    __active[0] = profiler
+    try:
+        yield profiler
+    finally:
+        __active[0] = previous
+
+@contextlib.contextmanager
+def phase( name ):
+    """measures the phase, using the active profiler, if there is one"""
+    profiler = __active[0]
+    if None is profiler:
+        yield None
+    else:
+        with profiler.phase( name ) as statistics:
+            yield statistics
@@ -21,6 +21,39 @@ class indent_tester_t(unittest.TestCase):
         indent = code_creators.code_creator_t.indent
         self.failUnless( '    abc' == indent('abc') )
 
+class compound_tester_t(unittest.TestCase):
+    def test( self ):
+        compound = code_creators.compound_t()
+        texts = [ code_creators.custom_text_t( str( i ) ) for i in range( 6 ) ]
+        compound.adopt_creators( texts[:3] )
+        compound.adopt_creators( texts[3:5], 1 )
+        self.failUnless( compound.creators == [ texts[0], texts[3], texts[4], texts[1], texts[2] ] )
+        compound.remove_creator( texts[3] )
+        self.failUnless( texts[3].parent is None )
+        compound.move_creators( [ texts[0], texts[4] ] )
+        self.failUnless( compound.creators == [ texts[1], texts[2], texts[0], texts[4] ] )
+        compound.adopt_creators_before( [ texts[5] ], texts[2] )
+        self.failUnless( compound.creators == [ texts[1], texts[5], texts[2], texts[0], texts[4] ] )
+        compound.move_creators( [ texts[4] ], texts[1] )
+        self.failUnless( compound.creators == [ texts[4], texts[1], texts[5], texts[2], texts[0] ] )
+
+    def test_list_modification( self ):
+        compound = code_creators.compound_t()
+        inner = code_creators.compound_t()
+        texts = [ code_creators.custom_text_t( str( i ) ) for i in range( 3 ) ]
+        compound.adopt_creators( texts[:2] + [ inner ] )
+        first = compound.creators[0]
+        del compound.creators[0]
+        inner.adopt_creator( first, 0 )
+        compound.remove_creator( texts[1] )
+        self.failUnless( compound.creators == [ inner ] )
+        self.failUnless( first.parent is inner )
+        compound.creators.insert( 0, texts[2] )
+        self.failUnless( compound.creators == [ texts[2], inner ] )
+        self.failUnless( texts[2].parent is compound )
+        compound.move_creators( [ texts[2] ] )
+        self.failUnless( compound.creators == [ inner, texts[2] ] )
+
 class make_flatten_tester_t(unittest.TestCase):
     def test(self):
         mb = module_builder.module_builder_t(
@@ -32,6 +65,38 @@ class make_flatten_tester_t(unittest.TestCase):
         flatten = code_creators.make_flatten(mb.code_creator.creators)
         self.failUnless( [inst for inst in flatten if isinstance( inst, code_creators.unnamed_enum_t )] )
 
+class namespace_aliases_tester_t( unittest.TestCase ):
+    def test(self):
+        outer = code_creators.compound_t()
+        outer.adopt_creator( code_creators.custom_text_t( '//x' ) )
+        bp_alias = code_creators.namespace_alias_t( 'bp', '::boost::python' )
+        outer.adopt_creator( bp_alias )
+        inner = code_creators.compound_t()
+        outer.adopt_creator( inner )
+        before = code_creators.custom_text_t( '//before' )
+        inner.adopt_creator( before )
+        std_alias = code_creators.namespace_alias_t( 'ss', '::std' )
+        inner.adopt_creator( std_alias )
+        after = code_creators.custom_text_t( '//after' )
+        inner.adopt_creator( after )
+        expected = lambda cc: [x for x in code_creators.creators_affect_on_me( cc )
+                               if isinstance( x, code_creators.namespace_alias_t )]
+        for cc in ( before, std_alias, after, inner ):
+            self.failUnless( expected( cc ) == code_creators.namespace_aliases_affect_on_me( cc ) )
+        self.failUnless( 'ss::string' == code_creators.create_identifier( after, '::std::string' ) )
+        self.failUnless( 'std::string' == code_creators.create_identifier( before, '::std::string' ) )
+        self.failUnless( 'bp::object' == code_creators.create_identifier( before, '::boost::python::object' ) )
+
+        inner.remove_creator( std_alias )
+        self.failUnless( 'std::string' == code_creators.create_identifier( after, '::std::string' ) )
+        inner.adopt_creator( std_alias, 0 )
+        self.failUnless( 'ss::string' == code_creators.create_identifier( before, '::std::string' ) )
+
+        include = code_creators.custom_text_t( '//include' )
+        outer.adopt_creators_before( [ include ], bp_alias )
+        self.failUnless( not code_creators.namespace_aliases_affect_on_me( include ) )
+        self.failUnless( [ std_alias, bp_alias ] == code_creators.namespace_aliases_affect_on_me( after ) )
+
 class creator_finder_tester_t( unittest.TestCase ):
     def test_find_by_declaration(self):
         mb = module_builder.module_builder_t(
@@ -57,6 +122,41 @@ class creator_finder_tester_t( unittest.TestCase ):
             , recursive=True)
         self.failUnless( enum_found )
 
+    def test_module_index(self):
+        code = """
+            namespace index{
+                struct x{
+                    void do_nothing(){}
+                    int do_something(){ return 1; }
+                    struct x_nested{};
+                };
+                struct y{
+                    enum color{ red, blue };
+                    void check_overload( int i=0, int j=1 );
+                };
+            }
+        """
+        mb = module_builder.module_builder_t(
+            [ module_builder.create_text_fc( code )]
+            , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( name='::index' ).include()
+        mb.build_code_creator('dummy')
+        module = mb.code_creator
+        for class_ in ( code_creators.class_t, code_creators.mem_fun_t, code_creators.include_t ):
+            self.failUnless( code_creators.creator_finder.find_by_class_instance( class_, module.creators )
+                             == module.find_by_class_instance( class_ ) )
+        for decl in mb.global_ns.decls( recursive=True, allow_empty=True ):
+            found = code_creators.creator_finder.find_by_declaration( lambda d: d is decl, module.creators )
+            self.failUnless( set( map( id, found ) ) == set( map( id, module.find_by_declaration( decl ) ) ) )
+
+        body = module.body
+        class_creator = module.find_by_class_instance( code_creators.class_t )[0]
+        body.remove_creator( class_creator )
+        self.failUnless( class_creator not in module.find_by_class_instance( code_creators.class_t ) )
+        self.failUnless( class_creator not in module.find_by_declaration( class_creator.declaration ) )
+        body.adopt_creator( class_creator, 0 )
+        self.failUnless( class_creator is module.find_by_class_instance( code_creators.class_t )[0] )
+
 class class_organizer_tester_t(unittest.TestCase):
     def __init__(self, *args ):
         unittest.TestCase.__init__(self, *args)
@@ -220,6 +320,16 @@ class split_sequence_tester_t(unittest.TestCase):
         self.failUnless( [[1,2,3]] == split( seq, 3 ) )
         self.failUnless( [[1,2,3]] == split( seq, 4 ) )
 
+    def test_by_cost(self):
+        split = pypp_utils.split_sequence_by_cost
+        cost = lambda item: item
+        self.failUnless( [[9],[1,1,1,2,2]] == split( [9,1,1,1,2,2], 3, cost ) )
+        self.failUnless( [[3,3],[4,1,1],[5]] == split( [3,3,4,1,1,5], 3, cost ) )
+        self.failUnless( [[1,2],[3]] == split( [1,2,3], 2, cost ) )
+        self.failUnless( [[1,2,3]] == split( [1,2,3], 1, cost ) )
+        self.failUnless( [[5],[1]] == split( [5,1], 4, cost ) )
+        self.failUnless( [] == split( [], 2, cost ) )
+
 class doc_extractor_tester_t( unittest.TestCase ):
     def test( self ):
         escaped_doc = module_builder.doc_extractor_i.escape_doc('Hello "Py++"')
@@ -312,8 +422,10 @@ def create_suite():
     suite.addTest( unittest.makeSuite(indent_tester_t))
     suite.addTest( unittest.makeSuite(make_flatten_tester_t))
     suite.addTest( unittest.makeSuite(creator_finder_tester_t))
+    suite.addTest( unittest.makeSuite(namespace_aliases_tester_t))
     suite.addTest( unittest.makeSuite(exclude_function_with_array_arg_tester_t))
     suite.addTest( unittest.makeSuite(class_multiple_files_tester_t))
+    suite.addTest( unittest.makeSuite(compound_tester_t))
     suite.addTest( unittest.makeSuite(readme_tester_t))
     suite.addTest( unittest.makeSuite(split_sequence_tester_t))
     suite.addTest( unittest.makeSuite(exclude_erronious_tester_t))
@@ -0,0 +1,42 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import array
+import unittest
+import fundamental_tester_base
+
+class tester_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'buffer_converters'
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , tester_t.EXTENSION_NAME
+            , *args )
+
+    def customize(self, mb ):
+        mb.build_code_creator( self.EXTENSION_NAME, register_buffer_converters=True )
+
+    def run_tests(self, module):
+        self.failUnless( 6.5 == module.sum_doubles( array.array( 'd', [ 1, 2, 3.5 ] ) ) )
+        self.failUnless( 6 == module.sum_ints( array.array( 'i', [ 1, 2, 3 ] ) ) )
+        self.failUnless( 0 == module.sum_ints( array.array( 'i' ) ) )
+        self.failUnless( 6 == module.sum_3_ints( array.array( 'i', [ 1, 2, 3 ] ) ) )
+        #the item type and the size are checked
+        self.failIfNotRaisesAny( module.sum_doubles, array.array( 'i', [ 1, 2, 3 ] ) )
+        self.failIfNotRaisesAny( module.sum_3_ints, array.array( 'i', [ 1, 2 ] ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,189 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""measures the call overhead of the generated bindings
+
+The script builds the representative modules, using the same flow as the
+testers, measures every scenario and writes the results to JSON file.
+The results of two runs could be compared::
+
+    python call_overhead_benchmark.py [--output results.json] [--compare previous.json]
+"""
+
+from __future__ import print_function
+import os
+import sys
+import json
+import time
+import timeit
+import platform
+import unittest
+#autoconfig changes the current directory, the command line file names are
+#relative to the original one
+initial_working_directory = os.getcwd()
+import autoconfig
+import fundamental_tester_base
+from pyplusplus import function_transformers as ft
+
+FORMAT_VERSION = 1
+
+class benchmark_t( object ):
+    """measures scenarios and keeps the results"""
+
+    def __init__( self, number=100000, repeat=5 ):
+        object.__init__( self )
+        self.number = number
+        self.repeat = repeat
+        self.results = {} #scenario name : statistics
+
+    def measure( self, name, scenario ):
+        """measures the callable, which executes the scenario once"""
+        timings = timeit.repeat( scenario, repeat=self.repeat, number=self.number )
+        timings = sorted( t * 1e9 / self.number for t in timings )
+        self.results[ name ] = { 'calls' : self.number
+                                 , 'repeat' : self.repeat
+                                 , 'best_ns' : timings[0]
+                                 , 'median_ns' : timings[ len( timings ) // 2 ] }
+
+    def report( self ):
+        """returns the report, which could be serialized to JSON"""
+        return { 'format' : FORMAT_VERSION
+                 , 'created' : time.strftime( '%Y-%m-%dT%H:%M:%S' )
+                 , 'python' : platform.python_version()
+                 , 'platform' : platform.platform()
+                 , 'results' : self.results }
+
+    def save( self, file_name ):
+        """writes the report to the file, in JSON format"""
+        f = open( file_name, 'w+' )
+        try:
+            json.dump( self.report(), f, indent=1, sort_keys=True )
+        finally:
+            f.close()
+
+def compare( previous, current ):
+    """returns list of ( scenario, previous best, current best, ratio ), for
+    scenarios, which exist in both reports"""
+    answer = []
+    for name in sorted( current[ 'results' ] ):
+        if name not in previous[ 'results' ]:
+            continue
+        before = previous[ 'results' ][ name ][ 'best_ns' ]
+        after = current[ 'results' ][ name ][ 'best_ns' ]
+        answer.append( ( name, before, after, after / before ) )
+    return answer
+
+#the results of all scenarios, the testers add their measurements to it
+benchmark = benchmark_t()
+
+class tester_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'call_overhead_benchmark'
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , tester_t.EXTENSION_NAME
+            , *args )
+
+    def customize(self, mb ):
+        mb.free_fun( 'get_size' ).add_transformation( ft.output( 0 ), ft.output( 1 ) )
+        mb.free_fun( 'increment' ).add_transformation( ft.inout( 0 ) )
+        mb.free_fun( 'sum_3' ).add_transformation( ft.input_static_array( 0, 3 ) )
+        shared_item = mb.class_( 'shared_item_t' )
+        shared_item.held_type = 'boost::shared_ptr< %s >' % shared_item.decl_string
+        point = mb.class_( 'point_t' )
+        point.add_property( 'x', point.mem_fun( 'get_x' ), point.mem_fun( 'set_x' ) )
+
+    def run_tests(self, module):
+        measure = benchmark.measure
+
+        def python_function():
+            pass
+        measure( 'python function', python_function )
+
+        measure( 'free function/no arguments', module.do_nothing )
+        measure( 'free function/2 arguments', lambda: module.add( 1, 2 ) )
+
+        class py_worker_t( module.worker_t ):
+            def run( self, i ):
+                return i
+        worker = module.worker_t()
+        py_worker = py_worker_t()
+        measure( 'virtual/default implementation', lambda: worker.run( 1 ) )
+        measure( 'virtual/C++ calls default implementation', lambda: module.call_run( worker, 1 ) )
+        measure( 'virtual/C++ calls Python override', lambda: module.call_run( py_worker, 1 ) )
+
+        values = [ 1, 2, 3 ]
+        measure( 'transformation/output_t', module.get_size )
+        measure( 'transformation/inout_t', lambda: module.increment( 1 ) )
+        measure( 'transformation/input_static_array_t', lambda: module.sum_3( values ) )
+
+        ints = module.make_ints( 100 )
+        measure( 'indexing suite v1/__getitem__', lambda: ints[50] )
+        measure( 'indexing suite v1/__setitem__', lambda: ints.__setitem__( 50, 2 ) )
+        measure( 'indexing suite v1/__len__', lambda: len( ints ) )
+        measure( 'indexing suite v1/iteration of 100 items', lambda: [ i for i in ints ] )
+
+        shared_item = module.create_shared_item()
+        measure( 'smart pointer/create', module.create_shared_item )
+        measure( 'smart pointer/pass as argument', lambda: module.get_shared_value( shared_item ) )
+        measure( 'smart pointer/member function', shared_item.get_value )
+
+        point = module.point_t()
+        measure( 'property/get', lambda: point.x )
+        measure( 'property/set', lambda: setattr( point, 'x', 1 ) )
+        measure( 'member variable/get', lambda: point.y )
+        measure( 'member variable/set', lambda: setattr( point, 'y', 1 ) )
+
+class indexing_suite_v2_tester_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'call_overhead_benchmark_v2'
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , indexing_suite_v2_tester_t.EXTENSION_NAME
+            , indexing_suite_version=2
+            , *args )
+
+    def run_tests(self, module):
+        measure = benchmark.measure
+        ints = module.make_ints( 100 )
+        measure( 'indexing suite v2/__getitem__', lambda: ints[50] )
+        measure( 'indexing suite v2/__setitem__', lambda: ints.__setitem__( 50, 2 ) )
+        measure( 'indexing suite v2/__len__', lambda: len( ints ) )
+        measure( 'indexing suite v2/iteration of 100 items', lambda: [ i for i in ints ] )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    suite.addTest( unittest.makeSuite(indexing_suite_v2_tester_t))
+    return suite
+
+def run_suite( output=None, previous=None ):
+    result = unittest.TextTestRunner(verbosity=2).run( create_suite() )
+    if not result.wasSuccessful():
+        return False
+    if None is output:
+        output = os.path.join( autoconfig.build_dir, 'call_overhead_benchmark.json' )
+    benchmark.save( output )
+    print( 'results were written to "%s"' % output )
+    if previous:
+        f = open( previous )
+        try:
+            previous_report = json.load( f )
+        finally:
+            f.close()
+        for name, before, after, ratio in compare( previous_report, benchmark.report() ):
+            print( '%-50s %10.1f ns %10.1f ns %6.2f' % ( name, before, after, ratio ) )
+    return True
+
+if __name__ == "__main__":
+    import optparse
+    parser = optparse.OptionParser()
+    parser.add_option( '--output', help='the results file name' )
+    parser.add_option( '--compare', help='the results file name of the previous run' )
+    options = parser.parse_args()[0]
+    to_abs = lambda fpath: fpath and os.path.join( initial_working_directory, fpath )
+    sys.exit( not run_suite( to_abs( options.output ), to_abs( options.compare ) ) )
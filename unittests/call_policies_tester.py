@@ -76,6 +76,12 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         get_raw_data_const = image.mem_fun( 'get_raw_data_const' )
         get_raw_data_const.call_policies \
             = call_policies.return_range( get_raw_data_const, 'raw_data_size_t' )
+        get_raw_buffer = image.mem_fun( 'get_raw_buffer' )
+        get_raw_buffer.call_policies \
+            = call_policies.return_range( get_raw_buffer, 'raw_data_size_t', as_buffer=True )
+        get_raw_buffer_const = image.mem_fun( 'get_raw_buffer_const' )
+        get_raw_buffer_const.call_policies \
+            = call_policies.return_range( get_raw_buffer_const, 'raw_data_size_t', as_buffer=True )
         create_images = image.mem_fun( 'create_images' )
         create_images.call_policies \
             = call_policies.return_range( create_images
@@ -119,6 +125,15 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         self.failUnless( ['1', '\0', '2']==list( raw_data ) )
         raw_data[1] = 'x'
         self.failUnless( raw_data[1] == image.raw_data[1] )
+        raw_buffer = image.get_raw_buffer()
+        self.failUnless( b'1x2' == bytes( raw_buffer ) )
+        raw_buffer[1] = b'y'
+        raw_buffer_const = image.get_raw_buffer_const()
+        self.failUnless( raw_buffer_const.readonly )
+        self.failUnless( b'y' == raw_buffer_const[1] )
+        del image
+        self.failUnless( b'1y2' == bytes( raw_buffer_const ) ) #the image is kept alive
+        image = module.return_range_image_t()
         for index, img in enumerate( image.create_images() ):
             print(index, img)
 
@@ -0,0 +1,107 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import code_creators
+from pyplusplus import module_builder
+
+class custom_value_t( object ):
+    def __init__( self, value ):
+        self.value = value
+
+class tester_t(unittest.TestCase):
+    CODE = """
+        namespace code_cache{
+            struct item_t{
+                item_t(){}
+                item_t( int ){}
+
+                void do_nothing(){}
+
+                int do_something(){ return 1; }
+
+                void check_overload( int i=0, int j=1 );
+
+                float* get_rate(){
+                    return 0;
+                }
+
+                int m_value;
+            };
+
+            enum color{ red, blue };
+
+            int sum( int i, int j );
+        }
+    """
+
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'code_cache' ).include()
+        mb.mem_fun( 'get_rate' ).call_policies \
+            = module_builder.call_policies.return_value_policy( module_builder.call_policies.return_pointee_value )
+        return mb
+
+    def write_module( self, mb, cache_file ):
+        mb.build_code_creator( 'x_code_cache', code_cache=cache_file )
+        file_name = os.path.join( autoconfig.build_dir, 'x_code_cache.cpp' )
+        mb.write_module( file_name )
+        f = open( file_name )
+        code = f.read()
+        f.close()
+        return code
+
+    def test(self):
+        cache_file = os.path.join( autoconfig.build_dir, 'x_code_cache.pypp.cache' )
+        if os.path.exists( cache_file ):
+            os.remove( cache_file )
+
+        mb = self.create_module_builder()
+        first_code = self.write_module( mb, cache_file )
+        self.failUnless( 0 == mb.code_creator.code_cache.hits )
+        self.failUnless( mb.code_creator.code_cache.misses )
+
+        mb = self.create_module_builder()
+        second_code = self.write_module( mb, cache_file )
+        self.failUnless( first_code == second_code )
+        self.failUnless( 0 == mb.code_creator.code_cache.misses )
+        self.failUnless( mb.code_creator.code_cache.hits )
+
+        mb = self.create_module_builder()
+        mb.mem_fun( 'get_rate' ).call_policies \
+            = module_builder.call_policies.return_internal_reference()
+        third_code = self.write_module( mb, cache_file )
+        self.failUnless( first_code != third_code )
+        self.failUnless( 'return_internal_reference' in third_code )
+        self.failUnless( 0 < mb.code_creator.code_cache.misses )
+
+    def test_unknown_value(self):
+        cache_file = os.path.join( autoconfig.build_dir, 'x_unknown_value.pypp.cache' )
+        mb = self.create_module_builder()
+        mb.build_code_creator( 'x_code_cache' )
+        creator = [ c for c in code_creators.make_flatten( mb.code_creator )
+                    if isinstance( c, code_creators.mem_fun_t ) and c.declaration.name == 'do_nothing' ][0]
+        keys = []
+        for value in ( 1, 1, 2 ):
+            creator.declaration.custom_value = custom_value_t( value )
+            keys.append( code_creators.code_cache_t( cache_file ).create_key( creator ) )
+        self.failUnless( keys[0] == keys[1] )
+        self.failUnless( keys[0] != keys[2] )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
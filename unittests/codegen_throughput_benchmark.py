@@ -0,0 +1,244 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""measures the code generation throughput on synthetic declarations tree
+
+The declarations are created directly, without parsing, so neither compiler
+nor gccxml are needed. For every scale point the script creates the tree,
+runs :class:`creators_factory.bpcreator_t` and :class:`file_writers.multiple_files_t`
+on it and reports the time and the peak memory of every phase::
+
+    python codegen_throughput_benchmark.py [--scales 1,2,4,8] [--classes 25] [--output report.json]
+
+The base configuration is multiplied by every scale point, so the phases,
+which time grows faster than the scale, stand out.
+
+If ``--code-cache`` is given, the module is written two more times, using
+:class:`code_creators.code_cache_t`: with empty cache and with the cache,
+filled by the previous run.
+"""
+
+from __future__ import print_function
+import os
+import sys
+import json
+import shutil
+import optparse
+import tempfile
+#autoconfig changes the current directory, the command line file names are
+#relative to the original one
+initial_working_directory = os.getcwd()
+import autoconfig
+from pygccxml import declarations
+from pyplusplus import file_writers
+from pyplusplus import code_creators
+from pyplusplus import decl_wrappers
+from pyplusplus import creators_factory
+from pyplusplus import utils as pypp_utils
+from pyplusplus.utils import profiler as profiling
+
+HEADER = 'synthetic_declarations.hpp'
+
+class config_t( object ):
+    """describes the size and the shape of the synthetic declarations tree"""
+
+    def __init__( self
+                  , namespaces=4
+                  , classes=25
+                  , methods=10
+                  , overloads=2
+                  , instantiations=5 ):
+        """
+        :param namespaces: the number of namespaces
+        :param classes: the number of classes in every namespace
+        :param methods: the number of the member functions names in every class
+        :param overloads: the number of overloads of every member function
+        :param instantiations: the number of class template instantiations in every namespace
+        """
+        object.__init__( self )
+        self.namespaces = namespaces
+        self.classes = classes
+        self.methods = methods
+        self.overloads = overloads
+        self.instantiations = instantiations
+
+    def scale( self, factor ):
+        """returns new configuration, with the number of classes multiplied by the factor"""
+        return config_t( self.namespaces, self.classes * factor, self.methods
+                         , self.overloads, self.instantiations * factor )
+
+    def report( self ):
+        return dict( vars( self ) )
+
+class declarations_generator_t( object ):
+    """creates synthetic declarations tree, using `Py++` declarations factory"""
+
+    def __init__( self, config ):
+        object.__init__( self )
+        self.config = config
+        self.factory = decl_wrappers.dwfactory_t()
+        self.__line = 0
+
+    def __adopt( self, parent, decl ):
+        self.__line += 1
+        decl.location = declarations.location_t( HEADER, self.__line )
+        if isinstance( parent, declarations.class_t ):
+            parent.adopt_declaration( decl, declarations.ACCESS_TYPES.PUBLIC )
+        else:
+            parent.adopt_declaration( decl )
+        return decl
+
+    def __argument( self, index, type_ ):
+        return declarations.argument_t( 'a%d' % index, type_ )
+
+    def __const_ref( self, cls ):
+        return declarations.reference_t( declarations.const_t( declarations.declarated_t( cls ) ) )
+
+    def __add_constructor( self, cls ):
+        constructor = self.factory.create_constructor( name=cls.name, arguments=[] )
+        self.__adopt( cls, constructor )
+
+    def __create_instantiations( self, ns, ns_index ):
+        answer = []
+        for i in range( self.config.instantiations ):
+            #unique across the namespaces, so the aliases and the file names do not clash
+            value = ns_index * self.config.instantiations + i
+            cls = self.factory.create_class( name='holder_t< %d >' % value, class_type='struct' )
+            self.__adopt( ns, cls )
+            self.__add_constructor( cls )
+            getter = self.factory.create_member_function( name='get'
+                                                          , arguments=[]
+                                                          , return_type=declarations.int_t()
+                                                          , has_const=True )
+            self.__adopt( cls, getter )
+            answer.append( cls )
+        return answer
+
+    def __create_class( self, ns, ns_index, index, holders ):
+        cls = self.factory.create_class( name='class_%d_%d_t' % ( ns_index, index ), class_type='struct' )
+        self.__adopt( ns, cls )
+        self.__add_constructor( cls )
+        arg_types = [ declarations.int_t(), declarations.double_t() ]
+        if holders:
+            arg_types.append( self.__const_ref( holders[ index % len( holders ) ] ) )
+        for m in range( self.config.methods ):
+            for o in range( self.config.overloads ):
+                arguments = [ self.__argument( i, arg_types[ i % len( arg_types ) ] )
+                              for i in range( o + 1 ) ]
+                method = self.factory.create_member_function( name='method_%d' % m
+                                                              , arguments=arguments
+                                                              , return_type=declarations.int_t() )
+                self.__adopt( cls, method )
+        variable = self.factory.create_variable( 'value', declarations.int_t() )
+        self.__adopt( cls, variable )
+        return cls
+
+    def create( self ):
+        """returns the global namespace of the synthetic declarations tree"""
+        global_ns = self.factory.create_namespace( name='::' )
+        for n in range( self.config.namespaces ):
+            ns = self.__adopt( global_ns, self.factory.create_namespace( name='ns_%d' % n ) )
+            holders = self.__create_instantiations( ns, n )
+            classes = [ self.__create_class( ns, n, c, holders ) for c in range( self.config.classes ) ]
+            for index, cls in enumerate( classes ):
+                #free functions, which connect the classes
+                arguments = [ self.__argument( 0, self.__const_ref( cls ) ) ]
+                function = self.factory.create_free_function( name='use_class_%d' % index
+                                                              , arguments=arguments
+                                                              , return_type=declarations.void_t() )
+                self.__adopt( ns, function )
+        return global_ns
+
+def apply_decls_defaults( global_ns ):
+    resolver = creators_factory.built_in_resolver_t()
+    for calldef in global_ns.calldefs( allow_empty=True ):
+        calldef.set_call_policies( resolver( calldef ) )
+
+def write_using_code_cache( global_ns, output_dir ):
+    #the files writer changes the code creators tree, so every run creates new one
+    cache_file = os.path.join( output_dir, 'synthetic.pypp.cache' )
+    statistics = {}
+    for name in ( 'empty', 'filled' ):
+        extmodule = creators_factory.bpcreator_t( global_ns, 'synthetic' ).create( decl_headers=[ HEADER ] )
+        cache = code_creators.code_cache_t( cache_file )
+        extmodule.code_cache = cache
+        with profiling.phase( 'split_module (%s code cache)' % name ):
+            file_writers.multiple_files_t( extmodule, output_dir ).write()
+        cache.save()
+        statistics[ name ] = { 'hits' : cache.hits, 'misses' : cache.misses }
+    return statistics
+
+def run_scale_point( config, output_dir, code_cache=False ):
+    """generates the code for the configuration and returns the profiler report"""
+    profiler = pypp_utils.phase_profiler_t( trace_memory=True )
+    with profiling.activate( profiler ):
+        with profiling.phase( 'create declarations' ):
+            global_ns = declarations_generator_t( config ).create()
+        with profiling.phase( 'apply_decls_defaults' ):
+            apply_decls_defaults( global_ns )
+        with profiling.phase( 'build_code_creator' ):
+            creator = creators_factory.bpcreator_t( global_ns, 'synthetic' )
+            extmodule = creator.create( decl_headers=[ HEADER ] )
+        with profiling.phase( 'split_module' ):
+            writer = file_writers.multiple_files_t( extmodule, output_dir )
+            writer.write()
+        if code_cache:
+            cache_statistics = write_using_code_cache( global_ns, output_dir )
+    report = profiler.report()
+    if code_cache:
+        report[ 'code_cache' ] = cache_statistics
+    report[ 'config' ] = config.report()
+    report[ 'declarations' ] = len( global_ns.decls( recursive=True, allow_empty=True ) )
+    return report
+
+def print_report( reports ):
+    names = []
+    for report in reports:
+        for phase in report[ 'phases' ]:
+            if phase[ 'name' ] not in names:
+                names.append( phase[ 'name' ] )
+    print( '%-60s' % 'declarations' + ''.join( '%12d' % r[ 'declarations' ] for r in reports ) )
+    for name in names:
+        line = [ '%-60s' % name ]
+        for report in reports:
+            phases = dict( ( p[ 'name' ], p ) for p in report[ 'phases' ] )
+            if name in phases:
+                line.append( '%11.3fs' % phases[ name ][ 'wall_time' ] )
+            else:
+                line.append( '%12s' % '-' )
+        print( ''.join( line ) )
+
+def run( base_config, scales, output=None, code_cache=False ):
+    reports = []
+    for factor in scales:
+        output_dir = tempfile.mkdtemp( prefix='pypp_throughput_', dir=autoconfig.build_dir )
+        try:
+            reports.append( run_scale_point( base_config.scale( factor ), output_dir, code_cache ) )
+        finally:
+            shutil.rmtree( output_dir )
+    print_report( reports )
+    if output:
+        f = open( output, 'w+' )
+        try:
+            json.dump( reports, f, indent=1 )
+        finally:
+            f.close()
+    return reports
+
+if __name__ == "__main__":
+    defaults = config_t()
+    parser = optparse.OptionParser()
+    parser.add_option( '--scales', default='1,2,4', help='comma separated scale factors' )
+    for name, value in sorted( vars( defaults ).items() ):
+        parser.add_option( '--' + name, type='int', default=value )
+    parser.add_option( '--output', help='the JSON report file name' )
+    parser.add_option( '--code-cache', action='store_true', default=False
+                       , help='measure the module writing with the code cache' )
+    options = parser.parse_args()[0]
+    base_config = config_t( options.namespaces, options.classes, options.methods
+                            , options.overloads, options.instantiations )
+    scales = [ int( factor ) for factor in options.scales.split( ',' ) ]
+    output = options.output and os.path.join( initial_working_directory, options.output )
+    run( base_config, scales, output, options.code_cache )
@@ -0,0 +1,58 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    CODE = """
+        namespace chunks{
+            struct x{
+                enum EColor{ red, blue };
+                x(){}
+                void do_nothing(){}
+                int do_something(){ return 1; }
+                int m_dummy;
+            };
+
+            struct y{
+                y( int ){}
+                void check_overload( int i=0, int j=1, int k=2 );
+            };
+
+            void do_smth( int i );
+        }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'chunks' ).include()
+        mb.build_code_creator( 'x_chunks' )
+        chunks = list( mb.code_creator.create_chunks() )
+        self.failUnless( 1 < len( chunks ) )
+        self.failUnless( ''.join( chunks ) == mb.code_creator.create() )
+
+        file_name = os.path.join( autoconfig.build_dir, 'x_chunks.cpp' )
+        mb.write_module( file_name )
+        f = open( file_name )
+        code = f.read()
+        f.close()
+        self.failUnless( ''.join( chunks ) in code )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
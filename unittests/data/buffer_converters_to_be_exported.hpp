@@ -0,0 +1,36 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __buffer_converters_to_be_exported_hpp__
+#define __buffer_converters_to_be_exported_hpp__
+
+#include <vector>
+#include "boost/array.hpp"
+
+namespace buffer_converters{
+
+inline double sum_doubles( const std::vector<double>& values ){
+    double result = 0;
+    for( std::vector<double>::const_iterator i = values.begin(); i != values.end(); ++i ){
+        result += *i;
+    }
+    return result;
+}
+
+inline int sum_ints( std::vector<int> values ){
+    int result = 0;
+    for( std::vector<int>::const_iterator i = values.begin(); i != values.end(); ++i ){
+        result += *i;
+    }
+    return result;
+}
+
+inline int sum_3_ints( const boost::array<int, 3>& values ){
+    return values[0] + values[1] + values[2];
+}
+
+}
+
+#endif//__buffer_converters_to_be_exported_hpp__
@@ -0,0 +1,94 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __call_overhead_benchmark_to_be_exported_hpp__
+#define __call_overhead_benchmark_to_be_exported_hpp__
+
+#include <vector>
+#include "boost/shared_ptr.hpp"
+
+namespace call_overhead{
+
+//plain free functions
+inline void do_nothing(){}
+
+inline int add( int a, int b ){
+    return a + b;
+}
+
+//virtual member functions, exposed through the wrapper class
+struct worker_t{
+    virtual ~worker_t(){}
+
+    virtual int run( int i ){
+        return i;
+    }
+};
+
+inline int call_run( worker_t& worker, int i ){
+    return worker.run( i );
+}
+
+//transformed functions
+inline void get_size( int& width, int& height ){
+    width = 1;
+    height = 2;
+}
+
+inline void increment( int& value ){
+    ++value;
+}
+
+inline int sum_3( int const values[3] ){
+    return values[0] + values[1] + values[2];
+}
+
+//indexing suite
+typedef std::vector< int > ints_t;
+
+inline ints_t make_ints( unsigned int size ){
+    return ints_t( size, 1 );
+}
+
+//smart pointer, used as held type
+struct shared_item_t{
+    shared_item_t() : value( 1 ){}
+
+    int get_value() const{
+        return value;
+    }
+
+    int value;
+};
+
+inline boost::shared_ptr< shared_item_t > create_shared_item(){
+    return boost::shared_ptr< shared_item_t >( new shared_item_t() );
+}
+
+inline int get_shared_value( const boost::shared_ptr< shared_item_t >& item ){
+    return item->value;
+}
+
+//properties and member variables
+struct point_t{
+    point_t() : x( 0 ), y( 0 ){}
+
+    int get_x() const{
+        return x;
+    }
+
+    void set_x( int new_x ){
+        x = new_x;
+    }
+
+    int y;
+
+private:
+    int x;
+};
+
+}
+
+#endif//__call_overhead_benchmark_to_be_exported_hpp__
@@ -0,0 +1,23 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __call_overhead_benchmark_v2_to_be_exported_hpp__
+#define __call_overhead_benchmark_v2_to_be_exported_hpp__
+
+#include <vector>
+
+namespace call_overhead_v2{
+
+//the same container as in call_overhead_benchmark module, exposed using
+//indexing suite v2
+typedef std::vector< int > ints_t;
+
+inline ints_t make_ints( unsigned int size ){
+    return ints_t( size, 1 );
+}
+
+}
+
+#endif//__call_overhead_benchmark_v2_to_be_exported_hpp__
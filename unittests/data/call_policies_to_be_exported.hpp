@@ -107,6 +107,14 @@ struct return_range_image_t{
         return &raw_data.at(0);
     }
 
+    const char* get_raw_buffer_const() const{
+        return raw_data.c_str();
+    }
+
+    char* get_raw_buffer(){
+        return &raw_data.at(0);
+    }
+
     return_range_image_t* create_images(){
         return_range_image_t* images = new return_range_image_t[3];
         return_range_image_t x;
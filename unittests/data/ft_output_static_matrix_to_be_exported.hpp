@@ -20,6 +20,10 @@ void filler( int m[2][3], int value ){
     }
 }
 
+void filler_buffer( int m[2][3], int value ){
+    filler( m, value );
+}
+
 }
 
 #endif//__ft_output_static_matrix_to_be_exported_hpp__
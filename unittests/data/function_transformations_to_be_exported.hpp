@@ -138,6 +138,13 @@ struct image_t{
       v[2] = 3;
     }
 
+    // A method with a output array of fixed size, exposed as memoryview
+    void fixed_output_buffer(double v[3]) {
+      v[0] = 0.5;
+      v[1] = 1.5;
+      v[2] = 2.5;
+    }
+
     unsigned int m_width;
     unsigned int m_height;
 
@@ -231,6 +238,73 @@ struct input_c_buffer_tester_t{
 
 };
 
+struct input_buffer_tester_t{
+    std::string write( const char* buffer, int dummy, int size ) const {
+        return std::string( buffer, size );
+    }
+
+    static double sum( const double* values, unsigned int count ){
+        double result = 0;
+        for( unsigned int i = 0; i < count; ++i ){
+            result += values[i];
+        }
+        return result;
+    }
+
+    static void fill( int* buffer, int size, int value ){
+        for( int i = 0; i < size; ++i ){
+            buffer[i] = value;
+        }
+    }
+};
+
+struct input_buffer_virtual_tester_t{
+    virtual ~input_buffer_virtual_tester_t(){}
+
+    virtual double sum( const double* values, unsigned int count ) const {
+        double result = 0;
+        for( unsigned int i = 0; i < count; ++i ){
+            result += values[i];
+        }
+        return result;
+    }
+
+    static double call_sum( const input_buffer_virtual_tester_t& tester ){
+        double values[] = { 1, 2, 3 };
+        return tester.sum( values, 3 );
+    }
+};
+
+struct gil_release_tester_t{
+    virtual ~gil_release_tester_t(){}
+
+    static int add( int x, int y ){
+        return x + y;
+    }
+
+    void divide( int x, int y, int& result ) const {
+        result = x / y;
+    }
+
+    virtual int compute( int x ) const {
+        return x * 2;
+    }
+
+    static int call_compute( const gil_release_tester_t& tester, int x ){
+        return tester.compute( x );
+    }
+};
+
+inline double distance_2d( double x, const double& y ){
+    return std::sqrt( x * x + y * y );
+}
+
+struct batch_tester_t{
+    static int scale( int value, short factor ){
+        return value * factor;
+    }
+};
+
 struct transfer_ownership_tester_t{
     struct resources_t{
         resources_t(){
@@ -73,6 +73,15 @@ inline void set_value( std::vector<item_t>& vec, unsigned int index, item_t valu
 typedef std::vector<float> fvector;
 fvector empty_fvector(){ return fvector(); }
 
+typedef std::vector<int> ivector;
+inline int sum_ivector( const ivector& values ){
+    int result = 0;
+    for( ivector::const_iterator it = values.begin(); it != values.end(); ++it ){
+        result += *it;
+    }
+    return result;
+}
+
 HASH_XXX_NS::hash_map< int, int > get_int_mapping(){
     HASH_XXX_NS::hash_map< int, int > x;
     x[ 1 ] = 1;
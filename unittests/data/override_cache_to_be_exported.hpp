@@ -0,0 +1,48 @@
+// Copyright 2004-2008 Roman Yakovenko.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#ifndef __override_cache_to_be_exported_hpp__
+#define __override_cache_to_be_exported_hpp__
+
+namespace override_cache{
+
+struct visitor_t{
+    visitor_t() : visited( 0 ){}
+
+    virtual ~visitor_t(){}
+
+    virtual int visit( int i ){
+        return i;
+    }
+
+    virtual void count(){
+        ++visited;
+    }
+
+    int visit_protected( int i ){
+        return visit_impl( i );
+    }
+
+    int visited;
+
+protected:
+
+    virtual int visit_impl( int i ){
+        return -i;
+    }
+};
+
+inline int visit_all( visitor_t& visitor, int size ){
+    int result = 0;
+    for( int i = 0; i < size; ++i ){
+        result += visitor.visit( i );
+        visitor.count();
+    }
+    return result;
+}
+
+}
+
+#endif//__override_cache_to_be_exported_hpp__
@@ -0,0 +1,63 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import messages
+from pyplusplus import creators_factory
+from pyplusplus import module_builder
+
+class tester_t( unittest.TestCase ):
+    CODE = """
+        namespace deps{
+            struct hidden_t{};
+
+            struct user_t{
+                hidden_t get_hidden();
+                void set_hidden( const hidden_t& );
+            };
+        }
+    """
+
+    def find_unexposed( self, mb ):
+        creator = creators_factory.bpcreator_t( mb.global_ns, 'deps', report_dependencies=False )
+        creator.create()
+        unexposed = set()
+        for dependency, depend_on_decls in creator.dependencies_manager.used_but_not_exported:
+            unexposed.update( depend_on_decls )
+        return unexposed
+
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'deps' ).include()
+        return mb
+
+    def test(self):
+        mb = self.create_module_builder()
+        hidden = mb.class_( 'hidden_t' )
+        hidden.exclude()
+        self.failUnless( hidden in self.find_unexposed( mb ) )
+        hidden.disable_warnings( messages.W1040 )
+        self.failUnless( not self.find_unexposed( mb ) )
+
+    def test_postponed_report(self):
+        mb = self.create_module_builder()
+        self.failUnlessRaises( RuntimeError, mb.report_dependencies )
+        mb.build_code_creator( 'deps', report_dependencies=False )
+        mb.report_dependencies()
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,72 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import module_builder
+
+class tester_t( unittest.TestCase ):
+    CODE = """
+        namespace derived{
+            struct base_t{
+                virtual int run(){ return 0; }
+            };
+
+            struct derived_t : base_t{
+                void do_nothing(){}
+            };
+        }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        derived = mb.class_( 'derived_t' )
+        self.failUnless( derived.redefined_funcs() is derived.redefined_funcs() )
+        self.failUnless( derived.is_wrapper_needed() )
+        members = derived.get_exportable_members()
+        self.failUnless( derived.mem_fun( 'do_nothing' ) in members )
+
+        derived.mem_fun( 'do_nothing' ).exclude()
+        self.failUnless( derived.mem_fun( 'do_nothing' ) not in derived.get_exportable_members() )
+
+        mb.class_( 'base_t' ).mem_fun( 'run' ).exclude()
+        self.failUnless( not derived.redefined_funcs() )
+        self.failUnless( not derived.is_wrapper_needed() )
+
+        derived.add_wrapper_code( '//wrapper code' )
+        self.failUnless( derived.is_wrapper_needed() )
+
+        #the list could be changed directly
+        del derived.wrapper_code[:]
+        self.failUnless( not derived.is_wrapper_needed() )
+        derived.wrapper_code.append( '//wrapper code' )
+        self.failUnless( derived.is_wrapper_needed() )
+
+    def test_sort(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        base = mb.class_( 'base_t' )
+        members = base.get_exportable_members()
+        derived_values_count = len( base._derived_values )
+        for i in range( 3 ):
+            #every call gets new sort function
+            self.failUnless( list( reversed( members ) )
+                             == base.get_exportable_members( lambda decls: list( reversed( decls ) ) ) )
+        self.failUnless( derived_values_count == len( base._derived_values ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
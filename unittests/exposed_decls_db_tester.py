@@ -90,6 +90,41 @@ class tester_t(unittest.TestCase):
         for x in ns_skip.decls(recursive=True):
             self.failUnless( db.is_exposed( x ) == False )
 
+        db.save( os.path.join( autoconfig.build_dir, 'exposed.db.bin.pypp' ), binary=True )
+
+        db3 = pypp_utils.exposed_decls_db_t()
+        db3.load( os.path.join( autoconfig.build_dir, 'exposed.db.bin.pypp' ) )
+        for x in ns.decls(recursive=True):
+            self.failUnless( db3.is_exposed( x ) == True )
+
+        for x in ns_skip.decls(recursive=True):
+            self.failUnless( db3.is_exposed( x ) == False )
+
+        #the binary file doesn't contain the rows of the text format
+        self.failUnlessRaises( RuntimeError, db3.save, os.path.join( autoconfig.build_dir, 'exposed.db.pypp' ) )
+        db3.save( os.path.join( autoconfig.build_dir, 'exposed.db.bin.pypp' ), binary=True )
+
+    def test_builder(self):
+        target_dir = os.path.join( autoconfig.build_dir, 'binary_exposed_decls_db' )
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , binary_exposed_decls_db=True )
+        mb.global_ns.exclude()
+        mb.namespace( 'ns' ).include()
+        mb.build_code_creator( 'x_binary_db' )
+        mb.write_module( os.path.join( target_dir, 'x_binary_db.cpp' ) )
+        f = open( os.path.join( target_dir, pypp_utils.exposed_decls_db_t.DEFAULT_FILE_NAME ), 'rb' )
+        data = f.read()
+        f.close()
+        self.failUnless( data.startswith( pypp_utils.exposed_decls_db_t.BINARY_MAGIC ) )
+
+        db = pypp_utils.exposed_decls_db_t()
+        db.load( target_dir )
+        self.failUnless( db.is_exposed( mb.class_( 'XXX' ) ) )
+        self.failUnless( not db.is_exposed( mb.class_( 'b123' ) ) )
+
 def create_suite():
     suite = unittest.TestSuite()
     suite.addTest( unittest.makeSuite(tester_t))
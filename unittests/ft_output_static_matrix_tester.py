@@ -27,6 +27,9 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         sum = mb.free_fun( 'filler' )
         sum.add_transformation( ft.output_static_matrix('m', rows=2, columns=3) )
 
+        filler_buffer = mb.free_fun( 'filler_buffer' )
+        filler_buffer.add_transformation( ft.output_static_matrix('m', rows=2, columns=3, as_buffer=True) )
+
         
         #calculate = mb.mem_fun( 'calculate' )
         #calculate.add_transformation( ft.input_static_matrix('m', rows=3, columns=5) )
@@ -34,6 +37,10 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
     def run_tests(self, module):
         """Run the actual unit tests"""
         self.failUnless( [[23,23,23],[23,23,23]] == module.filler( 23 ) )
+        m = module.filler_buffer( 23 )
+        self.failUnless( ( 2, 3 ) == m.shape )
+        self.failUnless( not m.readonly )
+        self.failUnless( [[23,23,23],[23,23,23]] == m.tolist() )
 
 def create_suite():
     suite = unittest.TestSuite()
@@ -6,6 +6,7 @@
 import os
 import sys
 import math
+import array
 import unittest
 import fundamental_tester_base
 from pygccxml import declarations
@@ -67,6 +68,7 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         image.member_function( "input_arg" ).add_transformation( ft.input(0) )
         image.member_function( "fixed_input_array" ).add_transformation( ft.input_static_array(0,3) )
         image.member_function( "fixed_output_array" ).add_transformation( ft.output_static_array(0,3) )
+        image.member_function( "fixed_output_buffer" ).add_transformation( ft.output_static_array(0,3,as_buffer=True) )
         mb.free_function("get_cpp_instance").call_policies \
             = call_policies.return_value_policy(call_policies.reference_existing_object)
         mb.variable( "cpp_instance" ).exclude()
@@ -95,7 +97,22 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         write_mf.add_transformation( ft.input_c_buffer( 'buffer', 'size' ) )
         write_s = cls.mem_fun( 'write_s' )
         write_s.add_transformation( ft.input_c_buffer( 'buffer', 'size' ) )
+
+        cls = mb.class_( 'input_buffer_tester_t')
+        cls.mem_fun( 'write' ).add_transformation( ft.input_buffer( 'buffer', 'size' ) )
+        cls.mem_fun( 'sum' ).add_transformation( ft.input_buffer( 'values', 'count' ) )
+        cls.mem_fun( 'fill' ).add_transformation( ft.input_buffer( 'buffer', 'size' ) )
+
+        cls = mb.class_( 'input_buffer_virtual_tester_t')
+        cls.mem_fun( 'sum' ).add_transformation( ft.input_buffer( 'values', 'count' ) )
         
+        cls = mb.class_( 'gil_release_tester_t' )
+        cls.mem_fun( 'divide' ).add_transformation( ft.output( 'result' ) )
+        cls.calldefs().release_gil = True
+
+        mb.free_fun( 'distance_2d' ).add_batch_entry_point()
+        mb.class_( 'batch_tester_t' ).mem_fun( 'scale' ).add_batch_entry_point( alias='scale_all' )
+
         resource = mb.class_( 'resources_t' )
         resource.held_type = 'std::auto_ptr< %s >' % resource.decl_string
         transfer_ownership_tester = mb.class_( 'transfer_ownership_tester_t' )
@@ -180,6 +197,14 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         # Check the fixed_output_array method
         self.assertEqual(img.fixed_output_array(), [1,2,3])
 
+        # Check the fixed_output_buffer method
+        buffer = img.fixed_output_buffer()
+        self.failUnless( isinstance( buffer, memoryview ) )
+        self.assertEqual(buffer.format, 'd')
+        self.assertEqual(buffer.tolist(), [0.5,1.5,2.5])
+        buffer[0] = 3.5
+        self.assertEqual(buffer[0], 3.5)
+
         self.assertEqual(module.ft_private_destructor_t.get_value(), 21)
 
         ####### Do the tests on a class derived in Python ########
@@ -279,6 +304,51 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         self.failUnless( 'hello world' == tmp.write( list( hw ), dummy ) )
         self.failUnless( 'hello world' == tmp.write_s( dummy, tuple( list( hw ) ) ) )
 
+        tmp = module.input_buffer_tester_t()
+        self.failUnless( 'hello world' == tmp.write( b'hello world', dummy ) )
+        self.failUnless( 'hello' == tmp.write( memoryview( bytearray( b'hello world' ) )[:5], dummy ) )
+        self.failUnless( 6.0 == module.input_buffer_tester_t.sum( array.array( 'd', [1,2,3] ) ) )
+        self.failUnlessRaises( TypeError, module.input_buffer_tester_t.sum, array.array( 'i', [1,2,3] ) )
+        self.failUnlessRaises( TypeError, module.input_buffer_tester_t.sum, [1.0,2.0,3.0] )
+        ints = array.array( 'i', [0] * 5 )
+        module.input_buffer_tester_t.fill( ints, 7 )
+        self.failUnless( [7] * 5 == list( ints ) )
+        self.failUnlessRaises( BufferError, module.input_buffer_tester_t.fill, bytes( 20 ), 7 )
+
+        tmp = module.input_buffer_virtual_tester_t()
+        self.failUnless( 6.0 == tmp.sum( array.array( 'd', [1,2,3] ) ) )
+        self.failUnless( 6.0 == module.input_buffer_virtual_tester_t.call_sum( tmp ) )
+        class py_sum_tester_t( module.input_buffer_virtual_tester_t ):
+            def __init__( self ):
+                module.input_buffer_virtual_tester_t.__init__( self )
+                self.values = None
+
+            def sum( self, values ):
+                self.values = values
+                return 10.0 * len( values ) + values[0]
+        tmp = py_sum_tester_t()
+        self.failUnless( 31.0 == module.input_buffer_virtual_tester_t.call_sum( tmp ) )
+        #the memoryview is released, when the override returns
+        self.failUnlessRaises( ValueError, len, tmp.values )
+
+        self.failUnless( 5 == module.gil_release_tester_t.add( 2, 3 ) )
+        tmp = module.gil_release_tester_t()
+        self.failUnless( 3 == tmp.divide( 7, 2 ) )
+        self.failUnless( 8 == module.gil_release_tester_t.call_compute( tmp, 4 ) )
+        class py_tester_t( module.gil_release_tester_t ):
+            def compute( self, x ):
+                return x * 3
+        self.failUnless( 12 == module.gil_release_tester_t.call_compute( py_tester_t(), 4 ) )
+
+        self.failUnless( 5.0 == module.distance_2d( 3.0, 4.0 ) )
+        distances = module.distance_2d_batch( array.array( 'd', [3,6] ), array.array( 'd', [4,8] ) )
+        self.failUnless( isinstance( distances, memoryview ) and [5.0, 10.0] == distances.tolist() )
+        self.failUnlessRaises( ValueError, module.distance_2d_batch, array.array( 'd', [3] ), array.array( 'd', [4,8] ) )
+        self.failUnlessRaises( TypeError, module.distance_2d_batch, array.array( 'f', [3] ), array.array( 'd', [4] ) )
+        scaled = module.batch_tester_t.scale_all( array.array( 'i', [1,2,3] ), array.array( 'h', [2,2,2] ) )
+        self.failUnless( [2,4,6] == scaled.tolist() )
+        self.failUnless( 6 == module.batch_tester_t.scale( 2, 3 ) )
+
         tmp = module.transfer_ownership_tester_t()
         resource = tmp.resources_t();
         tmp.tester( resource )
@@ -5,6 +5,7 @@
 
 import os
 import sys
+import array
 import unittest
 import fundamental_tester_base
 from pygccxml import declarations
@@ -89,6 +90,18 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
         except TypeError:
             pass
 
+        ivector = module.ivector()
+        ivector.extend( array.array( 'i', range( 5 ) ) )
+        self.failUnless( [0,1,2,3,4] == ivector[:] )
+        ivector[1:3] = ( 7, 8, 9 )
+        self.failUnless( [0,7,8,9,3,4] == ivector[:] )
+        ivector[:] = [ 1 ] * 1000
+        self.failUnless( 1000 == module.sum_ivector( ivector ) )
+        ivector[::2] = array.array( 'i', [ 0 ] * 500 )
+        self.failUnless( 500 == module.sum_ivector( ivector ) )
+        self.failUnlessRaises( TypeError, ivector.extend, [ 1, 'x' ] )
+        self.failUnless( 1000 == len( ivector ) )
+
         protected_items = module.create_protected_items()
         values = [protected_item.value for protected_item in protected_items];
         values.sort()
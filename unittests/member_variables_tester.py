@@ -111,6 +111,14 @@ class tester_t(fundamental_tester_base.fundamental_tester_base_t):
             array.ivars[index] = index * index
             self.failUnless( array.get_ivars_item( index ) == index * index )
 
+        array = module.array_t()
+        ivars = memoryview( array.ivars )
+        self.failUnless( 10 == len( ivars ) and 'i' == ivars.format and not ivars.readonly )
+        self.failUnless( [ -index for index in range( 10 ) ] == ivars.tolist() )
+        ivars[3] = 33
+        self.failUnless( 33 == array.get_ivars_item( 3 ) )
+        self.failUnlessRaises( TypeError, memoryview, module.array_t.vars )
+
         #~ import pdb
         #~ pdb.set_trace()
 
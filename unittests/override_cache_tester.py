@@ -0,0 +1,61 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import fundamental_tester_base
+
+class tester_t(fundamental_tester_base.fundamental_tester_base_t):
+    EXTENSION_NAME = 'override_cache'
+
+    def __init__( self, *args ):
+        fundamental_tester_base.fundamental_tester_base_t.__init__(
+            self
+            , tester_t.EXTENSION_NAME
+            , *args )
+
+    def customize(self, mb ):
+        mb.class_( 'visitor_t' ).mem_funs().cache_override = True
+
+    def run_tests(self, module):
+        class not_overridden_t( module.visitor_t ):
+            pass
+
+        class overridden_t( module.visitor_t ):
+            def visit( self, i ):
+                return 2 * i
+            def visit_impl( self, i ):
+                return 3 * i
+
+        visitor = module.visitor_t()
+        self.failUnless( 6 == module.visit_all( visitor, 4 ) )
+        self.failUnless( 4 == visitor.visited )
+        self.failUnless( -2 == visitor.visit_protected( 2 ) )
+
+        not_overridden = not_overridden_t()
+        self.failUnless( 6 == module.visit_all( not_overridden, 4 ) )
+        self.failUnless( -2 == not_overridden.visit_protected( 2 ) )
+
+        overridden = overridden_t()
+        self.failUnless( 12 == module.visit_all( overridden, 4 ) )
+        self.failUnless( 6 == overridden.visit_protected( 2 ) )
+
+        #the cache is invalidated, when the class is changed
+        not_overridden_t.visit = lambda self, i: 10
+        self.failUnless( 40 == module.visit_all( not_overridden, 4 ) )
+        del not_overridden_t.visit
+        self.failUnless( 6 == module.visit_all( not_overridden, 4 ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
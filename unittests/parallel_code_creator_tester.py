@@ -0,0 +1,98 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import logging
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import _logging_
+from pyplusplus import module_builder
+from pyplusplus import function_transformers as ft
+from pygccxml import declarations
+
+class messages_collector_t( logging.Handler ):
+    def __init__( self ):
+        logging.Handler.__init__( self )
+        self.messages = []
+
+    def emit( self, record ):
+        self.messages.append( record.getMessage() )
+
+class tester_t(unittest.TestCase):
+    CODE = """
+        namespace parallel_creator{
+            struct x{
+                enum EColor{ red, blue };
+                x(){}
+                x( int ){}
+                void check_overload( int i=0, int j=1, int k=2 );
+                float* get_rate(){ return 0; }
+                virtual void get_size( int& i, int& j ){ i = 0; j = 0; }
+                struct x_nested{};
+                int m_dummy;
+            };
+
+            struct y : x{
+                int do_something(){ return 1; }
+            };
+
+            struct z{
+                z( const x& ){}
+                x* get_x();
+            };
+
+            void check_overload( int i=0, int j=1 );
+        }
+    """
+
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'parallel_creator' ).include()
+        return mb
+
+    def generate_code( self, processes ):
+        mb = self.create_module_builder()
+        mb.mem_fun( 'get_rate' ).call_policies \
+            = module_builder.call_policies.return_value_policy( module_builder.call_policies.return_pointee_value )
+        mb.mem_fun( 'get_x' ).call_policies \
+            = module_builder.call_policies.return_value_policy( module_builder.call_policies.reference_existing_object )
+        mb.mem_fun( 'get_size' ).add_transformation( ft.output(0) )
+        mb.build_code_creator( 'x_parallel_creator', processes=processes )
+        return mb.code_creator.create()
+
+    def collect_messages( self, processes ):
+        #the functions, which return pointers, have no call policies, so there are warnings
+        mb = self.create_module_builder()
+        collector = messages_collector_t()
+        logger = _logging_.loggers.declarations
+        logger.addHandler( collector )
+        try:
+            mb.build_code_creator( 'x_parallel_creator', processes=processes )
+        finally:
+            logger.removeHandler( collector )
+        readme = [ ( str( decl ), decl.readme() )
+                   for decl in declarations.make_flatten( mb.namespace( name='::parallel_creator' ) ) ]
+        return readme, collector.messages
+
+    def test(self):
+        self.failUnless( self.generate_code( None ) == self.generate_code( 2 ) )
+
+    def test_messages(self):
+        readme, messages = self.collect_messages( None )
+        self.failUnless( messages )
+        self.failUnless( ( readme, messages ) == self.collect_messages( 2 ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,105 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import logging
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import _logging_
+from pyplusplus import module_builder
+from pyplusplus import function_transformers as ft
+
+class tester_t(unittest.TestCase):
+    CODE = """
+        namespace parallel{
+            struct x{
+                enum EColor{ red, blue };
+                x(){}
+                x( int ){}
+                void check_overload( int i=0, int j=1, int k=2 );
+                float* get_rate(){ return 0; }
+                virtual void get_size( int& i, int& j ){ i = 0; j = 0; }
+                struct x_nested{};
+                int m_dummy;
+            };
+
+            struct y : x{
+                int do_something(){ return 1; }
+            };
+
+            struct z{
+                z( const x& ){}
+                void do_nothing(){}
+            };
+
+            void check_overload( int i=0, int j=1 );
+        }
+    """
+
+    def create_module_builder( self ):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'parallel' ).include()
+        mb.mem_fun( 'get_rate' ).call_policies \
+            = module_builder.call_policies.return_value_policy( module_builder.call_policies.return_pointee_value )
+        mb.mem_fun( 'get_size' ).add_transformation( ft.output(0) )
+        mb.build_code_creator('x_parallel')
+        return mb
+
+    def read_files( self, files ):
+        answer = {}
+        for fpath in files:
+            f = open( fpath )
+            answer[ os.path.basename( fpath ) ] = f.read()
+            f.close()
+        return answer
+
+    def test(self):
+        sequential_dir = os.path.join( autoconfig.build_dir, 'x_parallel_sequential' )
+        parallel_dir = os.path.join( autoconfig.build_dir, 'x_parallel' )
+
+        mb = self.create_module_builder()
+        sequential = mb.split_module( sequential_dir, on_unused_file_found=lambda fpath: fpath )
+        mb = self.create_module_builder()
+        parallel = mb.split_module( parallel_dir, on_unused_file_found=lambda fpath: fpath, processes=2 )
+
+        self.failUnless( self.read_files( sequential ) == self.read_files( parallel ) )
+
+    def write_with_error( self, processes ):
+        target_dir = os.path.join( autoconfig.build_dir, 'x_parallel_error_%s' % processes )
+        blocker = os.path.join( target_dir, 'z.pypp.cpp' )
+        if not os.path.exists( blocker ):
+            #the file could not be written: there is directory with the same name
+            os.makedirs( blocker )
+        messages = []
+        handler = logging.Handler()
+        handler.emit = lambda record: messages.append( record.getMessage() )
+        logger = _logging_.loggers.file_writer
+        logger.addHandler( handler )
+        try:
+            mb = self.create_module_builder()
+            self.failUnlessRaises( IOError, mb.split_module, target_dir, processes=processes )
+        finally:
+            logger.removeHandler( handler )
+        return [ msg.replace( target_dir, '' ) for msg in messages if msg.startswith( 'Failed to write' ) ]
+
+    def test_write_error(self):
+        messages = self.write_with_error( None )
+        self.failUnless( 1 == len( messages ) and '"z"' in messages[0] )
+        self.failUnless( messages == self.write_with_error( 2 ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
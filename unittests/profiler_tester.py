@@ -0,0 +1,66 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import json
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import module_builder
+from pyplusplus import utils as pypp_utils
+
+class tester_t(unittest.TestCase):
+    CODE = """
+        namespace profiler{
+            struct x{
+                x(){}
+                int get() const{ return 1; }
+                void set( int i );
+            };
+
+            void do_smth( const x& value );
+        }
+    """
+
+    def test(self):
+        profiler = pypp_utils.phase_profiler_t( trace_memory=True )
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , profiler=profiler )
+        mb.namespace( 'profiler' ).include()
+        mb.build_code_creator( 'x_profiler' )
+        mb.write_module( os.path.join( autoconfig.build_dir, 'x_profiler.cpp' ) )
+        phases = dict( ( p['name'], p ) for p in profiler.phases )
+        for name in ( 'parse', 'apply_decls_defaults', 'build_code_creator'
+                      , 'build_code_creator/visit declarations'
+                      , 'build_code_creator/treat smart pointers'
+                      , 'build_code_creator/report dependencies'
+                      , 'write_module', 'write_module/write files' ):
+            self.failUnless( name in phases, name )
+            self.failUnless( 1 <= phases[name]['calls'] )
+            self.failUnless( 0 <= phases[name]['wall_time'] )
+            self.failUnless( phases[name]['peak_memory'] )
+        self.failUnless( 'write files' not in phases )
+        self.failUnless( profiler.report()[ 'rendering' ][ 'classes' ] )
+
+        report_file = os.path.join( autoconfig.build_dir, 'x_profiler.json' )
+        profiler.save( report_file )
+        f = open( report_file )
+        report = json.load( f )
+        f.close()
+        self.failUnless( report == json.loads( json.dumps( profiler.report() ) ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
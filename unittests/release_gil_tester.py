@@ -0,0 +1,55 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import sys
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    CODE = """
+    namespace gil{
+        struct worker_t{
+            int run( int i ){ return i; }
+        };
+
+        int compute( int i ){ return i; }
+    }
+    """
+
+    def create_code( self, mb ):
+        mb.build_code_creator( 'release_gil' )
+        return mb.code_creator.create()
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'gil' ).include()
+        not_released = self.create_code( mb )
+        self.failUnless( 'gil_release_t' not in not_released )
+
+        mb.calldefs( lambda decl: decl.name in ( 'run', 'compute' ) ).release_gil = True
+        self.failUnless( 2 == self.create_code( mb ).count( 'gil_release_t pypp_gil_release' ) )
+        self.failUnless( 2 == self.create_code( mb ).count( 'gil_release_t pypp_gil_release' ) )
+        self.failUnless( not mb.mem_fun( 'run' ).transformations )
+        self.failUnless( not mb.free_fun( 'compute' ).transformations )
+
+        mb.calldefs( lambda decl: decl.name in ( 'run', 'compute' ) ).release_gil = False
+        self.failUnless( not_released == self.create_code( mb ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,74 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import code_creators
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    CODE = """
+        namespace render_statistics{
+            struct x{
+                enum EColor{ red, blue };
+                x(){}
+                void do_nothing(){}
+                int do_something( int i ){ return i; }
+                int m_dummy;
+            };
+
+            void do_smth( const x& value );
+        }
+    """
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'render_statistics' ).include()
+        mb.build_code_creator( 'x_render_statistics' )
+        code = mb.code_creator.create()
+        statistics = code_creators.render_statistics_t( top_n=3 )
+        mb.code_creator.render_statistics = statistics
+        self.failUnless( code == mb.code_creator.create() )
+        classes = dict( ( s['name'], s ) for s in statistics.classes )
+        self.failUnless( 1 == classes[ 'bpmodule_t' ]['calls'] )
+        self.failUnless( len( code ) == classes[ 'bpmodule_t' ]['output_chars'] )
+        self.failUnless( 1 == classes[ 'module_body_t' ]['calls'] )
+        self.failUnless( 'class_t' in classes )
+        for s in classes.values():
+            self.failUnless( s['self_time'] <= s['total_time'] )
+        slowest = statistics.slowest()
+        self.failUnless( 3 == len( slowest ) )
+        self.failUnless( slowest[0]['self_time'] >= slowest[-1]['self_time'] )
+
+        merged = code_creators.render_statistics_t()
+        merged.merge( statistics.report() )
+        merged.merge( statistics.report() )
+        merged_classes = dict( ( s['name'], s ) for s in merged.classes )
+        self.failUnless( 2 == merged_classes[ 'bpmodule_t' ]['calls'] )
+
+        #the streaming write path records the module and its body too
+        statistics.clear()
+        self.failUnless( code == ''.join( mb.code_creator.create_chunks() ) )
+        classes = dict( ( s['name'], s ) for s in statistics.classes )
+        self.failUnless( 1 == classes[ 'bpmodule_t' ]['calls'] )
+        self.failUnless( len( code ) == classes[ 'bpmodule_t' ]['output_chars'] )
+        self.failUnless( 1 == classes[ 'module_body_t' ]['calls'] )
+        self.failUnless( 'class_t' in classes )
+        for s in classes.values():
+            self.failUnless( s['self_time'] <= s['total_time'] )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -0,0 +1,37 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import os
+import unittest
+import autoconfig
+import pygccxml
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    def test(self):
+        cache_dir = os.path.join( autoconfig.build_dir, 'shared_parse_cache' )
+        header = os.path.join( autoconfig.data_directory, 'free_functions_to_be_exported.hpp' )
+        create_mb = lambda **keywd: module_builder.module_builder_t(
+                [ header ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , **keywd )
+        parsed = create_mb( shared_parse_cache=cache_dir )
+        cache = module_builder.shared_parse_cache_t( cache_dir )
+        cached = create_mb( cache=cache )
+        self.failUnless( cache.hits )
+        self.failUnless( 0 == cache.misses )
+        self.failUnless( str( parsed.free_fun( 'plus' ) ) == str( cached.free_fun( 'plus' ) ) )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()
@@ -130,6 +130,19 @@ import ft_inout_static_matrix_tester
 import ft_inout_static_array_tester
 import inner_base_class_tester
 import indexing_suite2_shared_ptr_value_traits_tester
+import buffer_converters_tester
+import override_cache_tester
+import release_gil_tester
+import parallel_split_module_tester
+import code_cache_tester
+import parallel_code_creator_tester
+import type_traits_cache_tester
+import derived_values_cache_tester
+import dependencies_report_tester
+import create_chunks_tester
+import profiler_tester
+import render_statistics_tester
+import shared_parse_cache_tester
 
 testers = [
     algorithms_tester
@@ -245,6 +258,19 @@ testers = [
     , ft_inout_static_matrix_tester
     , ft_inout_static_array_tester
     , inner_base_class_tester
+    , buffer_converters_tester
+    , override_cache_tester
+    , release_gil_tester
+    , parallel_split_module_tester
+    , code_cache_tester
+    , parallel_code_creator_tester
+    , type_traits_cache_tester
+    , derived_values_cache_tester
+    , dependencies_report_tester
+    , create_chunks_tester
+    , profiler_tester
+    , render_statistics_tester
+    , shared_parse_cache_tester
 #    , indexing_suite2_shared_ptr_value_traits_tester
 #    , ogre_generate_tester too much time
 ]
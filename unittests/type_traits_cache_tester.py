@@ -0,0 +1,67 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+import unittest
+import autoconfig
+import pygccxml
+from pygccxml import declarations
+from pyplusplus import creators_factory
+from pyplusplus import module_builder
+
+class tester_t(unittest.TestCase):
+    CODE = """
+        namespace type_traits_cache{
+            typedef int value_type;
+
+            struct base_t{
+                virtual ~base_t(){}
+                virtual value_type get() const{ return 0; }
+            };
+
+            struct derived_t : base_t{
+                derived_t(){}
+                virtual value_type get() const{ return 1; }
+                void set( const value_type& value, value_type* previous );
+                void assign( const derived_t& other );
+            };
+
+            value_type sum( const base_t& b, value_type x=1 );
+        }
+    """
+
+    def test_memoisation(self):
+        is_pointer = declarations.is_pointer
+        int_ptr = declarations.pointer_t( declarations.int_t() )
+        cache = creators_factory.type_traits_cache_t()
+        self.failUnless( cache.is_pointer( int_ptr ) )
+        self.failUnless( cache.is_pointer( int_ptr ) )
+        self.failUnless( 1 == cache.hits and 1 == cache.misses )
+        self.failUnless( declarations.is_pointer is is_pointer )
+        cache.clear()
+        self.failUnless( cache.is_pointer( int_ptr ) )
+        self.failUnless( 2 == cache.misses )
+
+    def test(self):
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( self.CODE ) ]
+                , gccxml_path=autoconfig.gccxml.executable, compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'type_traits_cache' ).include()
+        mb.build_code_creator( 'x_tt_cache' )
+        cached_code = mb.code_creator.create()
+        self.failUnless( mb.type_traits_cache.hits )
+        mb.type_traits_cache = None
+        mb.build_code_creator( 'x_tt_cache' )
+        self.failUnless( cached_code == mb.code_creator.create() )
+
+def create_suite():
+    suite = unittest.TestSuite()
+    suite.addTest( unittest.makeSuite(tester_t))
+    return suite
+
+def run_suite():
+    unittest.TextTestRunner(verbosity=2).run( create_suite() )
+
+if __name__ == "__main__":
+    run_suite()